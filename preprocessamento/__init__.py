@@ -1,6 +1,14 @@
-from .inputs import PreparedInput, resolve_input_paths
+from .inputs import PreparedInput, central_directory_crc, resolve_input_paths
 from .documents import (
+    LazyDocument,
+    gather_documents,
     gather_texts,
+    read_member_pages,
+    read_member_text,
+    set_pdf_backend,
+    available_pdf_backends,
+    configure_bucket_backends,
+    configure_page_split,
     html_to_text,
     pdf_to_text,
     split_combined_pdf,
@@ -10,7 +18,16 @@ from .documents import (
 __all__ = [
     'PreparedInput',
     'resolve_input_paths',
+    'central_directory_crc',
+    'LazyDocument',
+    'gather_documents',
     'gather_texts',
+    'read_member_pages',
+    'read_member_text',
+    'set_pdf_backend',
+    'available_pdf_backends',
+    'configure_bucket_backends',
+    'configure_page_split',
     'html_to_text',
     'pdf_to_text',
     'split_combined_pdf',
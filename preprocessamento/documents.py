@@ -1,26 +1,418 @@
 from __future__ import annotations
 
+import importlib.util
 import io
+import multiprocessing
+import multiprocessing.util
+import os
 import re
+import tempfile
 import zipfile
+import zlib
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import List, Sequence, Tuple
+from typing import Callable, List, Sequence, Tuple
 
 import pdfplumber
-from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
+from bs4.dammit import EntitySubstitution, UnicodeDammit
+from pdfminer.converter import PDFLayoutAnalyzer
+from pdfminer.layout import LTChar, LTPage
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
 
 from seiautomation.offline.doc_classifier import DocumentBucket, classify_document
 
+from .text_cache import cache_key, get_text_cache
+
+
+# Texto de script/style/template/rt/rp não entra no get_text do BeautifulSoup.
+_HTML_STRING_CONTAINERS = frozenset(HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS)
+_HTML_VOID_ELEMENTS = frozenset(HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS)
+_HTML_ENTITIES = EntitySubstitution.HTML_ENTITY_TO_CHARACTER
+
+
+def _numeric_reference(value: int) -> str:
+    if value == 0 or value > 0x10FFFF or 0xD800 <= value <= 0xDFFF:
+        return "\ufffd"
+    if 0x80 <= value <= 0x9F:
+        try:
+            return bytes([value]).decode("cp1252")
+        except UnicodeDecodeError:
+            pass
+    return chr(value)
+
+
+class _HtmlTextCollector(HTMLParser):
+    """Coleta os trechos de texto do HTML por eventos, sem montar a árvore.
+
+    Reproduz ``BeautifulSoup(raw, "html.parser").get_text("\\n", strip=True)``:
+    cada tag/comentário fecha o trecho corrente, tags vazias (br, img...) não
+    entram na pilha e um ``</br>`` redundante não separa o texto.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self.parts: List[str] = []
+        self._buffer: List[str] = []
+        self._open: List[str] = []
+        self._containers = 0
+        self._closed_void: List[str] = []
+
+    def _flush(self) -> None:
+        if self._buffer:
+            if not self._containers:
+                text = "".join(self._buffer).strip()
+                if text:
+                    self.parts.append(text)
+            self._buffer = []
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        self._flush()
+        if tag in _HTML_VOID_ELEMENTS:
+            self._closed_void.append(tag)
+            return
+        self._open.append(tag)
+        if tag in _HTML_STRING_CONTAINERS:
+            self._containers += 1
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        self._flush()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._closed_void:
+            self._closed_void.remove(tag)
+            return
+        self._flush()
+        if tag in self._open:
+            while True:
+                name = self._open.pop()
+                if name in _HTML_STRING_CONTAINERS:
+                    self._containers -= 1
+                if name == tag:
+                    break
+
+    def handle_data(self, data: str) -> None:
+        self._buffer.append(data)
+
+    def handle_charref(self, name: str) -> None:
+        try:
+            value = int(name[1:], 16) if name[:1] in ("x", "X") else int(name)
+        except ValueError:
+            self._buffer.append(name)
+            return
+        self._buffer.append(_numeric_reference(value))
+
+    def handle_entityref(self, name: str) -> None:
+        self._buffer.append(_HTML_ENTITIES.get(name) or f"&{name}")
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush()
+        if data.upper().startswith("CDATA["):  # CData entra no get_text, mesmo dentro de script/style
+            text = data[len("CDATA[") :].strip()
+            if text:
+                self.parts.append(text)
+
+    def handle_pi(self, data: str) -> None:
+        self._flush()
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
 
 def html_to_text(raw: bytes) -> str:
-    soup = BeautifulSoup(raw, "html.parser")
-    return soup.get_text("\n", strip=True)
+    # mesma detecção de encoding do BeautifulSoup (BOM, <meta charset>, utf-8, windows-1252)
+    markup = UnicodeDammit(raw, is_html=True).unicode_markup or ""
+    collector = _HtmlTextCollector()
+    collector.feed(markup)
+    collector.close()
+    return "\n".join(collector.parts)
+
+
+# Conversores de PDF -> texto por página:
+#   pdfplumber  análise de layout completa (default, o mais preciso e o mais lento)
+#   pdfminer    pdfminer.six sem LAParams; quebra linhas só pela mudança de baseline
+#   pypdf2      PyPDF2 (opcional)
+#   pdfium      pypdfium2 (dependência do pdfplumber); também é o modo degradado da quarentena
+PDF_BACKENDS = ("pdfplumber", "pdfminer", "pypdf2", "pdfium")
+DEFAULT_PDF_BACKEND = "pdfplumber"
+_BACKEND_MODULES = {"pdfplumber": "pdfplumber", "pdfminer": "pdfminer", "pypdf2": "PyPDF2", "pdfium": "pypdfium2"}
+_PDF_BACKEND = os.getenv("SEI_PDF_BACKEND", DEFAULT_PDF_BACKEND)
+if _PDF_BACKEND not in PDF_BACKENDS:
+    _PDF_BACKEND = DEFAULT_PDF_BACKEND
+_BUCKET_BACKENDS: tuple[str, dict[str, str]] = ("", {})
+
+
+def available_pdf_backends() -> List[str]:
+    """Backends cujas bibliotecas estão instaladas."""
+    return [name for name in PDF_BACKENDS if importlib.util.find_spec(_BACKEND_MODULES[name]) is not None]
+
+
+def set_pdf_backend(name: str) -> str:
+    """Troca o conversor de PDF do processo e devolve o anterior.
+
+    Um backend diferente do default vale para todos os buckets (ignora
+    ``configure_bucket_backends``); é assim que a quarentena força o pdfium.
+    """
+    global _PDF_BACKEND
+    if name not in PDF_BACKENDS:
+        raise ValueError(f"Backend de PDF desconhecido: {name}")
+    previous, _PDF_BACKEND = _PDF_BACKEND, name
+    return previous
+
+
+def _parse_bucket_backends(spec: str) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        bucket, _, backend = item.partition("=")
+        bucket, backend = bucket.strip().lower(), backend.strip().lower()
+        if bucket not in {b.value for b in DocumentBucket}:
+            raise ValueError(f"Bucket desconhecido: {bucket}")
+        if backend not in PDF_BACKENDS:
+            raise ValueError(f"Backend de PDF desconhecido: {backend}")
+        mapping[bucket] = backend
+    return mapping
+
+
+def configure_bucket_backends(spec: str) -> dict[str, str]:
+    """Define o backend por bucket (ex.: ``"laudo=pdfium,outro=pdfminer"``). Propaga via ambiente.
+
+    Só os PDFs avulsos de ZIPs com vários membros usam o mapa: o bucket sai da
+    primeira página (backend do processo) e o texto completo, do backend do bucket.
+    """
+    mapping = _parse_bucket_backends(spec)
+    missing = sorted(set(mapping.values()) - set(available_pdf_backends()))
+    if missing:
+        raise ValueError(f"Backend de PDF não instalado: {', '.join(missing)}")
+    os.environ["SEI_PDF_BUCKET_BACKENDS"] = ",".join(f"{bucket}={backend}" for bucket, backend in sorted(mapping.items()))
+    return mapping
+
+
+def _bucket_backends() -> dict[str, str]:
+    global _BUCKET_BACKENDS
+    spec = os.getenv("SEI_PDF_BUCKET_BACKENDS", "")
+    if spec != _BUCKET_BACKENDS[0]:
+        try:
+            _BUCKET_BACKENDS = (spec, _parse_bucket_backends(spec))
+        except ValueError:
+            _BUCKET_BACKENDS = (spec, {})
+    return _BUCKET_BACKENDS[1]
+
+
+def _backend_for(bucket: DocumentBucket | None) -> str:
+    if bucket is None or _PDF_BACKEND != DEFAULT_PDF_BACKEND:
+        return _PDF_BACKEND
+    return _bucket_backends().get(bucket.value, _PDF_BACKEND)
+
+
+def _cache_kind(kind: str, backend: str | None = None) -> str:
+    # textos de backends diferentes não se misturam no cache
+    backend = backend or _PDF_BACKEND
+    if kind == "pdf" and backend != DEFAULT_PDF_BACKEND:
+        return f"pdf:{backend}"
+    return kind
 
 
-def _extract_pdf_pages(raw: bytes) -> List[str]:
+def _pdfplumber_pages(raw: bytes, limit: int | None = None) -> List[str]:
     with pdfplumber.open(io.BytesIO(raw)) as pdf:
-        return [page.extract_text() or "" for page in pdf.pages]
+        pages = pdf.pages if limit is None else pdf.pages[:limit]
+        return [page.extract_text() or "" for page in pages]
+
+
+class _BaselineTextDevice(PDFLayoutAnalyzer):
+    """Device do pdfminer sem LAParams: junta os caracteres e quebra a linha quando a baseline muda."""
+
+    def __init__(self, rsrcmgr: PDFResourceManager) -> None:
+        super().__init__(rsrcmgr, laparams=None)
+        self.pages: List[str] = []
+
+    def receive_layout(self, ltpage: LTPage) -> None:
+        lines: List[str] = []
+        current: List[str] = []
+        baseline: float | None = None
+        right = 0.0
+        for item in ltpage:
+            if not isinstance(item, LTChar):
+                continue
+            if baseline is not None and abs(item.y0 - baseline) > item.size * 0.5:
+                lines.append("".join(current).strip())
+                current = []
+            elif current and item.x0 - right > item.size * 0.25 and current[-1] != " ":
+                current.append(" ")
+            current.append(item.get_text())
+            baseline, right = item.y0, item.x1
+        if current:
+            lines.append("".join(current).strip())
+        self.pages.append("\n".join(lines))
+
+
+def _pdfminer_pages(raw: bytes, limit: int | None = None) -> List[str]:
+    rsrcmgr = PDFResourceManager(caching=True)
+    device = _BaselineTextDevice(rsrcmgr)
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
+    for index, page in enumerate(PDFPage.get_pages(io.BytesIO(raw))):
+        if limit is not None and index >= limit:
+            break
+        interpreter.process_page(page)
+    return device.pages
+
+
+def _pypdf2_pages(raw: bytes, limit: int | None = None) -> List[str]:
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(io.BytesIO(raw))
+    total = len(reader.pages) if limit is None else min(limit, len(reader.pages))
+    return [reader.pages[index].extract_text() or "" for index in range(total)]
+
+
+def _pdfium_pages(raw: bytes, limit: int | None = None) -> List[str]:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(raw)
+    try:
+        total = len(pdf) if limit is None else min(limit, len(pdf))
+        texts = []
+        for index in range(total):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range().replace("\r\n", "\n").replace("\r", "\n"))
+            textpage.close()
+            page.close()
+        return texts
+    finally:
+        pdf.close()
+
+
+# PDFs com muitas páginas podem ser divididos em faixas extraídas por processos auxiliares.
+# SEI_PDF_SPLIT_PAGES=0 desativa; SEI_PDF_PAGE_WORKERS define quantos auxiliares por worker.
+PAGE_CHUNK = 16
+_PAGE_EXECUTOR: ProcessPoolExecutor | None = None
+_PAGE_EXECUTOR_PID: int | None = None
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def configure_page_split(min_pages: int, workers: int | None = None) -> None:
+    """Ativa a extração paralela por faixas de páginas (``min_pages=0`` desativa). Propaga via ambiente."""
+    os.environ["SEI_PDF_SPLIT_PAGES"] = str(max(0, min_pages))
+    if workers is not None:
+        os.environ["SEI_PDF_PAGE_WORKERS"] = str(max(1, workers))
+
+
+def _page_executor() -> ProcessPoolExecutor:
+    """Pool auxiliar do processo atual, criado sob demanda e reaproveitado entre PDFs.
+
+    Usa ``spawn``: o worker que chama já tem threads do pool ativas e ``fork`` pode travar.
+    """
+    global _PAGE_EXECUTOR, _PAGE_EXECUTOR_PID
+    if _PAGE_EXECUTOR is None or _PAGE_EXECUTOR_PID != os.getpid():
+        _PAGE_EXECUTOR = ProcessPoolExecutor(
+            max_workers=max(1, _env_int("SEI_PDF_PAGE_WORKERS", 4)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        # encerra os auxiliares antes de fechar as filas e aguardar os processos filhos na saída
+        multiprocessing.util.Finalize(_PAGE_EXECUTOR, _PAGE_EXECUTOR.shutdown, exitpriority=100)
+        _PAGE_EXECUTOR_PID = os.getpid()
+    return _PAGE_EXECUTOR
+
+
+def _reset_page_executor() -> None:
+    """Descarta o pool auxiliar (ex.: quebrado); o próximo PDF grande cria outro."""
+    global _PAGE_EXECUTOR, _PAGE_EXECUTOR_PID
+    executor, _PAGE_EXECUTOR, _PAGE_EXECUTOR_PID = _PAGE_EXECUTOR, None, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _pdf_page_count(raw: bytes) -> int:
+    try:
+        import pypdfium2 as pdfium
+
+        pdf = pdfium.PdfDocument(raw)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    except Exception:
+        with pdfplumber.open(io.BytesIO(raw)) as pdf:
+            return len(pdf.pages)
+
+
+def _extract_pdf_range(path: str, start: int, stop: int) -> List[str]:
+    """Auxiliar: texto das páginas ``[start, stop)`` de um PDF em disco."""
+    with pdfplumber.open(path) as pdf:
+        return [pdf.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+def _extract_pdf_pages_split(raw: bytes, min_pages: int) -> List[str] | None:
+    """Divide o PDF em faixas de ``PAGE_CHUNK`` páginas; auxiliares livres pegam a próxima faixa.
+
+    Retorna ``None`` se o PDF tiver menos de ``min_pages`` páginas ou se um auxiliar cair
+    (o pool é descartado e quem chama extrai em série).
+    """
+    count = _pdf_page_count(raw)
+    if count < min_pages:
+        return None
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+        tmp.write(raw)
+    futures = []
+    try:
+        executor = _page_executor()
+        futures = [
+            executor.submit(_extract_pdf_range, tmp.name, start, min(start + PAGE_CHUNK, count))
+            for start in range(0, count, PAGE_CHUNK)
+        ]
+        pages: List[str] = []
+        for future in futures:  # remonta na ordem das páginas
+            pages.extend(future.result())
+        return pages
+    except BrokenProcessPool:
+        _reset_page_executor()
+        return None
+    finally:
+        # estouro de prazo (BaseException) ou erro: não deixa faixas pendentes ocupando os auxiliares
+        for future in futures:
+            future.cancel()
+        os.unlink(tmp.name)
+
+
+_PDF_EXTRACTORS: dict[str, Callable[..., List[str]]] = {
+    "pdfplumber": _pdfplumber_pages,
+    "pdfminer": _pdfminer_pages,
+    "pypdf2": _pypdf2_pages,
+    "pdfium": _pdfium_pages,
+}
+
+
+def _extract_pdf_pages(raw: bytes, backend: str | None = None) -> List[str]:
+    backend = backend or _PDF_BACKEND
+    if backend == "pdfplumber":
+        min_pages = _env_int("SEI_PDF_SPLIT_PAGES", 0)
+        if min_pages > 0:
+            pages = _extract_pdf_pages_split(raw, min_pages)
+            if pages is not None:
+                return pages
+    return _PDF_EXTRACTORS[backend](raw)
+
+
+def _extract_pdf_first_page(raw: bytes) -> str:
+    pages = _PDF_EXTRACTORS[_PDF_BACKEND](raw, limit=1)
+    return pages[0] if pages else ""
 
 
 def pdf_to_text(raw: bytes) -> str:
@@ -109,7 +501,12 @@ def split_combined_pdf(raw: bytes, base_name: str) -> List[dict[str, str]]:
     return _build_pdf_documents_from_pages(page_texts, base_name)
 
 
-def document_priority(name: str, text: str) -> Tuple[int, int]:
+def document_priority(name: str, text: str, length: int | None = None) -> Tuple[int, int]:
+    """Ordem de leitura dos documentos (menor = mais relevante).
+
+    ``length`` substitui ``len(text)`` no desempate quando só temos uma prévia
+    do texto (ex.: primeira página de um PDF ainda não convertido).
+    """
     name_lower = name.lower()
     text_lower = text.lower()
     score = 10
@@ -125,7 +522,178 @@ def document_priority(name: str, text: str) -> Tuple[int, int]:
         score -= 2
     if name_lower.endswith(".html"):
         score -= 1
-    return score, len(text) * -1
+    return score, (len(text) if length is None else length) * -1
+
+
+def _cache_get(key: str, *, need_complete: bool = True) -> List[str] | None:
+    cache = get_text_cache()
+    if cache is None:
+        return None
+    try:
+        hit = cache.get(key)
+    except Exception:
+        return None
+    if hit is None or (need_complete and not hit.complete):
+        return None
+    return hit.pages
+
+
+def _cache_put(
+    key: str,
+    name: str,
+    crc: int,
+    size: int,
+    kind: str,
+    pages: Sequence[str],
+    *,
+    complete: bool = True,
+    bucket: DocumentBucket | None = None,
+) -> None:
+    cache = get_text_cache()
+    if cache is None:
+        return
+    try:
+        cache.put(
+            key,
+            name=name,
+            crc=crc,
+            size=size,
+            kind=kind,
+            pages=pages,
+            complete=complete,
+            bucket=bucket.value if bucket else None,
+        )
+    except Exception:
+        pass
+
+
+def _member_kind(name: str) -> str:
+    lower = name.lower()
+    if lower.endswith(".html") or "despacho" in lower:
+        return "html"
+    if lower.endswith(".pdf"):
+        return "pdf"
+    if lower.endswith(".txt"):
+        return "txt"
+    return ""
+
+
+def _convert_member(kind: str, data: bytes, backend: str | None = None) -> List[str]:
+    if kind == "pdf":
+        return _extract_pdf_pages(data, backend)
+    if kind == "html":
+        return [html_to_text(data)]
+    return [_decode_txt(data)]
+
+
+def read_member_pages(
+    zf: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    kind: str | None = None,
+    bucket: DocumentBucket | None = None,
+) -> List[str]:
+    """Texto por página de um membro do ZIP, consultando o cache persistente.
+
+    ``bucket`` escolhe o backend de PDF configurado para o bucket (``configure_bucket_backends``).
+    """
+    kind = kind or _member_kind(info.filename)
+    backend = _backend_for(bucket)
+    cache_kind = _cache_kind(kind, backend)
+    key = cache_key(info.CRC, info.file_size, info.filename, cache_kind)
+    pages = _cache_get(key)
+    if pages is not None:
+        return pages
+    pages = _convert_member(kind, zf.read(info), backend)
+    _cache_put(key, info.filename, info.CRC, info.file_size, cache_kind, pages)
+    return pages
+
+
+def read_member_text(
+    zf: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    kind: str | None = None,
+    bucket: DocumentBucket | None = None,
+) -> str:
+    return "\n".join(read_member_pages(zf, info, kind, bucket))
+
+
+def read_pdf_file_pages(path: Path) -> List[str]:
+    """Páginas de um PDF avulso (chave do cache = CRC do arquivo inteiro)."""
+    raw = path.read_bytes()
+    return _pdf_bytes_pages(raw, path.name)
+
+
+def _pdf_bytes_pages(raw: bytes, name: str) -> List[str]:
+    crc = zlib.crc32(raw)
+    kind = _cache_kind("pdf")
+    key = cache_key(crc, len(raw), name, kind)
+    pages = _cache_get(key)
+    if pages is not None:
+        return pages
+    pages = _extract_pdf_pages(raw)
+    _cache_put(key, name, crc, len(raw), kind, pages)
+    return pages
+
+
+class LazyDocument:
+    """Documento de um ZIP/PDF com texto completo extraído sob demanda.
+
+    O bucket é definido pelo nome do membro + primeira página (``preview``);
+    a conversão completa (pdfplumber) só acontece ao acessar ``text``.
+    """
+
+    __slots__ = ("name", "bucket", "preview", "size", "_loader", "_text")
+
+    def __init__(
+        self,
+        name: str,
+        bucket: DocumentBucket,
+        *,
+        preview: str = "",
+        size: int | None = None,
+        text: str | None = None,
+        loader: Callable[[], str] | None = None,
+    ) -> None:
+        self.name = name
+        self.bucket = bucket
+        self.preview = preview if text is None else text
+        self.size = size
+        self._loader = loader
+        self._text = text
+
+    @property
+    def loaded(self) -> bool:
+        return self._text is not None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            loader, self._loader = self._loader, None
+            try:
+                self._text = loader() if loader else self.preview
+            except Exception:
+                self._text = ""
+        return self._text
+
+    def priority(self) -> Tuple[int, int]:
+        if self.loaded:
+            return document_priority(self.name, self._text)
+        return document_priority(self.name, self.preview, length=self.size)
+
+    def as_source(self) -> dict[str, str]:
+        return {"name": self.name, "text": self.text, "bucket": self.bucket}
+
+
+def _eager_documents(docs: Sequence[dict[str, str]]) -> List[LazyDocument]:
+    return [LazyDocument(doc["name"], doc["bucket"], text=doc["text"]) for doc in docs]
+
+
+def _zip_member_loader(path: Path, member: str, bucket: DocumentBucket | None = None) -> Callable[[], str]:
+    def _load() -> str:
+        with zipfile.ZipFile(path) as zf:
+            return read_member_text(zf, zf.getinfo(member), "pdf", bucket)
+
+    return _load
 
 
 def _read_txt_file(path: Path) -> str:
@@ -135,8 +703,23 @@ def _read_txt_file(path: Path) -> str:
         return path.read_text(encoding="latin-1", errors="ignore")
 
 
-def gather_texts(path: Path) -> tuple[list[dict[str, str]], str]:
-    sources: list[dict[str, str]] = []
+def _decode_txt(data: bytes) -> str:
+    try:
+        return data.decode("utf-8", errors="ignore")
+    except Exception:
+        return data.decode("latin-1", errors="ignore")
+
+
+def gather_documents(path: Path) -> tuple[list[LazyDocument], str]:
+    """Lista os documentos do arquivo sem converter PDFs por completo.
+
+    PDFs de ZIPs com vários membros são classificados pela primeira página e
+    só têm o texto completo extraído quando ``LazyDocument.text`` é lido
+    (ex.: quando ``process_zip`` decide expandir o bucket correspondente).
+    PDFs consolidados precisam de todas as páginas para serem separados e
+    continuam sendo convertidos na hora. Toda conversão passa pelo cache
+    persistente de ``text_cache``.
+    """
     suffix = path.suffix.lower()
 
     # PDF solto
@@ -145,20 +728,22 @@ def gather_texts(path: Path) -> tuple[list[dict[str, str]], str]:
             raw = path.read_bytes()
         except OSError:
             return [], ""
-        split_docs = split_combined_pdf(raw, path.name)
+        try:
+            page_texts = _pdf_bytes_pages(raw, path.name)
+        except Exception:
+            page_texts = []
+        split_docs = _build_pdf_documents_from_pages(page_texts, path.name) if page_texts else []
         if split_docs:
-            sources.extend(split_docs)
-            sources.sort(key=lambda s: document_priority(s["name"], s["text"]))
-            return sources, ""
+            docs = _eager_documents(split_docs)
+            docs.sort(key=LazyDocument.priority)
+            return docs, ""
         # fallback: tentar texto simples
         try:
-            text = pdf_to_text(raw)
+            text = "\n".join(page_texts) if page_texts else pdf_to_text(raw)
         except Exception:
             return [], ""
         bucket = classify_document(path.name, text)
-        sources.append({"name": path.name, "text": text, "bucket": bucket})
-        sources.sort(key=lambda s: document_priority(s["name"], s["text"]))
-        return sources, ""
+        return [LazyDocument(path.name, bucket, text=text)], ""
 
     # TXT solto
     if suffix == ".txt":
@@ -166,13 +751,13 @@ def gather_texts(path: Path) -> tuple[list[dict[str, str]], str]:
             text = _read_txt_file(path)
         except OSError:
             return [], ""
-        if text:
-            bucket = classify_document(path.name, text)
-            sources.append({"name": path.name, "text": text, "bucket": bucket})
-        sources.sort(key=lambda s: document_priority(s["name"], s["text"]))
-        return sources, ""
+        if not text:
+            return [], ""
+        bucket = classify_document(path.name, text)
+        return [LazyDocument(path.name, bucket, text=text)], ""
 
     # ZIP (fluxo original)
+    docs: list[LazyDocument] = []
     with zipfile.ZipFile(path) as zf:
         entries = [info for info in zf.infolist() if not info.is_dir()]
         if len(entries) == 1:
@@ -180,41 +765,57 @@ def gather_texts(path: Path) -> tuple[list[dict[str, str]], str]:
             lower = single.filename.lower()
             if lower.endswith(".pdf"):
                 try:
-                    raw = zf.read(single)
-                except KeyError:
-                    raw = b""
-                if raw:
-                    split_docs = split_combined_pdf(raw, single.filename)
-                    if split_docs:
-                        sources.extend(split_docs)
-                        sources.sort(key=lambda s: document_priority(s["name"], s["text"]))
-                        combined = "\n".join(src["text"] for src in sources)
-                        return sources, combined
+                    page_texts = read_member_pages(zf, single, "pdf")
+                except Exception:
+                    page_texts = []
+                split_docs = _build_pdf_documents_from_pages(page_texts, single.filename) if page_texts else []
+                if split_docs:
+                    docs = _eager_documents(split_docs)
+                    docs.sort(key=LazyDocument.priority)
+                    combined = "\n".join(doc.text for doc in docs)
+                    return docs, combined
         for info in entries:
             name = info.filename
-            lower = name.lower()
+            kind = _member_kind(name)
+            if not kind:
+                continue
+            if kind == "pdf":
+                key = cache_key(info.CRC, info.file_size, name, _cache_kind(kind))
+                cached = _cache_get(key, need_complete=False)
+                if cached is not None:
+                    preview = cached[0] if cached else ""
+                else:
+                    try:
+                        preview = _extract_pdf_first_page(zf.read(info))
+                    except Exception:
+                        continue
+                bucket = classify_document(name, preview)
+                if cached is None:
+                    _cache_put(key, name, info.CRC, info.file_size, _cache_kind(kind), [preview], complete=False, bucket=bucket)
+                docs.append(
+                    LazyDocument(
+                        name,
+                        bucket,
+                        preview=preview,
+                        size=info.file_size,
+                        loader=_zip_member_loader(path, name, bucket),
+                    )
+                )
+                continue
             try:
-                data = zf.read(info)
+                text = read_member_text(zf, info, kind)
             except KeyError:
                 continue
-            text = ""
-            if lower.endswith(".html") or "despacho" in lower:
-                text = html_to_text(data)
-            elif lower.endswith(".pdf"):
-                try:
-                    text = pdf_to_text(data)
-                except Exception:
-                    continue
-            elif lower.endswith(".txt"):
-                try:
-                    text = data.decode("utf-8", errors="ignore")
-                except Exception:
-                    text = data.decode("latin-1", errors="ignore")
-            else:
-                continue
             if not text:
                 continue
-            bucket = classify_document(name, text)
-            sources.append({"name": name, "text": text, "bucket": bucket})
+            docs.append(LazyDocument(name, classify_document(name, text), text=text))
+    docs.sort(key=LazyDocument.priority)
+    return docs, ""  # combined removido
+
+
+def gather_texts(path: Path) -> tuple[list[dict[str, str]], str]:
+    """Versão materializada de ``gather_documents`` (todos os textos convertidos)."""
+    docs, combined = gather_documents(path)
+    sources = [doc.as_source() for doc in docs if doc.text]
     sources.sort(key=lambda s: document_priority(s["name"], s["text"]))
-    return sources, ""  # combined removido
+    return sources, combined
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import os
+import struct
 import zipfile
+import zlib
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -15,6 +18,36 @@ class PreparedInput:
     kind: str  # "zip", "pdf" ou "txt"
 
 
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_SIZE = 22
+
+
+def central_directory_crc(path: Path) -> int:
+    """CRC32 do diretório central do ZIP (nomes, CRCs e tamanhos de todos os membros).
+
+    Lê só o fim do arquivo. Para PDFs/TXTs, ZIP64 ou ZIPs sem diretório central
+    legível, cai no CRC32 do conteúdo inteiro.
+    """
+    with path.open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        size = handle.tell()
+        if path.suffix.lower() == ".zip" and size >= _EOCD_SIZE:
+            tail_len = min(size, _EOCD_SIZE + 0xFFFF)
+            handle.seek(size - tail_len)
+            tail = handle.read(tail_len)
+            pos = tail.rfind(_EOCD_SIGNATURE)
+            if pos >= 0 and len(tail) - pos >= _EOCD_SIZE:
+                cd_size, cd_offset = struct.unpack("<II", tail[pos + 12 : pos + 20])
+                if cd_offset != 0xFFFFFFFF and cd_offset + cd_size <= size:
+                    handle.seek(cd_offset)
+                    return zlib.crc32(handle.read(cd_size))
+        handle.seek(0)
+        crc = 0
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            crc = zlib.crc32(chunk, crc)
+        return crc
+
+
 def _pack_single_file(path: Path, temp_dir: TemporaryDirectory) -> Path:
     stem = path.stem or "document"
     dest = Path(temp_dir.name) / f"{stem}-{uuid4().hex}.zip"
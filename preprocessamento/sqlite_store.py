@@ -0,0 +1,154 @@
+"""Base dos índices SQLite ``chave -> blob`` com limite de tamanho (cache de textos, memo de extração).
+
+Cada tabela tem ``key`` (PK), ``nbytes`` e ``accessed``; as leituras atualizam
+``accessed`` no máximo uma vez a cada ``_ACCESS_REFRESH_SECONDS`` e, a cada
+``evict_check_bytes`` gravados, as entradas acessadas há mais tempo são removidas
+até o total ficar abaixo de 90% de ``max_bytes``. O arquivo (WAL) é compartilhado
+pelos workers; ``StoreSlot`` mantém uma instância por processo, configurada por
+variáveis de ambiente.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+_ACCESS_REFRESH_SECONDS = 24 * 3600
+
+
+class SizeBoundedStore:
+    """Tabela SQLite com despejo por tamanho (LRU). Subclasses definem ``table``, ``schema`` e o formato do valor."""
+
+    table = ""
+    schema = ""
+    evict_check_bytes = 64 * 1024 * 1024
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._written = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=60, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.schema)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _fetch(self, key: str, columns: str) -> tuple | None:
+        """Colunas ``columns`` da entrada ``key`` (``None`` se ausente); conta como acesso para o LRU."""
+        row = self._conn.execute(f"SELECT {columns}, accessed FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[-1] > _ACCESS_REFRESH_SECONDS:
+            # Atualiza o LRU só de vez em quando para não transformar leituras em escritas.
+            self._conn.execute(f"UPDATE {self.table} SET accessed = ? WHERE key = ?", (now, key))
+        return row[:-1]
+
+    def _store(self, key: str, nbytes: int, **columns: object) -> None:
+        """Grava (ou substitui) ``key``; ``nbytes`` é o tamanho contabilizado no limite."""
+        names = ["key", *columns, "nbytes", "accessed"]
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+            (key, *columns.values(), nbytes, time.time()),
+        )
+        self._written += nbytes
+        if self._written >= self.evict_check_bytes:
+            self._written = 0
+            self.evict()
+
+    def total_bytes(self) -> int:
+        row = self._conn.execute(f"SELECT COALESCE(SUM(nbytes), 0) FROM {self.table}").fetchone()
+        return int(row[0])
+
+    def evict(self) -> int:
+        """Remove as entradas menos recentes até ficar abaixo de 90% do limite."""
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return 0
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute(f"SELECT key, nbytes FROM {self.table} ORDER BY accessed ASC").fetchall()
+        doomed: list[tuple[str]] = []
+        for key, nbytes in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= nbytes
+        if doomed:
+            self._conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", doomed)
+        return len(doomed)
+
+
+StoreT = TypeVar("StoreT", bound=SizeBoundedStore)
+
+
+class StoreSlot(Generic[StoreT]):
+    """Instância por processo de um store (reaberta após fork; ``None`` se desativado/indisponível).
+
+    ``path_env`` aceita um caminho ou ``off``; ``mb_env`` define o tamanho máximo aproximado.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Path, int], StoreT],
+        default_path: Path,
+        default_mb: int,
+        path_env: str,
+        mb_env: str,
+    ) -> None:
+        self.factory = factory
+        self.default_path = default_path
+        self.default_mb = default_mb
+        self.path_env = path_env
+        self.mb_env = mb_env
+        self._store: StoreT | None = None
+        self._pid: int | None = None
+        self._disabled = False
+
+    def _configured_path(self) -> Path | None:
+        raw = os.getenv(self.path_env, "").strip()
+        if raw.lower() in {"off", "0", "false", "no"}:
+            return None
+        return Path(raw).expanduser() if raw else self.default_path
+
+    def get(self) -> StoreT | None:
+        if self._disabled:
+            return None
+        pid = os.getpid()
+        if self._store is not None and self._pid == pid:
+            return self._store
+        path = self._configured_path()
+        if path is None:
+            self._disabled = True
+            return None
+        try:
+            max_mb = int(os.getenv(self.mb_env, str(self.default_mb)))
+        except ValueError:
+            max_mb = self.default_mb
+        try:
+            self._store = self.factory(path, max_mb * 1024 * 1024)
+        except Exception:
+            self._disabled = True
+            self._store = None
+            return None
+        self._pid = pid
+        return self._store
+
+    def configure(self, path: Path | None, max_mb: int | None = None) -> None:
+        """Troca o store do processo (``path=None`` desativa). Propaga para os workers via ambiente."""
+        if self._store is not None and self._pid == os.getpid():
+            self._store.close()
+        self._store = None
+        self._pid = None
+        self._disabled = False
+        os.environ[self.path_env] = str(path) if path is not None else "off"
+        if max_mb is not None:
+            os.environ[self.mb_env] = str(max_mb)
+
+
+__all__ = ["SizeBoundedStore", "StoreSlot"]
@@ -0,0 +1,128 @@
+"""Cache persistente (SQLite) dos textos extraídos dos membros dos ZIPs.
+
+Cada entrada é endereçada pelo conteúdo do membro (CRC32 + tamanho + nome +
+tipo de conversão) e guarda o texto por página, comprimido com zlib, além do
+bucket calculado na última leitura. O índice fica em um único arquivo SQLite
+(WAL) compartilhado pelos workers; quando ultrapassa ``max_bytes`` as entradas
+acessadas há mais tempo são removidas.
+
+Configuração por ambiente:
+    SEI_TEXT_CACHE      caminho do arquivo .sqlite ou ``off`` para desativar.
+    SEI_TEXT_CACHE_MB   tamanho máximo aproximado (default=2048).
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence
+
+from .sqlite_store import SizeBoundedStore, StoreSlot
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[1] / ".cache" / "textos.sqlite"
+DEFAULT_MAX_MB = 2048
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    crc INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    pages BLOB NOT NULL,
+    page_count INTEGER NOT NULL,
+    complete INTEGER NOT NULL,
+    bucket TEXT,
+    nbytes INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS texts_accessed ON texts(accessed);
+"""
+
+
+@dataclass(frozen=True)
+class CachedText:
+    pages: List[str]
+    complete: bool
+    bucket: str | None = None
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.pages)
+
+
+def cache_key(crc: int, size: int, name: str, kind: str) -> str:
+    return f"{crc & 0xFFFFFFFF:08x}:{size}:{kind}:{name}"
+
+
+class TextCache(SizeBoundedStore):
+    """Índice SQLite de textos por página, com despejo por tamanho (LRU)."""
+
+    table = "texts"
+    schema = _SCHEMA
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024) -> None:
+        super().__init__(path, max_bytes)
+
+    def get(self, key: str) -> CachedText | None:
+        row = self._fetch(key, "pages, complete, bucket")
+        if row is None:
+            return None
+        blob, complete, bucket = row
+        pages = json.loads(zlib.decompress(blob).decode("utf-8"))
+        return CachedText(pages=pages, complete=bool(complete), bucket=bucket)
+
+    def put(
+        self,
+        key: str,
+        *,
+        name: str,
+        crc: int,
+        size: int,
+        kind: str,
+        pages: Sequence[str],
+        complete: bool = True,
+        bucket: str | None = None,
+    ) -> None:
+        blob = zlib.compress(json.dumps(list(pages), ensure_ascii=False).encode("utf-8"), 6)
+        self._store(
+            key,
+            len(blob),
+            name=name,
+            crc=crc & 0xFFFFFFFF,
+            size=size,
+            kind=kind,
+            pages=blob,
+            page_count=len(pages),
+            complete=int(complete),
+            bucket=bucket,
+        )
+
+    def set_bucket(self, key: str, bucket: str) -> None:
+        self._conn.execute("UPDATE texts SET bucket = ? WHERE key = ? AND bucket IS NOT ?", (bucket, key, bucket))
+
+
+_SLOT: StoreSlot[TextCache] = StoreSlot(
+    TextCache, DEFAULT_CACHE_PATH, DEFAULT_MAX_MB, path_env="SEI_TEXT_CACHE", mb_env="SEI_TEXT_CACHE_MB"
+)
+
+
+def get_text_cache() -> TextCache | None:
+    """Cache do processo atual (reaberto após fork; ``None`` se desativado/indisponível)."""
+    return _SLOT.get()
+
+
+def configure_text_cache(path: Path | None, max_mb: int | None = None) -> None:
+    """Troca o cache do processo (``path=None`` desativa). Propaga para os workers via ambiente."""
+    _SLOT.configure(path, max_mb)
+
+
+__all__ = [
+    "CachedText",
+    "TextCache",
+    "cache_key",
+    "configure_text_cache",
+    "get_text_cache",
+]
@@ -0,0 +1,172 @@
+"""
+Compara os backends de PDF (pdfplumber, pdfminer, pypdf2, pdfium) num corpus de ZIPs/PDFs.
+
+Para cada PDF (membros de ZIP e PDFs avulsos):
+  - mede páginas/s de cada backend;
+  - roda ``extract_from_text`` no texto de cada backend e compara os campos com os
+    do backend de referência (pdfplumber), agrupando pelo bucket do documento.
+
+Saída: tabela de velocidade, concordância de campos por bucket e uma sugestão para
+``extract_reports --pdf-backend-by-bucket`` (o backend mais rápido que atinge
+``--min-agreement`` em cada bucket; PRINCIPAL fica sempre com a referência).
+
+Uso:
+  python scripts/benchmark_pdf_backends.py --zip-dir <pasta> [--limit 200] [--json saida.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import zipfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+# Ensure repo root is on sys.path when run as a standalone script
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from preprocessamento.documents import DEFAULT_PDF_BACKEND, _PDF_EXTRACTORS, available_pdf_backends
+from seiautomation.offline.doc_classifier import DocumentBucket, classify_document
+from seiautomation.offline.extract_reports import extract_from_text
+
+
+def iter_pdfs(paths: List[Path], limit: int) -> Iterator[Tuple[str, bytes]]:
+    count = 0
+    for path in paths:
+        if limit and count >= limit:
+            return
+        suffix = path.suffix.lower()
+        if suffix == ".pdf":
+            count += 1
+            yield path.name, path.read_bytes()
+        elif suffix == ".zip":
+            count += 1
+            try:
+                with zipfile.ZipFile(path) as zf:
+                    for info in zf.infolist():
+                        if not info.is_dir() and info.filename.lower().endswith(".pdf"):
+                            yield f"{path.name}:{info.filename}", zf.read(info)
+            except zipfile.BadZipFile:
+                continue
+
+
+def _fields(text: str, name: str) -> Dict[str, str]:
+    result = extract_from_text(text, "", name)
+    return {field: str(value) for field, value in result.data.items() if value}
+
+
+def run(paths: List[Path], backends: List[str], reference: str, limit: int) -> dict:
+    speed: Dict[str, List[float]] = {backend: [0.0, 0.0] for backend in backends}  # [páginas, segundos]
+    errors: Dict[str, int] = defaultdict(int)
+    # agreement[backend][bucket] = [campos iguais, campos da referência, campos extras]
+    agreement: Dict[str, Dict[str, List[int]]] = {b: defaultdict(lambda: [0, 0, 0]) for b in backends}
+    documents = 0
+    for name, raw in iter_pdfs(paths, limit):
+        texts: Dict[str, List[str]] = {}
+        for backend in backends:
+            started = time.perf_counter()
+            try:
+                pages = _PDF_EXTRACTORS[backend](raw)
+            except Exception:
+                errors[backend] += 1
+                continue
+            speed[backend][0] += len(pages)
+            speed[backend][1] += time.perf_counter() - started
+            texts[backend] = pages
+        ref_pages = texts.get(reference)
+        if not ref_pages:
+            continue
+        documents += 1
+        bucket = classify_document(name, ref_pages[0]).value
+        ref_fields = _fields("\n".join(ref_pages), name)
+        for backend, pages in texts.items():
+            fields = _fields("\n".join(pages), name)
+            stats = agreement[backend][bucket]
+            stats[0] += sum(1 for field, value in ref_fields.items() if fields.get(field) == value)
+            stats[1] += len(ref_fields)
+            stats[2] += sum(1 for field in fields if field not in ref_fields)
+    return {
+        "documents": documents,
+        "reference": reference,
+        "speed": {
+            backend: {"pages": int(pages), "seconds": round(seconds, 3), "pages_per_s": round(pages / seconds, 1) if seconds else 0.0}
+            for backend, (pages, seconds) in speed.items()
+        },
+        "errors": dict(errors),
+        "agreement": {
+            backend: {
+                bucket: {"equal": eq, "reference_fields": total, "extra": extra, "ratio": round(eq / total, 4) if total else 1.0}
+                for bucket, (eq, total, extra) in sorted(per_bucket.items())
+            }
+            for backend, per_bucket in agreement.items()
+        },
+    }
+
+
+def suggest(report: dict, min_agreement: float) -> Dict[str, str]:
+    """Backend mais rápido com concordância >= ``min_agreement`` em cada bucket (exceto PRINCIPAL)."""
+    by_speed = sorted(report["speed"], key=lambda b: report["speed"][b]["pages_per_s"], reverse=True)
+    choice: Dict[str, str] = {}
+    for bucket in (b.value for b in DocumentBucket if b is not DocumentBucket.PRINCIPAL):
+        for backend in by_speed:
+            stats = report["agreement"].get(backend, {}).get(bucket)
+            if stats is None or not stats["reference_fields"] or report["errors"].get(backend):
+                continue  # sem campos na referência não há evidência para trocar
+            if stats["ratio"] >= min_agreement:
+                if backend != report["reference"]:
+                    choice[bucket] = backend
+                break
+    return choice
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dos backends de PDF (velocidade e concordância de campos).")
+    parser.add_argument("paths", nargs="*", type=Path, help="ZIPs/PDFs avulsos.")
+    parser.add_argument("--zip-dir", type=Path, help="Diretório com ZIPs/PDFs (não recursivo).")
+    parser.add_argument("--limit", type=int, default=0, help="Máximo de arquivos (0 = todos).")
+    parser.add_argument("--backends", default=",".join(available_pdf_backends()), help="Lista separada por vírgula.")
+    parser.add_argument("--reference", default=DEFAULT_PDF_BACKEND, help="Backend de referência (default=pdfplumber).")
+    parser.add_argument("--min-agreement", type=float, default=0.99, help="Concordância mínima para sugerir um backend.")
+    parser.add_argument("--json", type=Path, help="Grava o relatório completo em JSON.")
+    args = parser.parse_args()
+
+    paths = list(args.paths)
+    if args.zip_dir:
+        paths.extend(sorted(p for p in args.zip_dir.iterdir() if p.suffix.lower() in {".zip", ".pdf"}))
+    if not paths:
+        parser.error("Informe arquivos ou --zip-dir.")
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    unknown = [b for b in backends if b not in available_pdf_backends()]
+    if unknown:
+        parser.error(f"Backend indisponível: {', '.join(unknown)}")
+    if args.reference not in backends:
+        backends.insert(0, args.reference)
+
+    report = run(paths, backends, args.reference, args.limit)
+    print(f"{report['documents']} PDF(s) | referência: {args.reference}")
+    ref_rate = report["speed"][args.reference]["pages_per_s"] or 1.0
+    for backend, stats in report["speed"].items():
+        print(
+            f"  {backend:<11} {stats['pages_per_s']:>8.1f} pág/s  ({stats['pages_per_s'] / ref_rate:.1f}x)"
+            + (f"  erros={report['errors'][backend]}" if report["errors"].get(backend) else "")
+        )
+    print("Concordância de campos com a referência (iguais/total, extras):")
+    for backend, per_bucket in report["agreement"].items():
+        if backend == args.reference:
+            continue
+        cells = [f"{bucket}={s['equal']}/{s['reference_fields']} (+{s['extra']})" for bucket, s in per_bucket.items()]
+        print(f"  {backend:<11} " + "  ".join(cells))
+    choice = suggest(report, args.min_agreement)
+    report["suggestion"] = ",".join(f"{bucket}={backend}" for bucket, backend in sorted(choice.items()))
+    print(f"Sugestão: --pdf-backend-by-bucket \"{report['suggestion']}\"" if choice else "Sugestão: manter a referência.")
+    if args.json:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,6 @@ from pathlib import Path
 import sys
 from typing import List, Tuple
 
-import pdfplumber
 from PyPDF2 import PdfReader, PdfWriter
 
 # Ensure repo root is on sys.path when run as a standalone script
@@ -35,13 +34,12 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from preprocessamento.documents import _extract_pdf_doc_number
+from preprocessamento.documents import _extract_pdf_doc_number, read_pdf_file_pages
 from seiautomation.offline.doc_classifier import classify_document
 
 
 def extract_page_texts(pdf_path: Path) -> List[str]:
-    with pdfplumber.open(pdf_path) as pdf:
-        return [page.extract_text() or "" for page in pdf.pages]
+    return read_pdf_file_pages(pdf_path)
 
 
 def split_pages_by_doc_id(page_texts: List[str]) -> List[Tuple[int, int]]:
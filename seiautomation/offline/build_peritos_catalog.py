@@ -2,15 +2,13 @@ from __future__ import annotations
 
 import argparse
 import csv
-import io
 import re
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
-import pdfplumber
-from bs4 import BeautifulSoup
+from preprocessamento.documents import read_member_text
 
 CPF_PATTERN = re.compile(r"\d{3}\.\d{3}\.\d{3}-\d{2}")
 CNPJ_PATTERN = re.compile(r"\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}")
@@ -34,17 +32,6 @@ class PeritoInfo:
         return self
 
 
-def html_to_text(raw: bytes) -> str:
-    soup = BeautifulSoup(raw, "html.parser")
-    return soup.get_text("\n", strip=True)
-
-
-def pdf_to_text(raw: bytes) -> str:
-    with pdfplumber.open(io.BytesIO(raw)) as pdf:
-        texts = [page.extract_text() or "" for page in pdf.pages]
-    return "\n".join(texts)
-
-
 def gather_texts(zip_path: Path) -> list[str]:
     texts: list[str] = []
     with zipfile.ZipFile(zip_path) as zf:
@@ -54,17 +41,11 @@ def gather_texts(zip_path: Path) -> list[str]:
             name = info.filename.lower()
             if not (name.endswith(".pdf") or name.endswith(".html")):
                 continue
+            kind = "html" if name.endswith(".html") else "pdf"
             try:
-                raw = zf.read(info)
-            except KeyError:
+                text = read_member_text(zf, info, kind)
+            except Exception:
                 continue
-            if name.endswith(".html"):
-                text = html_to_text(raw)
-            else:
-                try:
-                    text = pdf_to_text(raw)
-                except Exception:
-                    continue
             if text:
                 texts.append(text)
     return texts
@@ -1,30 +1,55 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 import csv
 import difflib
+import html
+import itertools
 import json
 import logging
+import multiprocessing
+import os
 import re
+import shutil
+import signal
 import sys
+import threading
 import unicodedata
 import time
 import zipfile
+import zlib
 from io import BytesIO
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
+from collections import Counter, OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Iterable, List, Sequence, Set
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Mapping, Sequence, Set
 from uuid import uuid4
 
 from dateutil import parser as date_parser
 import pandas as pd
 from openpyxl import Workbook, load_workbook
 
-from preprocessamento.documents import gather_texts, document_priority
-from preprocessamento.inputs import PreparedInput, resolve_input_paths
+from preprocessamento.documents import (
+    LazyDocument,
+    configure_bucket_backends,
+    configure_page_split,
+    document_priority,
+    gather_documents,
+    read_member_text,
+    set_pdf_backend,
+)
+from preprocessamento.inputs import PreparedInput, central_directory_crc, resolve_input_paths
 from .doc_classifier import DocumentBucket, classify_document
+from .extraction_memo import get_extraction_memo, memo_key
+from .result_store import ReplayStore, ResultStore
 
 try:
     from PyPDF2 import PdfReader
@@ -77,6 +102,12 @@ def _build_bucket_requirements() -> dict[DocumentBucket, set[str]]:
 
 BUCKET_REQUIREMENTS = _build_bucket_requirements()
 
+# Incrementar quando as regras de extração mudarem: invalida o manifesto do --skip-existing.
+EXTRACTOR_VERSION = "2026.10.6"
+# Incrementar só quando ``extract_from_text`` (regras por documento) mudar: invalida o memo
+# por documento. Mudanças nas heurísticas entre documentos (``_apply_*``) não precisam.
+DOCUMENT_RULES_VERSION = "6"
+
 INVALID_EXCEL_CHARS = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F]")
 LOG_DIR = Path(__file__).resolve().parents[2] / "logs" / "extract"
 LOGGER = logging.getLogger("extract_reports")
@@ -97,17 +128,103 @@ def _state_path(run_id: str) -> Path:
     return LOG_DIR / f"{run_id}.state.json"
 
 
+def _journal_path(run_id: str) -> Path:
+    return LOG_DIR / f"{run_id}.journal.jsonl"
+
+
 def _load_state(run_id: str) -> dict:
     path = _state_path(run_id)
     if not path.exists():
         raise SystemExit(f"Checkpoint não encontrado para run-id {run_id} em {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    state = json.loads(path.read_text(encoding="utf-8"))
+    return _replay_journal(_journal_path(run_id), state)
 
 
 def _save_state(run_id: str, state: dict) -> None:
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     path = _state_path(run_id)
-    path.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _replay_journal(path: Path, state: dict) -> dict:
+    """Aplica ao ``state`` compactado as linhas do journal (linhas truncadas/ilegíveis são puladas)."""
+    if not path.exists():
+        return state
+    processed = set(state.get("processed_files", []))
+    quarantine = dict(state.get("quarantine", {}))
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            name = entry.get("zip")
+            if not name:
+                continue
+            if entry.get("status") == "quarantine":
+                quarantine[name] = entry.get("reason", "")
+            else:
+                processed.add(name)
+                quarantine.pop(name, None)
+    state["processed_files"] = sorted(processed)
+    state["quarantine"] = dict(sorted(quarantine.items()))
+    return state
+
+
+class CheckpointJournal:
+    """Journal append-only dos arquivos concluídos/em quarentena de uma execução.
+
+    Cada checkpoint grava só as linhas do lote (um ``fsync`` por lote); o
+    ``state.json`` completo só é reescrito na compactação.
+    """
+
+    COMPACT_EVERY = 5000
+
+    def __init__(self, run_id: str) -> None:
+        self.run_id = run_id
+        self.path = _journal_path(run_id)
+        self._pending: list[str] = []
+        self.lines = 0
+        if self.path.exists():
+            with self.path.open("r+b") as handle:
+                data = handle.read()
+                complete = data.rfind(b"\n") + 1
+                if complete < len(data):
+                    # queda no meio de uma escrita: corta a linha incompleta antes de voltar a acrescentar
+                    handle.truncate(complete)
+                self.lines = data.count(b"\n", 0, complete)
+
+    def record(self, name: str, status: str = "ok", reason: str = "") -> None:
+        entry: dict[str, str] = {"zip": name, "status": status}
+        if reason:
+            entry["reason"] = reason
+        self._pending.append(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write("".join(self._pending))
+            handle.flush()
+            os.fsync(handle.fileno())
+        self.lines += len(self._pending)
+        self._pending = []
+
+    def needs_compaction(self) -> bool:
+        return self.lines >= self.COMPACT_EVERY
+
+    def compact(self, state: dict) -> None:
+        """Grava o ``state`` completo e esvazia o journal (replay é idempotente se cair no meio)."""
+        self.flush()
+        _save_state(self.run_id, state)
+        with self.path.open("w", encoding="utf-8"):
+            pass
+        self.lines = 0
 
 
 def _setup_logger(run_id: str, disable_file_log: bool = False) -> Path:
@@ -127,7 +244,13 @@ def _cleanup_old_logs(days: int) -> None:
     if days <= 0 or not LOG_DIR.exists():
         return
     cutoff = datetime.now() - timedelta(days=days)
-    for pattern in ("extract-*.log", "extract-*.state.json", "extract-*.sources.jsonl"):
+    for pattern in (
+        "extract-*.log",
+        "extract-*.state.json",
+        "extract-*.journal.jsonl",
+        "extract-*.sources.jsonl",
+        "extract-*.replay.sqlite*",
+    ):
         for file in LOG_DIR.glob(pattern):
             try:
                 if datetime.fromtimestamp(file.stat().st_mtime) < cutoff:
@@ -202,6 +325,36 @@ DATA_ADIANTAMENTO_LABELS = ("data adiantamento", "data do adiantamento")
 CHECAGEM_ADIANT_LABELS = ("checagem adiantamento",)
 DATA_AUTORIZACAO_LABELS = ("data da autorização", "autorização da despesa")
 SALDO_LABELS = ("saldo a receber",)
+JUIZO_LINE_LABELS = ("juízo", "vara")
+REQUISICAO_DATE_LABELS = ("data da requisição", "data do requerimento", "campina grande", "joão pessoa", "patos", "sousa")
+PROMOVENTE_ENTITY_GROUPS = (PROMOVENTE_LABELS + ("autor", "parte autora", "exequente"), ("requerente",))
+PROMOVIDO_ENTITY_GROUPS = (PROMOVIDO_LABELS + ("réu", "executado", "parte ré"), ("requerido", "parte ré"))
+
+# Todos os grupos consultados via _line_value: o scanner de rótulos pré-filtra as linhas
+# de cada documento uma única vez com a união deles (grupos fora da lista caem no laço simples).
+LABEL_GROUPS = (
+    PROMOVENTE_LABELS,
+    PROMOVIDO_LABELS,
+    PERITO_LABELS,
+    CPF_LABELS,
+    ESPECIALIDADE_LABELS,
+    ESPECIE_LABELS,
+    NATUREZA_LABELS,
+    FATOR_LABELS,
+    VALOR_TABELA_LABELS,
+    VALOR_ARBITRADO_LABELS,
+    CHECAGEM_LABELS,
+    DATA_ADIANTAMENTO_LABELS,
+    CHECAGEM_ADIANT_LABELS,
+    DATA_AUTORIZACAO_LABELS,
+    SALDO_LABELS,
+    JUIZO_LINE_LABELS,
+    REQUISICAO_DATE_LABELS,
+    *PROMOVENTE_ENTITY_GROUPS,
+    *PROMOVIDO_ENTITY_GROUPS,
+)
+_SCANNED_LABELS = frozenset(label.lower() for group in LABEL_GROUPS for label in group)
+_LABEL_PREFILTER = re.compile("|".join(re.escape(label) for label in sorted(_SCANNED_LABELS, key=len, reverse=True)))
 
 PROCESSO_NUM_PATTERN = re.compile(r"\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}")
 PROCESSO_ADMIN_PATTERN = re.compile(r"20\d{8}")
@@ -213,6 +366,9 @@ PROCESSO_SEI_LOOSE_PATTERN = re.compile(
 PROCESSO_SEI_LOOSE_PATTERN = re.compile(
     r"(\d{5,7})\s*-\s*(\d{2})[.\-\s]*(\d{4})[.\-\s]*(\d)[.\-\s]*(\d{2})(?![.\-]\d{3,4})"
 )
+# Os padrões de identificador acima começam num dígito, só usam dígitos, ".", "-", "/" e espaços
+# e nenhum casa em menos de 7 caracteres: ``_scan_identifiers`` roda todos só dentro desses trechos.
+IDENTIFIER_SPAN_PATTERN = re.compile(r"\d[\d.\-/\s]{6,}")
 CPF_PATTERN = re.compile(r"\d{3}\.\d{3}\.\d{3}-\d{2}")
 CNPJ_PATTERN = re.compile(r"\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}")
 PERITO_PARAGRAPH_PATTERN = re.compile(
@@ -232,6 +388,10 @@ PARTES_REGEX = re.compile(
     r".*?em\s+face\s+(?:de|da|do|dos|das)\s+(?P<promovido>[^,\n]+)",
     re.IGNORECASE | re.DOTALL,
 )
+# âncoras do PARTES_REGEX: o regex só roda a partir delas, numa janela de PARTES_WINDOW caracteres
+PARTES_ANCHOR_PATTERN = re.compile(r"(?=(?:movid[oa]|propost[oa]|promov[ei]d[oa])\s+por\s)", re.IGNORECASE)
+PARTES_WINDOW = 2000
+PARTES_LINE_TAIL = 500  # o nome do promovido pode continuar até o fim da linha
 ESPECIE_INLINE_PATTERN = re.compile(
     r"(?:esp[eé]cie|tipo)\s+de\s+per[ií]cia\s*[:\-]?\s*([^\n;]+)", re.IGNORECASE
 )
@@ -309,9 +469,12 @@ COLUMNS = [
 HONORARIOS_TABLE: list[dict[str, str]] = []
 HONORARIOS_INDEX: dict[str, dict[str, str]] = {}
 HONORARIOS_BY_ID: dict[str, dict[str, str]] = {}
+HONORARIOS_BY_CENTS: dict[int, list[dict[str, str]]] = {}
+_HONORARIOS_CENTS: list[int] = []  # chaves de HONORARIOS_BY_CENTS ordenadas (consultas por faixa)
 HONORARIOS_ALIAS: list[dict[str, object]] = []
 
 
+@lru_cache(maxsize=8192)
 def _normalize_key(value: str) -> str:
     if not value:
         return ""
@@ -321,12 +484,161 @@ def _normalize_key(value: str) -> str:
     return normalized
 
 
+_HONORARIOS_FUZZY_CUTOFF = 0.75
+_HONORARIOS_MATCH_CACHE_SIZE = 4096
+
+
+def _trigrams(value: str) -> set[str]:
+    return {value[i : i + 3] for i in range(len(value) - 2)}
+
+
+class _HonorariosMatcher:
+    """Índice das descrições normalizadas do HONORARIOS_INDEX.
+
+    Reproduz ``difflib.get_close_matches(norm, keys, n=1, cutoff=0.75)`` seguido da
+    varredura por substring, mas só avalia as chaves que podem passar:
+      - fuzzy: janela de tamanho (limite do ``real_quick_ratio``) e contagem de
+        caracteres (limite do ``quick_ratio``); o ``ratio()`` roda em ordem decrescente
+        desse limite e para quando nenhuma chave restante pode superar a melhor;
+      - substring: índice invertido de trigramas, conferido na ordem do dict.
+    As respostas por consulta normalizada ficam num LRU limitado.
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self.keys = list(keys)
+        self.order = {key: index for index, key in enumerate(self.keys)}
+        by_length = sorted(self.keys, key=len)
+        self.by_length = by_length
+        self.lengths = [len(key) for key in by_length]
+        self.counts = {key: Counter(key) for key in self.keys}
+        self.key_trigrams = {key: _trigrams(key) for key in self.keys}
+        self.postings: dict[str, list[str]] = {}
+        for key in self.keys:
+            for gram in self.key_trigrams[key]:
+                self.postings.setdefault(gram, []).append(key)
+        self.short_keys = [key for key in self.keys if len(key) < 3]
+        self.cache: OrderedDict[str, str | None] = OrderedDict()
+
+    def lookup(self, norm: str) -> str | None:
+        try:
+            self.cache.move_to_end(norm)
+            return self.cache[norm]
+        except KeyError:
+            pass
+        key = self._close_match(norm)
+        if key is None:
+            key = self._substring_match(norm)
+        self.cache[norm] = key
+        if len(self.cache) > _HONORARIOS_MATCH_CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return key
+
+    def _close_match(self, norm: str) -> str | None:
+        size = len(norm)
+        cutoff = _HONORARIOS_FUZZY_CUTOFF
+        # 2*min(la, lb)/(la+lb) >= 0.75 exige la em [0.6*lb, lb/0.6]; margem de 1 e o
+        # teste exato abaixo evitam depender do arredondamento
+        lo = bisect.bisect_left(self.lengths, int(size * 0.6) - 1)
+        hi = bisect.bisect_right(self.lengths, int(size / 0.6) + 1)
+        if lo >= hi:
+            return None
+        query_counts = Counter(norm)
+        bounded: list[tuple[float, str]] = []
+        for key in self.by_length[lo:hi]:
+            total = len(key) + size
+            if 2.0 * min(len(key), size) / total < cutoff:
+                continue
+            bound = 2.0 * sum((query_counts & self.counts[key]).values()) / total
+            if bound >= cutoff:
+                bounded.append((bound, key))
+        if not bounded:
+            return None
+        bounded.sort(reverse=True)
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(norm)
+        best: tuple[float, str] | None = None
+        for bound, key in bounded:
+            # ratio() <= bound: nenhuma chave restante supera a melhor
+            if best is not None and (bound, key) < best:
+                break
+            matcher.set_seq1(key)
+            score = matcher.ratio()
+            # get_close_matches desempata por (score, chave) via heapq.nlargest
+            if score >= cutoff and (best is None or (score, key) > best):
+                best = (score, key)
+        return best[1] if best else None
+
+    def _substring_match(self, norm: str) -> str | None:
+        query_grams = _trigrams(norm)
+        candidates: set[str] = set(self.short_keys)
+        # norm in key: a chave contém todos os trigramas da consulta
+        if len(norm) < 3:
+            candidates.update(self.keys)
+        else:
+            postings = sorted((self.postings.get(gram, ()) for gram in query_grams), key=len)
+            common = set(postings[0])
+            for posting in postings[1:]:
+                common.intersection_update(posting)
+            candidates |= common
+        # key in norm: todos os trigramas da chave aparecem na consulta
+        hits: dict[str, int] = {}
+        for gram in query_grams:
+            for key in self.postings.get(gram, ()):
+                hits[key] = hits.get(key, 0) + 1
+        candidates.update(key for key, count in hits.items() if count == len(self.key_trigrams[key]))
+        for key in sorted(candidates, key=self.order.__getitem__):
+            if norm in key or key in norm:
+                return key
+        return None
+
+
+_HONORARIOS_MATCHER: _HonorariosMatcher | None = None
+
+
+def _reset_honorarios_matcher() -> None:
+    """Descarta o índice/LRU; chamar sempre que HONORARIOS_INDEX mudar."""
+    global _HONORARIOS_MATCHER
+    _HONORARIOS_MATCHER = None
+
+
+def _honorarios_matcher() -> _HonorariosMatcher:
+    global _HONORARIOS_MATCHER
+    if _HONORARIOS_MATCHER is None:
+        _HONORARIOS_MATCHER = _HonorariosMatcher(HONORARIOS_INDEX)
+    return _HONORARIOS_MATCHER
+
+
 def _safe_excel_value(value):
     if isinstance(value, str):
         return INVALID_EXCEL_CHARS.sub("", value)
     return value
 
 
+CURRENCY_PREFIX_PATTERN = re.compile(r"^[Rr]\$\s*")
+DOT_DECIMAL_PATTERN = re.compile(r"\d+\.\d{1,2}")
+
+
+def _currency_cents(value: str | float | None) -> int | None:
+    """Valor monetário em centavos: 'R$ 1.234,56', '1234,56' ou '300.00' (formato da tabela CSV)."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(round(value * 100))
+    text = CURRENCY_PREFIX_PATTERN.sub("", str(value).strip())
+    if "," in text:
+        whole, _, frac = text.rpartition(",")
+        whole = whole.replace(".", "")
+    elif DOT_DECIMAL_PATTERN.fullmatch(text):
+        whole, _, frac = text.partition(".")
+    else:
+        whole, frac = text.replace(".", ""), ""
+    if not (whole or frac) or (whole and not whole.isdigit()) or (frac and not frac.isdigit()):
+        return None
+    if len(frac) > 2:
+        return int(round(float(f"{whole or 0}.{frac}") * 100))
+    return int(whole or 0) * 100 + int(frac.ljust(2, "0"))
+
+
 def _load_honorarios_table() -> None:
     base_dir = Path(__file__).resolve().parents[2]
     path = base_dir / "docs" / "tabela_honorarios.csv"
@@ -345,10 +657,16 @@ def _load_honorarios_table() -> None:
                 row_id = row.get("ID", "").strip()
                 if row_id:
                     HONORARIOS_BY_ID[row_id] = row
+                cents = _currency_cents(row["VALOR"])
+                if cents is not None:
+                    HONORARIOS_BY_CENTS.setdefault(cents, []).append(row)
     except Exception:
         HONORARIOS_TABLE.clear()
         HONORARIOS_INDEX.clear()
         HONORARIOS_BY_ID.clear()
+        HONORARIOS_BY_CENTS.clear()
+    _HONORARIOS_CENTS[:] = sorted(HONORARIOS_BY_CENTS)
+    _reset_honorarios_matcher()
 
 
 _load_honorarios_table()
@@ -372,18 +690,165 @@ def _load_honorarios_aliases() -> None:
         if not keywords:
             continue
         HONORARIOS_ALIAS.append({"keywords": keywords, "entry": entry})
+    _reset_alias_automaton()
+
+
+class _KeywordAutomaton:
+    """Aho-Corasick sobre as palavras-chave dos aliases.
+
+    Cada estado guarda o menor índice de alias cujas palavras terminam nele (ou nos
+    sufixos via ``fail``), então uma passada pelo texto devolve o mesmo alias que a
+    varredura em ordem (``keyword in norm`` alias por alias).
+    """
+
+    def __init__(self, keyword_groups: Sequence[Sequence[str]]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        best: list[int] = [len(keyword_groups)]
+        for index, keywords in enumerate(keyword_groups):
+            for keyword in keywords:
+                state = 0
+                for char in keyword:
+                    nxt = goto[state].get(char)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][char] = nxt
+                        goto.append({})
+                        best.append(len(keyword_groups))
+                    state = nxt
+                best[state] = min(best[state], index)
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:  # BFS: o fail de um estado já está pronto quando ele é visitado
+            best[state] = min(best[state], best[fail[state]])
+            for char, nxt in goto[state].items():
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                fail[nxt] = goto[link].get(char, 0)
+                queue.append(nxt)
+        self.goto = goto
+        self.fail = fail
+        self.best = best
+        self.missing = len(keyword_groups)
+
+    def first_match(self, text: str) -> int | None:
+        goto, fail, best = self.goto, self.fail, self.best
+        found = self.missing
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if best[state] < found:
+                found = best[state]
+                if not found:
+                    break
+        return found if found < self.missing else None
+
+
+_ALIAS_AUTOMATON: _KeywordAutomaton | None = None
+
+
+def _reset_alias_automaton() -> None:
+    """Descarta o autômato; chamar sempre que HONORARIOS_ALIAS mudar."""
+    global _ALIAS_AUTOMATON
+    _ALIAS_AUTOMATON = None
+
+
+def _alias_automaton() -> _KeywordAutomaton:
+    global _ALIAS_AUTOMATON
+    if _ALIAS_AUTOMATON is None:
+        _ALIAS_AUTOMATON = _KeywordAutomaton([alias["keywords"] for alias in HONORARIOS_ALIAS])
+    return _ALIAS_AUTOMATON
 
 
 _load_honorarios_aliases()
 
 
+class Candidate:
+    """Candidato de um campo (compacto; mantém a interface ``get``/``[]`` dos antigos dicts)."""
+
+    __slots__ = ("value", "source", "pattern", "snippet", "page", "start", "end", "weight", "_ctx")
+    KEYS = ("value", "source", "pattern", "snippet", "page", "start", "end", "weight")
+
+    def __init__(
+        self,
+        value: str,
+        source: str = "",
+        pattern: str = "",
+        snippet: str | None = None,
+        page: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        weight: float = 1.0,
+    ) -> None:
+        self.value = value
+        # fonte/padrão se repetem em todos os candidatos: internados, viram uma única string no pickle
+        self.source = sys.intern(source) if source else source
+        self.pattern = sys.intern(pattern) if pattern else pattern
+        self.snippet = snippet
+        self.page = page
+        self.start = start
+        self.end = end
+        self.weight = weight
+        self._ctx = None
+
+    def get(self, key: str, default=None):
+        if key in self.KEYS:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.KEYS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.KEYS or (key == _SNIPPET_REF and self._ctx is not None)
+
+    def to_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self.KEYS}
+
+    def __reduce__(self):
+        # tupla posicional, sem a referência ao texto
+        return (Candidate, tuple(getattr(self, key) for key in self.KEYS))
+
+    def __repr__(self) -> str:
+        return f"Candidate({self.to_dict()!r})"
+
+
+def _trim_candidates(result: "ExtractionResult", top_k: int | None) -> None:
+    """Mantém no máximo ``top_k`` candidatos por campo (maiores pesos + o escolhido), na ordem original."""
+    if not top_k or top_k <= 0:
+        return
+    for field_name, entries in result.candidates.items():
+        if len(entries) <= top_k:
+            continue
+        ranked = sorted(range(len(entries)), key=lambda idx: (-(entries[idx].weight or 0), idx))
+        keep = set(ranked[:top_k])
+        chosen = result.meta.get(field_name)
+        if chosen is not None:
+            chosen_idx = next((idx for idx, entry in enumerate(entries) if entry is chosen), None)
+            if chosen_idx is not None and chosen_idx not in keep:
+                keep.discard(ranked[top_k - 1])
+                keep.add(chosen_idx)
+        result.candidates[field_name] = [entry for idx, entry in enumerate(entries) if idx in keep]
+
+
 @dataclass
 class ExtractionResult:
     data: dict[str, str] = field(default_factory=dict)
     observations: List[str] = field(default_factory=list)
     sources: dict[str, str] = field(default_factory=dict)
     meta: dict[str, dict] = field(default_factory=dict)
-    candidates: dict[str, list[dict]] = field(default_factory=dict)
+    candidates: dict[str, list[Candidate]] = field(default_factory=dict)
+    # regex acima do orçamento (fora do ``meta``: não entra no memo/replay, que só guardam campos)
+    regex_slow: list[dict[str, object]] = field(default_factory=list)
 
     def update_from(self, other: "ExtractionResult", source_name: str) -> None:
         for key, value in other.data.items():
@@ -403,6 +868,12 @@ class ExtractionResult:
         for obs in other.observations:
             if obs not in self.observations:
                 self.observations.append(obs)
+        self.regex_slow.extend(other.regex_slow)
+
+    def __getstate__(self) -> dict:
+        # não leva referências aos textos para outro processo
+        _materialize_snippets(self, SNIPPETS_ALL)
+        return self.__dict__
 
     def to_row(self, index: int, zip_name: str) -> list[str]:
         row = []
@@ -418,6 +889,116 @@ class ExtractionResult:
         return row
 
 
+class TextView:
+    """Visões derivadas de um texto (minúsculas, linhas limpas e offsets), calculadas sob demanda uma única vez."""
+
+    __slots__ = ("text", "_lower", "_lines", "_line_offsets", "_label_lines", "_label_hits", "_identifiers")
+
+    def __init__(self, text: str) -> None:
+        self.text = text or ""
+        self._lower: str | None = None
+        self._lines: list[str] | None = None
+        self._line_offsets: list[int] | None = None
+        self._label_lines: list[tuple[int, str, str]] | None = None
+        self._label_hits: dict[tuple[str, ...], LabelHit | None] = {}
+        self._identifiers: list[IdentifierHit] | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.text)
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def identifiers(self) -> list["IdentifierHit"]:
+        """Números SEI/CNJ/administrativos do texto (``_scan_identifiers``)."""
+        if self._identifiers is None:
+            self._identifiers = _scan_identifiers(self.text)
+        return self._identifiers
+
+    @property
+    def lines(self) -> list[str]:
+        """Mesmo resultado de ``_prepare_lines(text)``."""
+        if self._lines is None:
+            self._index_lines()
+        return self._lines
+
+    @property
+    def line_offsets(self) -> list[int]:
+        """Offset (em ``text``) do início de cada item de ``lines``."""
+        if self._line_offsets is None:
+            self._index_lines()
+        return self._line_offsets
+
+    def _index_lines(self) -> None:
+        lines: list[str] = []
+        offsets: list[int] = []
+        pos = 0
+        for raw in self.text.splitlines(keepends=True):
+            stripped = raw.strip()
+            if stripped:
+                lines.append(stripped)
+                offsets.append(pos + len(raw) - len(raw.lstrip()))
+            pos += len(raw)
+        self._lines = lines
+        self._line_offsets = offsets
+
+
+@dataclass(frozen=True)
+class IdentifierHit:
+    """Identificador achado por ``_scan_identifiers``: ``kind`` é ``sei``, ``cnj`` ou ``admin``; ``raw`` ainda sem normalizar."""
+
+    kind: str
+    start: int
+    end: int
+    raw: str
+
+
+def _scan_identifiers(text: str) -> list[IdentifierHit]:
+    """Todos os identificadores do texto numa varredura só, na ordem dos trechos numéricos.
+
+    Mesmos matches de ``finditer`` de cada padrão no texto inteiro: nenhum match
+    atravessa a borda de um trecho e os padrões não olham para trás.
+    """
+    hits: list[IdentifierHit] = []
+    for span in IDENTIFIER_SPAN_PATTERN.finditer(text):
+        lo, hi = span.span()
+        size = hi - lo
+        if size >= 25:
+            for match in PROCESSO_NUM_PATTERN.finditer(text, lo, hi):
+                hits.append(IdentifierHit("cnj", match.start(), match.end(), match.group(0)))
+        if size >= 15:
+            for match in PROCESSO_SEI_PATTERN.finditer(text, lo, hi):
+                if not _has_cnj_tail(text, match.end()):
+                    hits.append(IdentifierHit("sei", match.start(), match.end(), match.group(0)))
+            for match in PROCESSO_SEI_LOOSE_PATTERN.finditer(text, lo, hi):
+                hits.append(IdentifierHit("sei", match.start(), match.end(), _format_sei_from_groups(match.groups())))
+        if size >= 10:
+            for match in PROCESSO_ADMIN_PATTERN.finditer(text, lo, hi):
+                hits.append(IdentifierHit("admin", match.start(), match.end(), match.group(0)))
+        for match in PROCESSO_ADMIN_LEGACY_PATTERN.finditer(text, lo, hi):
+            if len(_normalize_digits(match.group(0))) >= 7:
+                hits.append(IdentifierHit("admin", match.start(), match.end(), match.group(0)))
+    return hits
+
+
+@dataclass(frozen=True)
+class LabelHit:
+    """Linha ``rótulo: valor`` encontrada pelo scanner (``start``/``end`` do valor no texto)."""
+
+    value: str
+    line: int
+    start: int
+    end: int
+
+
+def _as_view(text: "str | TextView | None") -> TextView:
+    return text if isinstance(text, TextView) else TextView(text or "")
+
+
 @dataclass
 class DocumentText:
     name: str
@@ -430,6 +1011,13 @@ class DocumentText:
     cnj_display: dict[str, str] = field(default_factory=dict)
     importance: int = 1
     bucket: DocumentBucket = DocumentBucket.OUTRO
+    _view: TextView | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def view(self) -> TextView:
+        if self._view is None or self._view.text is not self.text:
+            self._view = TextView(self.text)
+        return self._view
 
     @property
     def has_ids(self) -> bool:
@@ -517,42 +1105,62 @@ def _expected_sei_numbers(zip_name: str) -> tuple[Set[str], dict[str, str]]:
     return normalized, display
 
 
-def _build_documents(sources: list[dict[str, str]]) -> list[DocumentText]:
-    documents: list[DocumentText] = []
-    for src in sources:
-        text = src["text"]
-        sei_numbers = _extract_sei_numbers(text)
-        judicial_numbers = {_normalize_judicial_number(match) for match in PROCESSO_NUM_PATTERN.findall(text)}
-        admin_numbers = _extract_admin_candidates(text)
-        cnj_counts, cnj_context, cnj_display = _extract_cnj_metadata(text)
-        importance = _document_importance(src["name"], text)
-        documents.append(
-            DocumentText(
-                name=src["name"],
-                text=text,
-                sei_numbers=sei_numbers,
-                judicial_numbers=judicial_numbers,
-                admin_numbers=admin_numbers,
-                cnj_counts=cnj_counts,
-                cnj_context=cnj_context,
-                cnj_display=cnj_display,
-                importance=importance,
-                bucket=src.get("bucket", DocumentBucket.OUTRO),
-            )
-        )
-    return documents
+def _build_document(name: str, text: str, bucket: DocumentBucket = DocumentBucket.OUTRO) -> DocumentText:
+    """Documento só com os identificadores (SEI/CNJ/administrativo) usados no filtro de relevância."""
+    view = TextView(text)
+    sei_numbers: Set[str] = set()
+    judicial_numbers: Set[str] = set()
+    admin_numbers: Set[str] = set()
+    for hit in view.identifiers:
+        if hit.kind == "sei":
+            sei_numbers.add(_normalize_sei_number(hit.raw))
+        elif hit.kind == "cnj":
+            judicial_numbers.add(_normalize_judicial_number(hit.raw))
+        else:
+            admin_numbers.add(_normalize_digits(hit.raw))
+    return DocumentText(
+        name=name,
+        text=text,
+        sei_numbers=sei_numbers,
+        judicial_numbers=judicial_numbers,
+        admin_numbers=admin_numbers,
+        bucket=bucket,
+        _view=view,
+    )
 
 
-def _extract_sei_numbers(text: str) -> Set[str]:
-    numbers: Set[str] = set()
-    for match in PROCESSO_SEI_PATTERN.finditer(text):
-        if _has_cnj_tail(text, match.end()):
-            continue
-        numbers.add(_normalize_sei_number(match.group(0)))
-    for loose in PROCESSO_SEI_LOOSE_PATTERN.finditer(text):
-        formatted = _format_sei_from_groups(loose.groups())
-        numbers.add(_normalize_sei_number(formatted))
-    return numbers
+def _fill_document_metadata(doc: DocumentText) -> DocumentText:
+    """Contagens/contexto de CNJ e importância: só os documentos aceitos precisam."""
+    doc.cnj_counts, doc.cnj_context, doc.cnj_display = _extract_cnj_metadata(doc.view)
+    doc.importance = _document_importance(doc.name, doc.text)
+    return doc
+
+
+def _iter_bucket_documents(
+    handles: list[LazyDocument],
+    context: ProcessContext,
+    result: ExtractionResult,
+) -> Iterator[DocumentText]:
+    """Documentos na ordem de leitura (bucket, depois prioridade), convertidos um a um.
+
+    Ao fim de cada bucket consulta ``_should_expand_bucket`` com o estado já
+    atualizado pelo consumidor; se não precisar expandir, os buckets seguintes
+    nem têm o texto extraído. Os handles consumidos são descartados, então o
+    texto de um documento ignorado pode ser liberado logo em seguida.
+    """
+    by_bucket: dict[DocumentBucket, list[LazyDocument]] = {bucket: [] for bucket in BUCKET_ORDER}
+    for handle in reversed(handles):
+        by_bucket.setdefault(handle.bucket, []).append(handle)
+    handles = []
+    for index, bucket in enumerate(BUCKET_ORDER):
+        pending = by_bucket.pop(bucket, [])
+        while pending:
+            handle = pending.pop()
+            text = handle.text
+            if text:
+                yield _build_document(handle.name, text, handle.bucket)
+        if index == len(BUCKET_ORDER) - 1 or not _should_expand_bucket(bucket, context, result):
+            return
 
 
 def _has_cnj_tail(text: str, end_index: int) -> bool:
@@ -560,17 +1168,6 @@ def _has_cnj_tail(text: str, end_index: int) -> bool:
     return bool(re.match(r"\.\d{4}", tail))
 
 
-def _extract_admin_candidates(text: str) -> Set[str]:
-    numbers: Set[str] = set()
-    for match in PROCESSO_ADMIN_PATTERN.findall(text):
-        numbers.add(_normalize_digits(match))
-    for match in PROCESSO_ADMIN_LEGACY_PATTERN.findall(text):
-        digits = _normalize_digits(match)
-        if len(digits) >= 7:
-            numbers.add(digits)
-    return numbers
-
-
 def _numbers_match(a: str, b: str) -> bool:
     if not a or not b:
         return False
@@ -697,38 +1294,67 @@ def _result_to_audit_entry(zip_name: str, result: ExtractionResult, run_id: str)
         "documents": documents,
         "fields": fields,
         "observations": list(result.observations),
+        **({"regex_slow": result.regex_slow} if result.regex_slow else {}),
     }
 
 
-def _append_audit_entries(path: Path, items: list[tuple[str, ExtractionResult]], run_id: str) -> None:
-    if not items:
-        return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        for zip_name, result in items:
-            entry = _result_to_audit_entry(zip_name, result, run_id)
-            handle.write(json.dumps(entry, ensure_ascii=False))
-            handle.write("\n")
+def _audit_shard_dir(audit_path: Path) -> Path:
+    """Diretório com os JSONL de auditoria por worker (``<run>.sources.d/``)."""
+    return audit_path.parent / f"{audit_path.stem}.d"
+
+
+def _write_audit_shard(shard_dir: Path, zip_name: str, result: ExtractionResult, run_id: str) -> None:
+    """Worker: acrescenta a linha de auditoria do ZIP ao shard do próprio processo."""
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(_result_to_audit_entry(zip_name, result, run_id), ensure_ascii=False) + "\n"
+    # uma única escrita por linha: shards sobrevivem a quedas sem linhas pela metade
+    with (shard_dir / f"worker-{os.getpid()}.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write(line)
+
+
+def _merge_audit_shards(audit_path: Path) -> int:
+    """Concatena os shards no JSONL da execução (sem reprocessar o JSON) e os remove."""
+    shard_dir = _audit_shard_dir(audit_path)
+    if not shard_dir.exists():
+        return 0
+    shards = sorted(shard_dir.glob("*.jsonl"))
+    if shards:
+        audit_path.parent.mkdir(parents=True, exist_ok=True)
+        with audit_path.open("ab") as out:
+            for shard in shards:
+                with shard.open("rb") as src:
+                    shutil.copyfileobj(src, out)
+                shard.unlink()
+    try:
+        shard_dir.rmdir()
+    except OSError:
+        pass
+    return len(shards)
 
 
-def _extract_cnj_metadata(text: str) -> tuple[dict[str, int], dict[str, int], dict[str, str]]:
+def _extract_cnj_metadata(text: str | TextView) -> tuple[dict[str, int], dict[str, int], dict[str, str]]:
+    view = _as_view(text)
+    text = view.text
     counts: dict[str, int] = {}
     context_scores: dict[str, int] = {}
     display: dict[str, str] = {}
-    lower_text = text.lower()
-    for match in PROCESSO_NUM_PATTERN.finditer(text):
-        raw = match.group(0)
+    lower_text = view.lower
+    text_len = len(text)
+    for hit in view.identifiers:
+        if hit.kind != "cnj":
+            continue
+        raw = hit.raw
         norm = _normalize_judicial_number(raw)
         if not norm:
             continue
         display.setdefault(norm, raw)
         counts[norm] = counts.get(norm, 0) + 1
-        start = max(0, match.start() - 120)
-        end = min(len(text), match.end() + 120)
-        snippet = lower_text[start:end]
+        # busca na janela de ``lower_text`` sem recortar a substring
+        start = max(0, hit.start - 120)
+        end = min(text_len, hit.end + 120)
         bonus = 0
         for keyword in CNJ_CONTEXT_KEYWORDS:
-            if keyword in snippet:
+            if lower_text.find(keyword, start, end) >= 0:
                 bonus += 1
         context_scores[norm] = context_scores.get(norm, 0) + bonus
     return counts, context_scores, display
@@ -739,67 +1365,77 @@ def _document_importance(name: str, text: str) -> int:
     return max(1, 20 - priority)
 
 
-def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionResult:
+def extract_from_text(text: str | TextView, combined: str, source_doc: str) -> ExtractionResult:
     res = ExtractionResult(data={})
-    lookup_text = text  # combinado não é mais usado
+    view = _as_view(text)  # combinado não é mais usado
+    lookup_text = view.text
     if not lookup_text:
         res.observations.append("Sem texto legível no ZIP")
         return res
 
-    lines = _prepare_lines(lookup_text)
-    doc_origin = _classify_arbitration_doc(source_doc, lookup_text)
+    lines = view.lines
+    doc_origin = _classify_arbitration_doc(source_doc, view)
 
-    cnj_raw = _find_first(PROCESSO_NUM_PATTERN, lookup_text)
+    with _regex_guard(res, "PROCESSO_NUM_PATTERN", source_doc):
+        cnj_raw = _find_first(PROCESSO_NUM_PATTERN, lookup_text)
     processo_cnj = _sanitize_cnj(cnj_raw)
-    _set_field(res, "PROCESSO Nº", processo_cnj, source_doc, pattern="processo_regex", context_text=lookup_text)
+    _set_field(res, "PROCESSO Nº", processo_cnj, source_doc, pattern="processo_regex", context_text=view)
     _validate_cnj(cnj_raw, processo_cnj, res)
-    _set_field(res, "PROCESSO ADMIN. Nº", _extract_admin_number(lookup_text), source_doc, pattern="admin_regex", context_text=lookup_text)
-    _set_field(res, "JUÍZO", _find_first(JUÍZO_PATTERN, lookup_text), source_doc, pattern="juizo_regex", context_text=lookup_text)
-    _set_field(res, "COMARCA", _find_first(COMARCA_PATTERN, lookup_text), source_doc, pattern="comarca_regex", context_text=lookup_text)
+    _set_field(res, "PROCESSO ADMIN. Nº", _extract_admin_number(lookup_text), source_doc, pattern="admin_regex", context_text=view)
+    with _regex_guard(res, "JUÍZO_PATTERN", source_doc):
+        juizo = _find_first(JUÍZO_PATTERN, lookup_text)
+    _set_field(res, "JUÍZO", juizo, source_doc, pattern="juizo_regex", context_text=view)
+    with _regex_guard(res, "COMARCA_PATTERN", source_doc):
+        comarca = _find_first(COMARCA_PATTERN, lookup_text)
+    _set_field(res, "COMARCA", comarca, source_doc, pattern="comarca_regex", context_text=view)
 
     if not res.data.get("JUÍZO"):
-        req_line = _line_value(lines, ("juízo", "vara"))
-        if req_line:
-            _set_field(res, "JUÍZO", req_line, source_doc, pattern="juizo_line", context_text=lookup_text, weight=0.9)
+        req_hit = _line_hit(view, JUIZO_LINE_LABELS)
+        if req_hit and req_hit.value:
+            _set_field(res, "JUÍZO", req_hit.value, source_doc, pattern="juizo_line", context_text=view, weight=0.9, hit=req_hit)
     if not res.data.get("JUÍZO"):
         juizo_requerente = _juizo_from_requerente(lines)
         if juizo_requerente:
-            _set_field(res, "JUÍZO", juizo_requerente, source_doc, pattern="juizo_requerente", context_text=lookup_text, weight=0.85)
+            _set_field(res, "JUÍZO", juizo_requerente, source_doc, pattern="juizo_requerente", context_text=view, weight=0.85)
 
     if not res.data.get("COMARCA"):
         comarca = _extract_comarca(res.data.get("JUÍZO", ""))
         if not comarca:
             comarca = _extract_comarca(lookup_text)
         if comarca:
-            _set_field(res, "COMARCA", comarca, source_doc, pattern="comarca_from_juizo", context_text=lookup_text, weight=0.9)
+            _set_field(res, "COMARCA", comarca, source_doc, pattern="comarca_from_juizo", context_text=view, weight=0.9)
 
-    promovente, promovido = _extract_partes(lines, lookup_text)
+    with _regex_guard(res, "PARTES_REGEX", source_doc):
+        promovente, promovido = _extract_partes(view, lookup_text)
     if promovente:
-        _set_field(res, "PROMOVENTE", promovente, source_doc, pattern="partes_regex", context_text=lookup_text)
+        _set_field(res, "PROMOVENTE", promovente, source_doc, pattern="partes_regex", context_text=view)
     else:
-        _set_field(res, "PROMOVENTE", _line_value(lines, PROMOVENTE_LABELS), source_doc, pattern="promovente_labels", context_text=lookup_text, weight=0.9)
+        hit = _line_hit(view, PROMOVENTE_LABELS)
+        _set_field(res, "PROMOVENTE", hit.value if hit else "", source_doc, pattern="promovente_labels", context_text=view, weight=0.9, hit=hit)
     if promovido:
-        _set_field(res, "PROMOVIDO", promovido, source_doc, pattern="partes_regex", context_text=lookup_text)
+        _set_field(res, "PROMOVIDO", promovido, source_doc, pattern="partes_regex", context_text=view)
     else:
-        _set_field(res, "PROMOVIDO", _line_value(lines, PROMOVIDO_LABELS), source_doc, pattern="promovido_labels", context_text=lookup_text, weight=0.9)
+        hit = _line_hit(view, PROMOVIDO_LABELS)
+        _set_field(res, "PROMOVIDO", hit.value if hit else "", source_doc, pattern="promovido_labels", context_text=view, weight=0.9, hit=hit)
 
     perito_info = _extract_perito_info(lines)
     if perito_info.nome:
-        _set_field(res, "PERITO", perito_info.nome, source_doc, pattern="perito_info", context_text=lookup_text)
+        _set_field(res, "PERITO", perito_info.nome, source_doc, pattern="perito_info", context_text=view)
     if perito_info.documento:
-        _set_field(res, "CPF/CNPJ", perito_info.documento, source_doc, pattern="perito_info", context_text=lookup_text)
+        _set_field(res, "CPF/CNPJ", perito_info.documento, source_doc, pattern="perito_info", context_text=view)
     if perito_info.especialidade:
-        _set_field(res, "ESPECIALIDADE", perito_info.especialidade, source_doc, pattern="perito_info", context_text=lookup_text, weight=1.1)
+        _set_field(res, "ESPECIALIDADE", perito_info.especialidade, source_doc, pattern="perito_info", context_text=view, weight=1.1)
     else:
-        _set_field(res, "ESPECIALIDADE", _line_value(lines, ESPECIALIDADE_LABELS), source_doc, pattern="especialidade_labels", context_text=lookup_text, weight=0.95)
+        hit = _line_hit(view, ESPECIALIDADE_LABELS)
+        _set_field(res, "ESPECIALIDADE", hit.value if hit else "", source_doc, pattern="especialidade_labels", context_text=view, weight=0.95, hit=hit)
 
     # Interessado: Nome – Perito(a) Profissão – email (se existir)
     if not perito_info.nome or not res.data.get("ESPECIALIDADE"):
-        int_info = _extract_interessado_info(lookup_text)
+        int_info = _extract_interessado_info(view)
         if int_info.nome and not res.data.get("PERITO"):
-            _set_field(res, "PERITO", int_info.nome, source_doc, pattern="interessado", context_text=lookup_text, weight=0.85)
+            _set_field(res, "PERITO", int_info.nome, source_doc, pattern="interessado", context_text=view, weight=0.85)
         if int_info.especialidade and not res.data.get("ESPECIALIDADE"):
-            _set_field(res, "ESPECIALIDADE", int_info.especialidade, source_doc, pattern="interessado", context_text=lookup_text, weight=1.15)
+            _set_field(res, "ESPECIALIDADE", int_info.especialidade, source_doc, pattern="interessado", context_text=view, weight=1.15)
         # usar especialidade para sugerir espécie
         if int_info.especialidade and not res.data.get("ESPÉCIE DE PERÍCIA"):
             alias_entry = _match_alias(int_info.especialidade)
@@ -808,7 +1444,7 @@ def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionRe
                     res,
                     alias_entry.get("DESCRICAO", int_info.especialidade),
                     source_doc,
-                    context_text=lookup_text,
+                    context_text=view,
                     weight=1.2,
                     matched_entry=alias_entry,
                 )
@@ -820,7 +1456,7 @@ def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionRe
                 res,
                 alias_entry.get("DESCRICAO", ""),
                 source_doc,
-                context_text=lookup_text,
+                context_text=view,
                 weight=1.3,
                 matched_entry=alias_entry,
             )
@@ -831,7 +1467,7 @@ def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionRe
                 res,
                 entry.get("DESCRICAO", res.data.get("ESPECIALIDADE", "")),
                 source_doc,
-                context_text=lookup_text,
+                context_text=view,
                 weight=1.2,
                 matched_entry=entry,
             )
@@ -839,11 +1475,25 @@ def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionRe
     # 2) Rótulos de espécie/natureza no documento (desativado a pedido)
     allow_label_species = False
     if allow_label_species and not res.data.get("ESPÉCIE DE PERÍCIA"):
-        especie = _extract_especie_from_text(lines, lookup_text)
+        especie = _extract_especie_from_text(view, view)
         if especie:
-            _apply_species_mapping(res, especie, source_doc, context_text=lookup_text, weight=1.0)
+            _apply_species_mapping(res, especie, source_doc, context_text=view, weight=1.0)
+
+    fator_hit = _line_hit(view, FATOR_LABELS)
+    fator = fator_hit.value if fator_hit else ""
+    if not fator:
+        fator = _find_after_labels(view, FATOR_LABELS, max_len=50)
+    if fator and not res.data.get("Fator"):
+        _set_field(res, "Fator", fator, source_doc, pattern="fator_label", context_text=view, weight=0.8, hit=fator_hit)
+
+    val_tab_hit = _line_hit(view, VALOR_TABELA_LABELS)
+    val_tab = val_tab_hit.value if val_tab_hit else ""
+    if not val_tab:
+        val_tab = _find_after_labels(view, VALOR_TABELA_LABELS, max_len=80)
+    if val_tab and not res.data.get("Valor Tabelado Anexo I - Tabela I"):
+        _set_field(res, "Valor Tabelado Anexo I - Tabela I", val_tab, source_doc, pattern="valor_tabelado", context_text=view, weight=0.8, hit=val_tab_hit)
 
-    # Fallback por Fator ou Valor Tabelado (menor peso)
+    # Fallback por Fator ou Valor Tabelado (menor peso), depois de lidos do próprio documento
     if not res.data.get("ESPÉCIE DE PERÍCIA"):
         entry = _guess_species_from_values(res)
         if entry:
@@ -851,33 +1501,26 @@ def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionRe
                 res,
                 entry.get("DESCRICAO", ""),
                 source_doc,
-                context_text=lookup_text,
+                context_text=view,
                 weight=0.8,
                 matched_entry=entry,
             )
 
-    fator = _line_value(lines, FATOR_LABELS)
-    if not fator:
-        fator = _find_after_labels(lookup_text, FATOR_LABELS, max_len=50)
-    if fator and not res.data.get("Fator"):
-        _set_field(res, "Fator", fator, source_doc, pattern="fator_label", context_text=lookup_text, weight=0.8)
-
-    val_tab = _line_value(lines, VALOR_TABELA_LABELS)
-    if not val_tab:
-        val_tab = _find_after_labels(lookup_text, VALOR_TABELA_LABELS, max_len=80)
-    if val_tab and not res.data.get("Valor Tabelado Anexo I - Tabela I"):
-        _set_field(res, "Valor Tabelado Anexo I - Tabela I", val_tab, source_doc, pattern="valor_tabelado", context_text=lookup_text, weight=0.8)
-
-    valor_arbitrado = _line_value(lines, VALOR_ARBITRADO_LABELS)
+    valor_hit = _line_hit(view, VALOR_ARBITRADO_LABELS)
+    valor_arbitrado = valor_hit.value if valor_hit else ""
     if not valor_arbitrado:
         valor_arbitrado = _first_currency(lines, keywords=("honor", "perícia", "perito"))
-    _record_arbitration_value(res, valor_arbitrado, source_doc, lookup_text, doc_origin=doc_origin)
+    _record_arbitration_value(res, valor_arbitrado, source_doc, view, doc_origin=doc_origin, hit=valor_hit)
 
-    _set_field(res, "CHECAGEM", _line_value(lines, CHECAGEM_LABELS) or _find_after_labels(lookup_text, CHECAGEM_LABELS, 40), source_doc, pattern="checagem", context_text=lookup_text, weight=0.8)
+    checagem_hit = _line_hit(view, CHECAGEM_LABELS)
+    _set_field(res, "CHECAGEM", (checagem_hit.value if checagem_hit else "") or _find_after_labels(view, CHECAGEM_LABELS, 40), source_doc, pattern="checagem", context_text=view, weight=0.8, hit=checagem_hit)
+    autorizacao_hit = _line_hit(view, DATA_AUTORIZACAO_LABELS)
+    data_autorizacao = (autorizacao_hit.value if autorizacao_hit else "") or _find_after_labels(view, DATA_AUTORIZACAO_LABELS, 60)
     if doc_origin:
         weight_adiant = 1.1 if doc_origin == "CM" else 1.0
-        data_adiant = _line_value(lines, DATA_ADIANTAMENTO_LABELS) or _find_after_labels(
-            lookup_text, DATA_ADIANTAMENTO_LABELS, 40
+        adiant_hit = _line_hit(view, DATA_ADIANTAMENTO_LABELS)
+        data_adiant = (adiant_hit.value if adiant_hit else "") or _find_after_labels(
+            view, DATA_ADIANTAMENTO_LABELS, 40
         )
         _set_field(
             res,
@@ -885,11 +1528,13 @@ def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionRe
             data_adiant,
             source_doc,
             pattern=f"data_adiantamento_{doc_origin.lower()}",
-            context_text=lookup_text,
+            context_text=view,
             weight=weight_adiant,
+            hit=adiant_hit,
         )
-        checagem_adiant = _line_value(lines, CHECAGEM_ADIANT_LABELS) or _find_after_labels(
-            lookup_text, CHECAGEM_ADIANT_LABELS, 40
+        checagem_adiant_hit = _line_hit(view, CHECAGEM_ADIANT_LABELS)
+        checagem_adiant = (checagem_adiant_hit.value if checagem_adiant_hit else "") or _find_after_labels(
+            view, CHECAGEM_ADIANT_LABELS, 40
         )
         _set_field(
             res,
@@ -897,38 +1542,38 @@ def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionRe
             checagem_adiant,
             source_doc,
             pattern=f"checagem_adiant_{doc_origin.lower()}",
-            context_text=lookup_text,
+            context_text=view,
             weight=weight_adiant,
+            hit=checagem_adiant_hit,
         )
         _set_field(
             res,
             "Data da Autorização da Despesa",
-            _line_value(lines, DATA_AUTORIZACAO_LABELS) or _find_after_labels(
-                lookup_text, DATA_AUTORIZACAO_LABELS, 60
-            ),
+            data_autorizacao,
             source_doc,
             pattern=f"autorizacao_despesa_{doc_origin.lower()}",
-            context_text=lookup_text,
+            context_text=view,
             weight=weight_adiant,
+            hit=autorizacao_hit,
         )
     else:
         _set_field(
             res,
             "Data da Autorização da Despesa",
-            _line_value(lines, DATA_AUTORIZACAO_LABELS) or _find_after_labels(
-                lookup_text, DATA_AUTORIZACAO_LABELS, 60
-            ),
+            data_autorizacao,
             source_doc,
             pattern="autorizacao_despesa",
-            context_text=lookup_text,
+            context_text=view,
             weight=0.7,
+            hit=autorizacao_hit,
         )
-    _set_field(res, "SALDO A RECEBER", _line_value(lines, SALDO_LABELS) or _find_after_labels(lookup_text, SALDO_LABELS, 60), source_doc, pattern="saldo", context_text=lookup_text, weight=0.7)
+    saldo_hit = _line_hit(view, SALDO_LABELS)
+    _set_field(res, "SALDO A RECEBER", (saldo_hit.value if saldo_hit else "") or _find_after_labels(view, SALDO_LABELS, 60), source_doc, pattern="saldo", context_text=view, weight=0.7, hit=saldo_hit)
 
-    requisicao = _find_label_date(lookup_text, ["data da requisição", "data do requerimento", "campina grande", "joão pessoa", "patos", "sousa"])
-    _set_field(res, "DATA DA REQUISIÇÃO", requisicao, source_doc, pattern="data_requisicao", context_text=lookup_text)
+    requisicao = _find_label_date(view, REQUISICAO_DATE_LABELS)
+    _set_field(res, "DATA DA REQUISIÇÃO", requisicao, source_doc, pattern="data_requisicao", context_text=view)
 
-    _set_field(res, "R$", res.data.get("VALOR ARBITRADO", ""), source_doc, pattern="valor_arbitrado", context_text=lookup_text)
+    _set_field(res, "R$", res.data.get("VALOR ARBITRADO", ""), source_doc, pattern="valor_arbitrado", context_text=view)
     percent_value = _extract_percentage(lookup_text) if doc_origin else ""
     _set_field(
         res,
@@ -936,7 +1581,7 @@ def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionRe
         percent_value,
         source_doc,
         pattern=f"percentual_{doc_origin.lower()}" if doc_origin else "percentual",
-        context_text=lookup_text,
+        context_text=view,
         weight=0.6 if not doc_origin else (1.0 if doc_origin == "DE" else 1.1),
     )
 
@@ -948,6 +1593,37 @@ def extract_from_text(text: str, combined: str, source_doc: str) -> ExtractionRe
     return res
 
 
+def configure_regex_budget(ms: float) -> None:
+    """Tempo máximo (ms) de cada regex por documento antes de reportar (0 desativa). Propaga via ambiente."""
+    os.environ["SEI_REGEX_BUDGET_MS"] = str(max(0.0, ms))
+
+
+def _regex_budget() -> float:
+    try:
+        return float(os.getenv("SEI_REGEX_BUDGET_MS", "250")) / 1000
+    except ValueError:
+        return 0.25
+
+
+@contextmanager
+def _regex_guard(result: ExtractionResult, name: str, source_doc: str):
+    """Mede o bloco e registra em ``result.regex_slow`` (e no log) quando passa do orçamento.
+
+    Só reporta: o ``re`` não pode ser interrompido no meio de uma busca.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        budget = _regex_budget()
+        if budget and elapsed > budget:
+            result.regex_slow.append(
+                {"pattern": name, "document": source_doc, "ms": round(elapsed * 1000, 1)}
+            )
+            LOGGER.warning("Regex lenta: %s em %s (%.0f ms)", name, source_doc, elapsed * 1000)
+
+
 def _find_first(pattern: re.Pattern, text: str) -> str:
     if not text:
         return ""
@@ -991,23 +1667,24 @@ def _set_field(
     page: int | None = None,
     start: int | None = None,
     end: int | None = None,
-    context_text: str | None = None,
+    context_text: str | TextView | None = None,
     weight: float = 1.0,
+    hit: LabelHit | None = None,
 ) -> None:
     if not value:
         return
-    if (start is None or end is None) and context_text:
-        start, end = _locate_value(context_text, value)
-    candidate = {
-        "value": value,
-        "source": source_doc,
-        "pattern": pattern,
-        "snippet": snippet or _compute_snippet(context_text, start, end) or value,
-        "page": page,
-        "start": start,
-        "end": end,
-        "weight": weight,
-    }
+    if context_text is not None and not isinstance(context_text, TextView):
+        context_text = TextView(context_text)
+    if hit is not None and hit.value == value and start is None and end is None:
+        # posição já conhecida pelo scanner de rótulos; evita novo _locate_value
+        start, end = hit.start, hit.end
+    candidate = Candidate(value, source_doc, pattern, snippet, page, start, end, weight)
+    if not snippet:
+        if context_text:
+            # snippet/offsets só são calculados se alguém for ler (ver _materialize_snippets)
+            candidate._ctx = context_text
+        else:
+            candidate.snippet = value
     result.candidates.setdefault(field, []).append(candidate)
     current_meta = result.meta.get(field)
     current_weight = current_meta.get("weight", 0) if current_meta else 0
@@ -1040,11 +1717,13 @@ def _format_admin_number(digits: str) -> str:
     return f"{digits[:4]}.{digits[4:]}"
 
 
-def _find_after_labels(raw_text: str, labels: Iterable[str], max_len: int = 200) -> str:
+def _find_after_labels(raw_text: str | TextView, labels: Iterable[str], max_len: int = 200) -> str:
     """Captura texto logo após um rótulo (ex.: 'Espécie de Perícia: ...')."""
+    view = _as_view(raw_text)
+    raw_text = view.text
     if not raw_text:
         return ""
-    lowered = raw_text.lower()
+    lowered = view.lower
     for label in labels:
         lbl = label.lower()
         idx = lowered.find(lbl)
@@ -1064,18 +1743,55 @@ def _find_after_labels(raw_text: str, labels: Iterable[str], max_len: int = 200)
     return ""
 
 
-def _compute_snippet(text: str | None, start: int | None, end: int | None, radius: int = 80) -> str:
+_SNIPPET_REF = "_ctx"
+SNIPPETS_ALL = "all"
+SNIPPETS_CHOSEN = "chosen"
+SNIPPETS_NONE = "none"
+
+
+def _resolve_snippet(candidate: Candidate) -> None:
+    view = candidate._ctx
+    if view is None:
+        return
+    candidate._ctx = None
+    start, end = candidate.start, candidate.end
+    if start is None or end is None:
+        start, end = _locate_value(view, candidate.value)
+        candidate.start, candidate.end = start, end
+    candidate.snippet = _compute_snippet(view, start, end) or candidate.value
+
+
+def _materialize_snippets(result: ExtractionResult, mode: str = SNIPPETS_ALL) -> None:
+    """Resolve snippet/start/end pendentes e solta as referências aos textos.
+
+    ``all``: todos os candidatos (planilhas Fontes/Candidatos, QA); ``chosen``: só os
+    escolhidos em ``meta`` (JSONL de auditoria); ``none``: apenas descarta as referências.
+    """
+    if mode in (SNIPPETS_ALL, SNIPPETS_CHOSEN):
+        chosen = result.candidates.values() if mode == SNIPPETS_ALL else [result.meta.values()]
+        for entries in chosen:
+            for entry in entries:
+                if isinstance(entry, Candidate):
+                    _resolve_snippet(entry)
+    for entries in result.candidates.values():
+        for entry in entries:
+            entry._ctx = None
+
+
+def _compute_snippet(text: str | TextView | None, start: int | None, end: int | None, radius: int = 80) -> str:
     if text is None or start is None or end is None:
         return ""
+    if isinstance(text, TextView):
+        text = text.text
     begin = max(0, start - radius)
     finish = min(len(text), end + radius)
     return text[begin:finish].replace("\n", " ").strip()
 
 
-def _locate_value(context_text: str | None, value: str) -> tuple[int | None, int | None]:
+def _locate_value(context_text: str | TextView | None, value: str) -> tuple[int | None, int | None]:
     if not context_text or not value:
         return None, None
-    lower_text = context_text.lower()
+    lower_text = _as_view(context_text).lower
     lower_value = value.lower()
     idx = lower_text.find(lower_value)
     if idx != -1:
@@ -1095,7 +1811,57 @@ def _prepare_lines(text: str) -> list[str]:
     return [line.strip() for line in text.splitlines() if line.strip()]
 
 
-def _line_value(lines: Sequence[str], labels: Iterable[str]) -> str:
+def _label_lines(view: TextView) -> list[tuple[int, str, str]]:
+    """Passada única: linhas com algum rótulo conhecido antes do primeiro ':'."""
+    if view._label_lines is None:
+        found: list[tuple[int, str, str]] = []
+        search = _LABEL_PREFILTER.search
+        for idx, line in enumerate(view.lines):
+            if ":" not in line:
+                continue
+            lower = line.lower()
+            if search(lower, 0, lower.find(":")):
+                found.append((idx, line, lower))
+        view._label_lines = found
+    return view._label_lines
+
+
+def _line_hit(view: TextView, labels: Iterable[str]) -> LabelHit | None:
+    """Primeira linha que casa com o grupo (mesma regra de ``_line_value``), com posição do valor."""
+    key = tuple(labels)
+    if key in view._label_hits:
+        return view._label_hits[key]
+    lowered = [label.lower() for label in key]
+    if not all(lbl in _SCANNED_LABELS for lbl in lowered):
+        lines: Iterable[tuple[int, str, str]] = ((idx, line, line.lower()) for idx, line in enumerate(view.lines))
+    else:
+        lines = _label_lines(view)
+    hit = None
+    for idx, line, lower in lines:
+        if any(_label_matches(line, lower, lbl) for lbl in lowered):
+            colon = line.index(":")
+            after = line[colon + 1 :]
+            start = view.line_offsets[idx] + colon + 1 + len(after) - len(after.lstrip())
+            value = _clean_after_colon(line)
+            hit = LabelHit(value=value, line=idx, start=start, end=start + len(value))
+            break
+    view._label_hits[key] = hit
+    return hit
+
+
+def _label_matches(line: str, lower: str, lbl: str) -> bool:
+    if lower.startswith(lbl + ":"):
+        return True
+    if lbl in lower and ":" in line:
+        before = line.split(":", 1)[0]
+        return lbl in before.lower()
+    return False
+
+
+def _line_value(lines: Sequence[str] | TextView, labels: Iterable[str]) -> str:
+    if isinstance(lines, TextView):
+        hit = _line_hit(lines, labels)
+        return hit.value if hit else ""
     for line in lines:
         lower = line.lower()
         for label in labels:
@@ -1179,13 +1945,14 @@ def _extract_perito_info(lines: Sequence[str]) -> PeritoInfo:
     return info
 
 
-def _extract_interessado_info(text: str) -> PeritoInfo:
+def _extract_interessado_info(text: str | TextView) -> PeritoInfo:
     info = PeritoInfo()
-    if not text:
+    view = _as_view(text)
+    if not view.text:
         return info
     # Procura linha com "Interessado:" ou "Interessada:"
     alvo = None
-    for line in text.splitlines():
+    for line in view.lines:
         lower = line.lower()
         if "interessado" in lower:
             alvo = line
@@ -1210,21 +1977,37 @@ def _extract_interessado_info(text: str) -> PeritoInfo:
         info.profissao = prof
     return info
 
-def _extract_partes(lines: Sequence[str], text: str) -> tuple[str, str]:
-    match = PARTES_REGEX.search(text)
+
+def _search_partes(text: str) -> re.Match | None:
+    """PARTES_REGEX a partir de cada âncora, limitado a PARTES_WINDOW caracteres (+ o resto da linha).
+
+    Evita o ``.*?`` com DOTALL percorrendo o documento inteiro a cada tentativa.
+    """
+    for anchor in PARTES_ANCHOR_PATTERN.finditer(text):
+        start = anchor.start()
+        limit = start + PARTES_WINDOW + PARTES_LINE_TAIL
+        end = text.find("\n", start + PARTES_WINDOW, limit)
+        match = PARTES_REGEX.match(text, start, limit if end == -1 else end)
+        if match:
+            return match
+    return None
+
+
+def _extract_partes(lines: Sequence[str] | TextView, text: str) -> tuple[str, str]:
+    match = _search_partes(text)
     if match:
         prom = _strip_juizo_tokens(_clean_entity(match.group("promovente")))
         prov = _strip_juizo_tokens(_clean_entity(match.group("promovido")))
         return prom, prov
 
-    prom = _first_entity(lines, [PROMOVENTE_LABELS + ("autor", "parte autora", "exequente"), ("requerente",)])
-    prov = _first_entity(lines, [PROMOVIDO_LABELS + ("réu", "executado", "parte ré"), ("requerido", "parte ré" )])
+    prom = _first_entity(lines, PROMOVENTE_ENTITY_GROUPS)
+    prov = _first_entity(lines, PROMOVIDO_ENTITY_GROUPS)
     if not prov:
         prov = _extract_promovido_from_phrases(text)
     return prom, prov
 
 
-def _first_entity(lines: Sequence[str], label_groups: Iterable[Iterable[str]]) -> str:
+def _first_entity(lines: Sequence[str] | TextView, label_groups: Iterable[Iterable[str]]) -> str:
     for labels in label_groups:
         value = _strip_juizo_tokens(_line_value(lines, labels))
         if value:
@@ -1286,17 +2069,19 @@ def _extract_promovido_from_phrases(text: str) -> str:
     return ""
 
 
-def _extract_especie_from_text(lines: Sequence[str], text: str) -> str:
+def _extract_especie_from_text(lines: Sequence[str] | TextView, text: str | TextView) -> str:
+    view = _as_view(text)
+    text = view.text
     specie = _line_value(lines, ESPECIE_LABELS)
     if specie:
         return specie
     specie = _line_value(lines, NATUREZA_LABELS)
     if specie:
         return specie
-    specie = _find_after_labels(text, ESPECIE_LABELS)
+    specie = _find_after_labels(view, ESPECIE_LABELS)
     if specie:
         return specie
-    specie = _find_after_labels(text, NATUREZA_LABELS)
+    specie = _find_after_labels(view, NATUREZA_LABELS)
     if specie:
         return specie
     match = ESPECIE_INLINE_PATTERN.search(text)
@@ -1327,17 +2112,23 @@ def _guess_species_from_values(result: ExtractionResult) -> dict[str, str] | Non
         if entry:
             return entry
     val = result.data.get("Valor Tabelado Anexo I - Tabela I")
-    num = _parse_currency_value(val) if val else None
-    if num is not None and HONORARIOS_TABLE:
-        matches = [
-            row for row in HONORARIOS_TABLE
-            if _parse_currency_value(row.get("VALOR")) == num
-        ]
+    cents = _currency_cents(val) if val else None
+    if cents is not None:
+        matches = _honorarios_by_value(cents)
         if len(matches) == 1:
             return matches[0]
     return None
 
 
+def _honorarios_by_value(cents: int, tolerance: int = 0) -> list[dict[str, str]]:
+    """Linhas da tabela com VALOR em ``cents`` ± ``tolerance`` centavos (ordem de valor, depois da tabela)."""
+    if not tolerance:
+        return list(HONORARIOS_BY_CENTS.get(cents, ()))
+    lo = bisect.bisect_left(_HONORARIOS_CENTS, cents - tolerance)
+    hi = bisect.bisect_right(_HONORARIOS_CENTS, cents + tolerance)
+    return [row for value in _HONORARIOS_CENTS[lo:hi] for row in HONORARIOS_BY_CENTS[value]]
+
+
 def _match_honorarios_entry(label: str) -> dict[str, str] | None:
     if not label or not HONORARIOS_INDEX:
         return None
@@ -1346,13 +2137,8 @@ def _match_honorarios_entry(label: str) -> dict[str, str] | None:
         return None
     if norm in HONORARIOS_INDEX:
         return HONORARIOS_INDEX[norm]
-    candidates = difflib.get_close_matches(norm, HONORARIOS_INDEX.keys(), n=1, cutoff=0.75)
-    if candidates:
-        return HONORARIOS_INDEX[candidates[0]]
-    for key, row in HONORARIOS_INDEX.items():
-        if norm in key or key in norm:
-            return row
-    return None
+    key = _honorarios_matcher().lookup(norm)
+    return HONORARIOS_INDEX[key] if key is not None else None
 
 
 def _match_alias(text: str | None) -> dict[str, str] | None:
@@ -1361,10 +2147,8 @@ def _match_alias(text: str | None) -> dict[str, str] | None:
     norm = _normalize_key(text)
     if not norm:
         return None
-    for alias in HONORARIOS_ALIAS:
-        if any(keyword in norm for keyword in alias["keywords"]):
-            return alias["entry"]
-    return None
+    index = _alias_automaton().first_match(norm)
+    return HONORARIOS_ALIAS[index]["entry"] if index is not None else None
 
 
 NOISE_SPECIE_PATTERNS = [
@@ -1427,25 +2211,10 @@ def _format_currency_value(value: str | float) -> str:
     return f"R$ {value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
 
 
-def _parse_currency_value(value: str | float) -> float | None:
-    """Converte 'R$ 1.234,56' ou '1234,56' para float."""
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value)
-    text = re.sub(r"[Rr]\\$\\s*", "", text)
-    text = text.replace(".", "").replace(",", ".")
-    try:
-        return float(text)
-    except Exception:
-        return None
-
-
-def _classify_arbitration_doc(source_doc: str, context_text: str | None) -> str:
+def _classify_arbitration_doc(source_doc: str, context_text: str | TextView | None) -> str:
     """Retorna 'CM', 'DE' ou ''."""
     name = (source_doc or "").lower()
-    text = (context_text or "").lower() if context_text else ""
+    text = _as_view(context_text).lower if context_text else ""
     if "assessoria do conselho da magistratura" in text and "certid" in text:
         return "CM"
     if "conselho da magistratura" in text or "conselho da magistratura" in name:
@@ -1467,9 +2236,12 @@ def _record_arbitration_value(
     result: ExtractionResult,
     value: str,
     source_doc: str,
-    context_text: str | None,
+    context_text: str | TextView | None,
     doc_origin: str | None = None,
+    hit: LabelHit | None = None,
 ) -> None:
+    if context_text is not None and not isinstance(context_text, TextView):
+        context_text = TextView(context_text)
     doc_type = doc_origin or _classify_arbitration_doc(source_doc, context_text)
     if doc_type == "CM":
         _set_field(
@@ -1479,6 +2251,7 @@ def _record_arbitration_value(
             source_doc,
             pattern="valor_arbitrado_cm",
             context_text=context_text,
+            hit=hit,
             weight=1.2,
         )
         _set_field(
@@ -1488,6 +2261,7 @@ def _record_arbitration_value(
             source_doc,
             pattern="valor_arbitrado_cm",
             context_text=context_text,
+            hit=hit,
             weight=1.2,
         )
     elif doc_type == "DE":
@@ -1498,6 +2272,7 @@ def _record_arbitration_value(
             source_doc,
             pattern="valor_arbitrado_de",
             context_text=context_text,
+            hit=hit,
             weight=1.1,
         )
         _set_field(
@@ -1507,6 +2282,7 @@ def _record_arbitration_value(
             source_doc,
             pattern="valor_arbitrado_de",
             context_text=context_text,
+            hit=hit,
             weight=1.1,
         )
     elif doc_type == "JZ":
@@ -1517,6 +2293,7 @@ def _record_arbitration_value(
             source_doc,
             pattern="valor_arbitrado_jz",
             context_text=context_text,
+            hit=hit,
             weight=1.05,
         )
         _set_field(
@@ -1526,6 +2303,7 @@ def _record_arbitration_value(
             source_doc,
             pattern="valor_arbitrado_jz",
             context_text=context_text,
+            hit=hit,
             weight=1.05,
         )
     else:
@@ -1536,6 +2314,7 @@ def _record_arbitration_value(
             source_doc,
             pattern="valor_arbitrado",
             context_text=context_text,
+            hit=hit,
             weight=1.0,
         )
 
@@ -1544,7 +2323,7 @@ def _apply_species_mapping(
     result: ExtractionResult,
     especie: str,
     source_doc: str,
-    context_text: str | None = None,
+    context_text: str | TextView | None = None,
     weight: float = 1.0,
     matched_entry: dict[str, str] | None = None,
 ) -> None:
@@ -1610,9 +2389,10 @@ def _first_currency(lines: Sequence[str], keywords: Iterable[str] | None = None)
     return ""
 
 
-def _find_label_date(text: str, labels: Iterable[str]) -> str:
-    lines = _prepare_lines(text)
-    candidate = _line_value(lines, labels)
+def _find_label_date(text: str | TextView, labels: Iterable[str]) -> str:
+    view = _as_view(text)
+    text = view.text
+    candidate = _line_value(view, labels)
     if candidate:
         parsed = _parse_date(candidate)
         return parsed
@@ -1623,7 +2403,60 @@ def _find_label_date(text: str, labels: Iterable[str]) -> str:
     return ""
 
 
+PT_MONTHS = {
+    "jan": 1, "janeiro": 1, "fev": 2, "fevereiro": 2, "mar": 3, "marco": 3, "março": 3,
+    "abr": 4, "abril": 4, "mai": 5, "maio": 5, "jun": 6, "junho": 6, "jul": 7, "julho": 7,
+    "ago": 8, "agosto": 8, "set": 9, "setembro": 9, "out": 10, "outubro": 10,
+    "nov": 11, "novembro": 11, "dez": 12, "dezembro": 12,
+}
+DATE_NUMERIC_EXACT = re.compile(r"\s*(\d{1,2})([./-])(\d{1,2})\2(\d{2}|\d{4})\s*")
+DATE_MONTH_NAME_EXACT = re.compile(
+    r"\s*(\d{1,2})(?:º|o)?\s*(?:de\s+|[-/.]\s*)?([a-zç]+)\.?\s*(?:de\s+|[-/.]\s*)?(\d{2}|\d{4})\s*",
+    re.IGNORECASE,
+)
+_DATE_INFO = date_parser.parserinfo(dayfirst=True)  # mesma virada de século (2 dígitos) do dateutil
+
+
+def _fast_date(raw: str) -> tuple[int, int, int] | None:
+    """(dia, mês, ano) para 'dd/mm/aaaa', 'dd.mm.aa' e '27 de maio de 2025'; None = deixar para o dateutil.
+
+    A forma numérica segue a resolução do dateutil com ``dayfirst=True``: dia/mês, salvo
+    quando o primeiro campo cabe como mês e o segundo não (13+).
+    """
+    match = DATE_NUMERIC_EXACT.fullmatch(raw)
+    if match:
+        first, second = int(match.group(1)), int(match.group(3))
+        if first > 31:
+            return None
+        day, month = (first, second) if first > 12 or second <= 12 else (second, first)
+        year_text = match.group(4)
+    else:
+        match = DATE_MONTH_NAME_EXACT.fullmatch(raw)
+        if not match:
+            return None
+        month = PT_MONTHS.get(match.group(2).lower())
+        if month is None:
+            return None
+        day = int(match.group(1))
+        year_text = match.group(3)
+    year = int(year_text)
+    if len(year_text) == 2:
+        year = _DATE_INFO.convertyear(year)
+    elif year < 1000:
+        return None
+    return day, month, year
+
+
+@lru_cache(maxsize=4096)
 def _parse_date(raw: str) -> str:
+    fast = _fast_date(raw)
+    if fast is not None:
+        day, month, year = fast
+        try:
+            datetime(year, month, day)
+        except ValueError:
+            return ""
+        return f"{day:02d}/{month:02d}/{year}"
     try:
         dt = date_parser.parse(raw, dayfirst=True, fuzzy=True)
         return dt.strftime("%d/%m/%Y")
@@ -1789,45 +2622,146 @@ def _validate_result(result: ExtractionResult, context: ProcessContext, zip_name
         obs_add("Promovido ausente; revisar manualmente")
 
 
-def process_zip(zip_path: Path) -> ExtractionResult:
-    sources, combined = gather_texts(zip_path)
-    documents = _build_documents(sources)
+_MEMO_VERSION: str | None = None
+
+
+def _memo_version() -> str:
+    """Versão das regras por documento + CRC das tabelas de honorários/aliases."""
+    global _MEMO_VERSION
+    if _MEMO_VERSION is None:
+        base_dir = Path(__file__).resolve().parents[2] / "docs"
+        crc = 0
+        for name in ("tabela_honorarios.csv", "honorarios_aliases.json"):
+            try:
+                crc = zlib.crc32((base_dir / name).read_bytes(), crc)
+            except OSError:
+                continue
+        _MEMO_VERSION = f"{DOCUMENT_RULES_VERSION}-{crc:08x}"
+    return _MEMO_VERSION
+
+
+def _partial_to_memo(result: ExtractionResult, source_doc: str) -> dict | None:
+    chosen: dict[str, int] = {}
+    candidates: dict[str, list[list]] = {}
+    for field_name, entries in result.candidates.items():
+        meta = result.meta.get(field_name)
+        rows = []
+        for idx, entry in enumerate(entries):
+            if entry is meta:
+                chosen[field_name] = idx
+            rows.append([getattr(entry, key) for key in Candidate.KEYS])
+        candidates[field_name] = rows
+    if len(chosen) != len(result.meta):
+        return None  # meta fora dos candidatos: não dá para reconstruir
+    return {
+        "source": source_doc,
+        "data": result.data,
+        "observations": result.observations,
+        "sources": result.sources,
+        "candidates": candidates,
+        "chosen": chosen,
+    }
+
+
+def _partial_from_memo(
+    payload: dict,
+    source_doc: str,
+    view: TextView | None,
+    views: Mapping[str, TextView] | None = None,
+) -> ExtractionResult:
+    """Reconstrói um resultado serializado; ``views`` (por fonte) substitui ``view`` no --replay."""
+    cached_source = payload["source"]
+
+    def _rename(source: str) -> str:
+        return source_doc if source == cached_source and source_doc else source
+
+    result = ExtractionResult(
+        data=dict(payload["data"]),
+        observations=list(payload["observations"]),
+        sources={field_name: _rename(source) for field_name, source in payload["sources"].items()},
+    )
+    for field_name, rows in payload["candidates"].items():
+        entries = []
+        for value, source, pattern, snippet, page, start, end, weight in rows:
+            entry = Candidate(value, _rename(source), pattern, snippet, page, start, end, weight)
+            if snippet is None:
+                # mesmo texto: o snippet continua sendo resolvido sob demanda
+                entry._ctx = views.get(entry.source) if views is not None else view
+            entries.append(entry)
+        result.candidates[field_name] = entries
+    for field_name, idx in payload["chosen"].items():
+        result.meta[field_name] = result.candidates[field_name][idx]
+    return result
+
+
+def _extract_document(view: TextView, source_doc: str) -> ExtractionResult:
+    """``extract_from_text`` com memo persistente por (texto, origem, versão das regras)."""
+    memo = get_extraction_memo()
+    if memo is None or not view:
+        return extract_from_text(view, view.text, source_doc)
+    key = memo_key(view.text, _classify_arbitration_doc(source_doc, view), _memo_version())
+    try:
+        payload = memo.get(key)
+    except Exception:
+        payload = None
+    if payload is not None:
+        return _partial_from_memo(payload, source_doc, view)
+    result = extract_from_text(view, view.text, source_doc)
+    payload = _partial_to_memo(result, source_doc)
+    if payload is not None:
+        try:
+            memo.put(key, payload)
+        except Exception:
+            pass
+    return result
+
+
+@dataclass
+class ZipCollection:
+    """Estado de um ZIP após a extração por documento e antes da consolidação."""
+
+    zip_path: str
+    result: ExtractionResult
+    context: ProcessContext
+    documents_found: bool = False
+    bucket_counts: dict[str, int] = field(default_factory=dict)
+    empty: bool = False
+
+
+def _collect_zip(zip_path: Path, max_candidates: int | None = None) -> ZipCollection:
+    """Fase 1: abre o ZIP, escolhe os documentos e extrai/mescla os candidatos de cada um."""
+    handles, combined = gather_documents(zip_path)
     expected_sei, expected_display = _expected_sei_numbers(zip_path.name)
     context = ProcessContext(expected_sei=expected_sei, expected_sei_display=expected_display)
     result = ExtractionResult()
-    if not documents:
+    if not handles:
         result.observations.append("Nenhum documento legível no ZIP")
-        return result
+        return ZipCollection(str(zip_path), result, context, empty=True)
 
     accepted_texts: list[str] = []
     bucket_counts: dict[str, int] = {bucket.value: 0 for bucket in BUCKET_ORDER}
-    documents_by_bucket: dict[DocumentBucket, list[DocumentText]] = {bucket: [] for bucket in BUCKET_ORDER}
-    for doc in documents:
-        documents_by_bucket.setdefault(doc.bucket, []).append(doc)
-
-    for index, bucket in enumerate(BUCKET_ORDER):
-        docs = documents_by_bucket.get(bucket, [])
-        for doc in docs:
-            if _document_is_relevant(doc, context):
-                context.register(doc)
-                accepted_texts.append(doc.text)
-                partial = extract_from_text(doc.text, doc.text, doc.name)
-                result.update_from(partial, doc.name)
-                bucket_counts[bucket.value] = bucket_counts.get(bucket.value, 0) + 1
-            else:
-                context.skipped_docs.append(doc.name)
-
-        is_last_bucket = index == len(BUCKET_ORDER) - 1
-        if is_last_bucket:
-            break
-        if not _should_expand_bucket(bucket, context, result):
-            break
+    documents_found = False
+
+    # o gerador fica com a única referência aos handles (libera os textos já consumidos)
+    stream = _iter_bucket_documents(handles, context, result)
+    del handles
+    for doc in stream:
+        documents_found = True
+        if _document_is_relevant(doc, context):
+            context.register(_fill_document_metadata(doc))
+            accepted_texts.append(doc.text)
+            partial = _extract_document(doc.view, doc.name)
+            result.update_from(partial, doc.name)
+            _trim_candidates(result, max_candidates)
+            bucket_counts[doc.bucket.value] = bucket_counts.get(doc.bucket.value, 0) + 1
+        else:
+            context.skipped_docs.append(doc.name)
 
     if not context.accepted_docs:
         if context.expected_sei:
             result.observations.append("Sem documento compatível com o processo SEI no ZIP")
-        elif not documents:
-            result.observations.append("Nenhum documento legível no ZIP")
+        elif not documents_found:
+            _add_obs(result, "Nenhum documento legível no ZIP")
 
     fallback_text = "\n".join(accepted_texts)
     if not result.data.get("PROCESSO Nº") and fallback_text:
@@ -1841,10 +2775,22 @@ def process_zip(zip_path: Path) -> ExtractionResult:
         if extra > 0:
             msg += f" (+{extra})"
         result.observations.append(msg)
+    return ZipCollection(str(zip_path), result, context, documents_found, bucket_counts)
+
 
+def _finish_zip(
+    collection: ZipCollection,
+    snippets: str = SNIPPETS_ALL,
+    max_candidates: int | None = None,
+) -> ExtractionResult:
+    """Fase 2: consolidação entre documentos (não relê o ZIP; usada também pelo --replay)."""
+    result, context = collection.result, collection.context
+    if collection.empty:
+        return result
+    zip_name = Path(collection.zip_path).name
     if context.accepted_docs:
         _select_primary_cnj(result, context)
-    _apply_admin_fallback(result, context, zip_path.name)
+    _apply_admin_fallback(result, context, zip_name)
     _fill_requisition_date(result, context)
     _fill_species_from_laudos(result, context.accepted_docs)
     _refine_medical_specialty_from_council(result, context.accepted_docs)
@@ -1852,17 +2798,100 @@ def process_zip(zip_path: Path) -> ExtractionResult:
     _apply_contabilidade_heuristics(result)
     _apply_engineering_heuristics(result)
     _ensure_honorarios_completion(result)
-    text_for_validation = "\n".join(accepted_texts)
-    _validate_result(result, context, zip_path.name, text_for_validation)
-
-    if not sources:
-        result.observations.append("Nenhum documento legível no ZIP")
-    result.meta.setdefault("_bucket_usage", {"counts": bucket_counts})
-    result.meta["_zip_path"] = str(zip_path)
+    text_for_validation = "\n".join(doc.text for doc in context.accepted_docs)
+    _validate_result(result, context, zip_name, text_for_validation)
+
+    if not collection.documents_found:
+        _add_obs(result, "Nenhum documento legível no ZIP")
+    result.meta.setdefault("_bucket_usage", {"counts": collection.bucket_counts})
+    result.meta["_zip_path"] = collection.zip_path
+    _trim_candidates(result, max_candidates)
+    _materialize_snippets(result, snippets)
     result.meta["_documents"] = _summarize_documents(context, result)
     return result
 
 
+def process_zip(
+    zip_path: Path,
+    snippets: str = SNIPPETS_ALL,
+    max_candidates: int | None = None,
+    replay_store: ReplayStore | None = None,
+) -> ExtractionResult:
+    collection = _collect_zip(zip_path, max_candidates)
+    if replay_store is not None:
+        # grava o estado pré-consolidação antes que as heurísticas o modifiquem
+        payload = _collection_to_replay(collection)
+        if payload is not None:
+            replay_store.put(zip_path.name, payload)
+        else:
+            LOGGER.warning("%s: estado pré-consolidação não serializável; fora do --replay", zip_path.name)
+    return _finish_zip(collection, snippets, max_candidates)
+
+
+def _collection_to_replay(collection: ZipCollection) -> dict | None:
+    result, context = collection.result, collection.context
+    partial = _partial_to_memo(result, "")
+    if partial is None:
+        return None
+    docs = [
+        {
+            "name": doc.name,
+            "text": doc.text,
+            "bucket": doc.bucket.value,
+            "sei": sorted(doc.sei_numbers),
+            "judicial": sorted(doc.judicial_numbers),
+            "admin": sorted(doc.admin_numbers),
+            "cnj_counts": doc.cnj_counts,
+            "cnj_context": doc.cnj_context,
+            "cnj_display": doc.cnj_display,
+            "importance": doc.importance,
+        }
+        for doc in context.accepted_docs
+    ]
+    return {
+        "zip_path": collection.zip_path,
+        "partial": partial,
+        "documents": docs,
+        "skipped": list(context.skipped_docs),
+        "documents_found": collection.documents_found,
+        "bucket_counts": collection.bucket_counts,
+        "empty": collection.empty,
+    }
+
+
+def _collection_from_replay(payload: dict) -> ZipCollection:
+    zip_path = payload["zip_path"]
+    expected_sei, expected_display = _expected_sei_numbers(Path(zip_path).name)
+    context = ProcessContext(expected_sei=expected_sei, expected_sei_display=expected_display)
+    views: dict[str, TextView] = {}
+    for item in payload["documents"]:
+        doc = DocumentText(
+            name=item["name"],
+            text=item["text"],
+            sei_numbers=set(item["sei"]),
+            judicial_numbers=set(item["judicial"]),
+            admin_numbers=set(item["admin"]),
+            cnj_counts=item["cnj_counts"],
+            cnj_context=item["cnj_context"],
+            cnj_display=item["cnj_display"],
+            importance=item["importance"],
+            bucket=DocumentBucket(item["bucket"]),
+        )
+        context.register(doc)
+        views.setdefault(doc.name, doc.view)
+    context.skipped_docs = list(payload["skipped"])
+    views["combined"] = TextView("\n".join(doc.text for doc in context.accepted_docs))
+    result = _partial_from_memo(payload["partial"], "", None, views)
+    return ZipCollection(
+        zip_path,
+        result,
+        context,
+        documents_found=payload["documents_found"],
+        bucket_counts=payload["bucket_counts"],
+        empty=payload["empty"],
+    )
+
+
 def _select_primary_cnj(result: ExtractionResult, context: ProcessContext) -> None:
     totals: dict[str, dict[str, object]] = {}
     for doc in context.accepted_docs:
@@ -1966,7 +2995,7 @@ def _fill_requisition_date(result: ExtractionResult, context: ProcessContext) ->
     date, doc = _extract_requisition_date_from_docs(context.accepted_docs)
     if date:
         source = doc.name if doc else "context"
-        context_text = doc.text if doc else None
+        context_text = doc.view if doc else None
         _set_field(
             result,
             "DATA DA REQUISIÇÃO",
@@ -1984,9 +3013,9 @@ def _fill_species_from_laudos(result: ExtractionResult, documents: List[Document
     for doc in documents:
         if "laudo" not in doc.name.lower():
             continue
-        specie = _extract_especie_from_text(_prepare_lines(doc.text), doc.text)
+        specie = _extract_especie_from_text(doc.view, doc.view)
         if specie:
-            _apply_species_mapping(result, specie, doc.name, context_text=doc.text, weight=0.85)
+            _apply_species_mapping(result, specie, doc.name, context_text=doc.view, weight=0.85)
             if result.data.get("Fator") and result.data.get("Valor Tabelado Anexo I - Tabela I"):
                 break
 
@@ -1994,8 +3023,7 @@ def _fill_species_from_laudos(result: ExtractionResult, documents: List[Document
 def _apply_medical_heuristics(result: ExtractionResult, documents: List[DocumentText]) -> None:
     if result.data.get("ESPÉCIE DE PERÍCIA"):
         return
-    text_pool = " ".join(doc.text for doc in documents) if documents else ""
-    text_lower = text_pool.lower()
+    text_lower = " ".join(doc.view.lower for doc in documents) if documents else ""
     prom = (result.data.get("PROMOVIDO") or "").lower()
 
     inter_keywords = (
@@ -2031,8 +3059,7 @@ def _refine_medical_specialty_from_council(result: ExtractionResult, documents:
         return
     if not ("med" in esp or "odont" in esp):
         return
-    text_pool = " ".join(doc.text for doc in documents) if documents else ""
-    text_lower = text_pool.lower()
+    text_lower = " ".join(doc.view.lower for doc in documents) if documents else ""
     if "cro" in text_lower:
         result.data["ESPECIALIDADE"] = "Odontologia"
     elif "crm" in text_lower or "cfm" in text_lower:
@@ -2201,13 +3228,22 @@ def _export_sem_especie_evidences(audit_path: Path | None, zip_dir: Path) -> Non
         "imóvel",
     ]
 
-    def extract_text(name: str, data: bytes) -> str:
-        if name.lower().endswith(".pdf") and PdfReader:
+    def extract_text(zf: zipfile.ZipFile, member: str) -> str:
+        info = zf.getinfo(member)
+        if member.lower().endswith(".pdf"):
+            # Mesmo texto (cacheado) usado na extração; PyPDF2 só como fallback.
             try:
-                reader = PdfReader(BytesIO(data))
+                return read_member_text(zf, info, "pdf")
+            except Exception:
+                pass
+            if not PdfReader:
+                return ""
+            try:
+                reader = PdfReader(BytesIO(zf.read(info)))
                 return " ".join(page.extract_text() or "" for page in reader.pages)
             except Exception:
                 return ""
+        data = zf.read(info)
         try:
             return data.decode("utf-8", errors="ignore")
         except Exception:
@@ -2241,8 +3277,7 @@ def _export_sem_especie_evidences(audit_path: Path | None, zip_dir: Path) -> Non
                         member = name if name in names else next((n for n in names if n.endswith(name)), None)
                         if not member:
                             continue
-                        data = zf.read(member)
-                        text = extract_text(name, data)
+                        text = extract_text(zf, member)
                         text = clean_text(text)
                         tlow = text.lower()
                         hits = [k for k in keywords if k in tlow]
@@ -2281,17 +3316,19 @@ def _export_sem_especie_evidences(audit_path: Path | None, zip_dir: Path) -> Non
 
 def _extract_requisition_date_from_docs(docs: List[DocumentText]) -> tuple[str, DocumentText | None]:
     for doc in docs[:3]:
-        date = _date_near_cities(doc.text)
+        date = _date_near_cities(doc.view)
         if date:
             return date, doc
-        date = _date_near_requisition(doc.text)
+        date = _date_near_requisition(doc.view)
         if date:
             return date, doc
     return "", None
 
 
-def _date_near_cities(text: str) -> str:
-    lower = text.lower()
+def _date_near_cities(text: str | TextView) -> str:
+    view = _as_view(text)
+    text = view.text
+    lower = view.lower
     for city in CITY_KEYWORDS:
         start = 0
         while True:
@@ -2329,8 +3366,10 @@ def _first_date_in_text(text: str) -> str:
     return ""
 
 
-def _date_near_requisition(text: str) -> str:
-    lower = text.lower()
+def _date_near_requisition(text: str | TextView) -> str:
+    view = _as_view(text)
+    text = view.text
+    lower = view.lower
     for match in DATE_NUMERIC_PATTERN.finditer(text):
         snippet = lower[max(0, match.start() - 80) : match.end() + 80]
         if _snippet_has_keyword(snippet):
@@ -2378,30 +3417,68 @@ def _norm_name(value: str | None) -> str:
     )
 
 
-def _load_perito_catalog() -> tuple[set[str], dict[str, str]]:
-    """Retorna (nomes_normalizados, mapa_nome_normalizado->CPF) do catálogo externo."""
-    global _PERITO_NAME_SET
+@dataclass(frozen=True)
+class _PeritoIndex:
+    """Catálogo de peritos pré-indexado (imutável; um por processo)."""
+
+    names: frozenset[str]
+    name_to_cpf: Mapping[str, str]
+    first_cpf: Mapping[str, str]
+    mtime_ns: int | None = None
+
+    def cpf_for(self, norm: str) -> str:
+        return self.name_to_cpf.get(norm, "") or self.first_cpf.get(norm, "")
+
+
+_PERITO_INDEX: _PeritoIndex | None = None
+
+
+def _build_perito_index(mtime_ns: int | None) -> _PeritoIndex:
     names: set[str] = set()
     name_to_cpf: dict[str, str] = {}
+    first_cpf: dict[str, str] = {}
     try:
-        if _PERITO_CATALOG_PATH.exists():
-            import pandas as pd
-
+        if mtime_ns is not None:
             df = pd.read_csv(_PERITO_CATALOG_PATH)
             if "PERITO" in df.columns:
-                for _, row in df.iterrows():
-                    n = _norm_name(str(row.get("PERITO", "")))
+                cpfs = df["CPF/CNPJ"] if "CPF/CNPJ" in df.columns else [""] * len(df)
+                for perito, cpf in zip(df["PERITO"], cpfs):
+                    cpf = str(cpf).strip()
+                    # match exato por nome normalizado (equivale ao antigo apply(_norm_name) == norm)
+                    first_cpf.setdefault(_norm_name(perito), cpf)
+                    n = _norm_name(str(perito))
                     if not n:
                         continue
                     names.add(n)
-                    cpf = str(row.get("CPF/CNPJ", "")).strip()
                     if cpf:
                         name_to_cpf[n] = cpf
     except Exception:
-        names = set()
-        name_to_cpf = {}
-    _PERITO_NAME_SET = names
-    return names, name_to_cpf
+        names, name_to_cpf, first_cpf = set(), {}, {}
+    return _PeritoIndex(
+        names=frozenset(names),
+        name_to_cpf=MappingProxyType(name_to_cpf),
+        first_cpf=MappingProxyType(first_cpf),
+        mtime_ns=mtime_ns,
+    )
+
+
+def _perito_index() -> _PeritoIndex:
+    """Índice do catálogo, recarregado só quando o mtime do CSV muda."""
+    global _PERITO_INDEX, _PERITO_NAME_SET
+    try:
+        mtime_ns = _PERITO_CATALOG_PATH.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if _PERITO_INDEX is None or _PERITO_INDEX.mtime_ns != mtime_ns:
+        _PERITO_INDEX = _build_perito_index(mtime_ns)
+        _PERITO_NAME_SET = set(_PERITO_INDEX.names)
+    return _PERITO_INDEX
+
+
+def _load_perito_catalog() -> tuple[frozenset[str], Mapping[str, str]]:
+    """Retorna (nomes_normalizados, mapa_nome_normalizado->CPF) do catálogo externo."""
+    index = _perito_index()
+    return index.names, index.name_to_cpf
 
 
 def _ensure_comarca_from_juizo(result: "ExtractionResult") -> None:
@@ -2426,14 +3503,9 @@ def _ensure_comarca_from_juizo(result: "ExtractionResult") -> None:
 def _scrub_perito_conflicts(result: "ExtractionResult") -> None:
     """Resolve conflitos de perito, ajusta CPF e corrige comarca."""
 
-    # Catálogo completo para match exato e CPF
-    perito_df = None
-    try:
-        perito_df = pd.read_csv(_PERITO_CATALOG_PATH) if _PERITO_CATALOG_PATH.exists() else None
-    except Exception:
-        perito_df = None
-
-    perito_names, name_to_cpf = _load_perito_catalog()
+    # Catálogo pré-indexado (carregado uma vez por processo) para match exato e CPF
+    index = _perito_index()
+    perito_names = index.names
 
     # 1) Promovente/Promovido não podem ser perito
     for field in ("PROMOVENTE", "PROMOVIDO"):
@@ -2448,11 +3520,7 @@ def _scrub_perito_conflicts(result: "ExtractionResult") -> None:
     if perito_nome:
         norm = _norm_name(perito_nome)
 
-        cat_cpf = name_to_cpf.get(norm, "")
-        if not cat_cpf and perito_df is not None:
-            matches = perito_df[perito_df["PERITO"].apply(_norm_name) == norm]
-            if not matches.empty:
-                cat_cpf = str(matches.iloc[0].get("CPF/CNPJ", "")).strip()
+        cat_cpf = index.cpf_for(norm)
 
         if cat_cpf and cat_cpf != perito_cpf:
             result.data["CPF/CNPJ"] = cat_cpf
@@ -2490,6 +3558,192 @@ def _validate_numeric_fields(result: "ExtractionResult") -> None:
             _add_obs(result, f"{field} inválido (não monetário)")
 
 
+QUARANTINE_BACKEND = "pdfium"
+_STALL_GRACE_SECONDS = 60
+_MAX_RESUBMITS = 2  # reenvios de um ZIP após quedas do pool antes de isolá-lo
+
+
+class ZipTimeoutError(TimeoutError):
+    """Arquivo excedeu o tempo máximo de extração por tarefa."""
+
+
+class _BudgetExpired(BaseException):
+    # BaseException: não é engolida pelos ``except Exception`` da extração
+    pass
+
+
+@contextmanager
+def _time_budget(seconds: float):
+    """Interrompe o bloco após ``seconds`` (SIGALRM; sem efeito fora da thread principal/Unix)."""
+    if seconds <= 0 or not hasattr(signal, "SIGALRM") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def _expire(signum, frame):
+        raise _BudgetExpired()
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _limit_worker_memory(max_mb: int) -> None:
+    """Initializer do pool: limita o espaço de endereçamento do worker (Unix)."""
+    try:
+        import resource
+
+        limit = max_mb * 1024 * 1024
+        _soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except Exception:
+        pass
+
+
+_WORKER_START_LOG = None  # no worker: fila onde cada tarefa avisa que começou
+
+
+def _init_worker(max_mb: int, start_queue) -> None:
+    """Initializer do pool: registra a fila de início de tarefas e aplica o limite de memória."""
+    global _WORKER_START_LOG
+    _WORKER_START_LOG = start_queue
+    if max_mb > 0:
+        _limit_worker_memory(max_mb)
+
+
+def _announce_start(zip_name: str) -> None:
+    if _WORKER_START_LOG is None:
+        return
+    try:
+        _WORKER_START_LOG.put((zip_name, os.getpid(), time.time()))
+    except Exception:
+        pass
+
+
+class _StartLog:
+    """Tarefas que já começaram em algum worker (``nome -> (pid, início)``), avisadas pelo próprio worker.
+
+    ``SimpleQueue`` escreve direto no pipe: o aviso não se perde se o worker morrer logo depois.
+    """
+
+    def __init__(self, context) -> None:
+        self.context = context
+        self.queue = context.SimpleQueue()
+        self.started: dict[str, tuple[int, float]] = {}
+
+    def drain(self) -> dict[str, tuple[int, float]]:
+        while not self.queue.empty():
+            name, pid, started_at = self.queue.get()
+            self.started[name] = (pid, started_at)
+        return self.started
+
+    def forget(self, name: str) -> None:
+        self.started.pop(name, None)
+
+    def close(self) -> None:
+        self.queue.close()
+
+
+def _kill_process(pid: int) -> None:
+    """Mata só o worker indicado (travado fora do alcance do alarme); o pool dele fica quebrado."""
+    try:
+        os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+    except OSError:
+        pass
+
+
+def _describe_failure(exc: BaseException) -> str:
+    if isinstance(exc, BrokenProcessPool):
+        return "worker encerrado abruptamente (crash/memória)"
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _run_isolated(
+    tasks: Sequence[tuple],
+    timeout: float,
+    max_worker_mb: int = 0,
+    parallel: int = 1,
+) -> dict[str, tuple[str, str, dict[str, float]] | BaseException]:
+    """Roda cada tarefa sozinha em um pool de 1 worker (falha de uma não afeta as outras).
+
+    Até ``parallel`` pools ficam ativos ao mesmo tempo; o que passar do prazo tem o worker morto.
+    """
+    outcomes: dict[str, tuple[str, str, dict[str, float]] | BaseException] = {}
+    deadline = timeout + _STALL_GRACE_SECONDS if timeout > 0 else None
+    start_log = _StartLog(_pool_context())
+    pending = list(tasks)
+    active: dict[Future, tuple[str, ProcessPoolExecutor, float]] = {}
+    try:
+        while pending or active:
+            while pending and len(active) < max(1, parallel):
+                task = pending.pop(0)
+                executor = _make_executor(1, max_worker_mb=max_worker_mb, start_log=start_log)
+                active[executor.submit(process_and_save_parquet, *task)] = (task[0], executor, time.monotonic())
+            wait_for = None
+            if deadline is not None:
+                wait_for = max(0.0, min(submitted + deadline for _name, _ex, submitted in active.values()) - time.monotonic())
+            done, _ = wait(active, timeout=wait_for, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in list(active):
+                name, executor, submitted = active[future]
+                if future in done:
+                    try:
+                        outcomes[name] = future.result()
+                    except BaseException as exc:
+                        outcomes[name] = exc
+                elif deadline is not None and now - submitted >= deadline:
+                    started = start_log.drain().get(name)
+                    if started:
+                        _kill_process(started[0])
+                    outcomes[name] = ZipTimeoutError(f"{name}: worker não respondeu em {deadline:.0f}s")
+                else:
+                    continue
+                del active[future]
+                executor.shutdown(wait=False, cancel_futures=True)
+    finally:
+        for _name, executor, _submitted in active.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        start_log.close()
+    return outcomes
+
+
+def _schedule_largest_first(inputs: list[PreparedInput], sizes: Mapping[str, int]) -> list[PreparedInput]:
+    """Ordem LPT: maiores arquivos primeiro (empates mantêm a ordem por nome)."""
+    return sorted(inputs, key=lambda prepared: -sizes.get(prepared.original.name, 0))
+
+
+def _pool_context(max_tasks_per_child: int = 0):
+    """Contexto do pool; com ``max_tasks_per_child`` o ProcessPoolExecutor exige spawn (o default dele nesse caso)."""
+    if max_tasks_per_child > 0 and sys.version_info >= (3, 11):
+        return multiprocessing.get_context("spawn")
+    return multiprocessing.get_context()
+
+
+def _make_executor(
+    workers: int,
+    max_tasks_per_child: int = 0,
+    max_worker_mb: int = 0,
+    start_log: _StartLog | None = None,
+) -> ProcessPoolExecutor:
+    """Pool de workers; com ``max_tasks_per_child`` (Python 3.11+) cada processo é reciclado após N ZIPs.
+
+    Com ``start_log`` cada tarefa avisa quando começa (o pool usa o contexto do log).
+    """
+    kwargs: dict[str, object] = {}
+    if max_worker_mb > 0 or start_log is not None:
+        kwargs["initializer"] = _init_worker
+        kwargs["initargs"] = (max_worker_mb, start_log.queue if start_log else None)
+    if max_tasks_per_child > 0 and sys.version_info >= (3, 11):
+        kwargs["max_tasks_per_child"] = max_tasks_per_child
+    context = start_log.context if start_log else _pool_context(max_tasks_per_child)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, **kwargs)
+
+
 def _load_existing_parquet_names(parquet_dir: Path) -> set[str]:
     """Retorna nomes de ZIP que já possuem parquet salvo."""
     if not parquet_dir.exists():
@@ -2497,12 +3751,92 @@ def _load_existing_parquet_names(parquet_dir: Path) -> set[str]:
     return {p.stem for p in parquet_dir.glob("*.parquet")}
 
 
-def process_and_save_parquet(zip_name: str, resolved_path: str, parquet_dir: str) -> str:
-    """Worker: processa um arquivo e salva parquet (1 arquivo por ZIP)."""
+def _input_record(prepared: PreparedInput, version: str = EXTRACTOR_VERSION) -> tuple[str, int, int, int, str]:
+    """Linha do manifesto: ``(nome, size, mtime_ns, crc do diretório central, versão)``."""
+    path = Path(prepared.resolved)
+    stat = path.stat()
+    return prepared.original.name, stat.st_size, stat.st_mtime_ns, central_directory_crc(path), version
+
+
+def _current_inputs(
+    inputs: Sequence[PreparedInput],
+    manifest: Mapping[str, tuple[int, int, int, str]],
+    parquet_names: set[str],
+    version: str = EXTRACTOR_VERSION,
+) -> tuple[set[str], dict[str, int], list[tuple[str, int, int, int, str]]]:
+    """Separa os inputs cujo parquet está em dia (mesmo conteúdo e mesma versão do extrator).
+
+    Retorna ``(nomes em dia, contagem dos motivos de reextração, linhas do manifesto a atualizar)``;
+    a última lista cobre ZIPs rebaixados idênticos (só o mtime mudou).
+    """
+    current: set[str] = set()
+    reasons: dict[str, int] = {}
+    refreshed: list[tuple[str, int, int, int, str]] = []
+    for prepared in inputs:
+        name = prepared.original.name
+        entry = manifest.get(name)
+        if name not in parquet_names or entry is None:
+            reason = "novo"
+        elif entry[3] != version:
+            reason = "versão do extrator"
+        else:
+            try:
+                stat = Path(prepared.resolved).stat()
+                if (stat.st_size, stat.st_mtime_ns) == (entry[0], entry[1]):
+                    current.add(name)
+                    continue
+                if stat.st_size == entry[0]:
+                    record = _input_record(prepared, version)
+                    if record[3] == entry[2]:
+                        current.add(name)
+                        refreshed.append(record)
+                        continue
+            except OSError:
+                pass
+            reason = "alterado"
+        reasons[reason] = reasons.get(reason, 0) + 1
+    return current, reasons, refreshed
+
+
+def process_and_save_parquet(
+    zip_name: str,
+    resolved_path: str,
+    parquet_dir: str,
+    snippets: str = SNIPPETS_ALL,
+    max_candidates: int | None = None,
+    audit_dir: str | None = None,
+    run_id: str = "",
+    timeout: float = 0,
+    pdf_backend: str | None = None,
+    replay_path: str | None = None,
+) -> tuple[str, str, dict[str, float]]:
+    """Worker: processa um arquivo, salva parquet (1 arquivo por ZIP) e a linha de auditoria.
+
+    Devolve só ``(zip_name, status, tempos)``; o resultado completo não volta ao processo principal.
+    ``timeout`` limita o tempo de extração (levanta ``ZipTimeoutError``); ``pdf_backend``
+    troca o conversor de PDF só durante esta tarefa (status ``degraded``); com ``replay_path``
+    o estado pré-consolidação do ZIP é gravado para o ``--replay``.
+    """
+    _announce_start(zip_name)
+    t0 = time.perf_counter()
     path = Path(resolved_path)
-    result = process_zip(path)
+    previous_backend = set_pdf_backend(pdf_backend) if pdf_backend else None
+    try:
+        with _time_budget(timeout):
+            result = process_zip(
+                path,
+                snippets=snippets,
+                max_candidates=max_candidates,
+                replay_store=_worker_replay_store(replay_path) if replay_path else None,
+            )
+    except _BudgetExpired:
+        raise ZipTimeoutError(f"{zip_name}: extração excedeu {timeout:g}s") from None
+    finally:
+        if previous_backend:
+            set_pdf_backend(previous_backend)
     _scrub_perito_conflicts(result)
     _validate_numeric_fields(result)
+    t1 = time.perf_counter()
     pdir = Path(parquet_dir)
     pdir.mkdir(parents=True, exist_ok=True)
     tmp_path = pdir / f"{zip_name}.parquet.tmp"
@@ -2510,30 +3844,34 @@ def process_and_save_parquet(zip_name: str, resolved_path: str, parquet_dir: str
     df = pd.DataFrame([result.to_row(0, zip_name)], columns=COLUMNS)
     df.to_parquet(tmp_path, index=False)
     tmp_path.replace(final_path)
-    return zip_name, result
+    t2 = time.perf_counter()
+    if audit_dir:
+        _write_audit_shard(Path(audit_dir), zip_name, result, run_id)
+    t3 = time.perf_counter()
+    status = "degraded" if pdf_backend else "ok"
+    return zip_name, status, {"extract": t1 - t0, "parquet": t2 - t1, "audit": t3 - t2}
 
 
 def consolidate_parquets(parquet_dir: Path, excel_path: Path) -> list[Path]:
-    """Consolida todos os parquets existentes em um Excel único.
+    """Materializa o Excel a partir do store consolidado (sincronizado com os parquets).
 
-    Retorna a lista de parquets corrompidos/ignorados.
+    Só os parquets novos/alterados são lidos. Retorna a lista de parquets corrompidos/ignorados.
     """
-    files = sorted(parquet_dir.glob("*.parquet"))
-    if not files:
+    if not parquet_dir.exists():
         return []
-    dfs = []
-    bad_files = []
-    for f in files:
-        try:
-            dfs.append(pd.read_parquet(f))
-        except Exception:
-            bad_files.append(f)
+    with ResultStore.for_parquet_dir(parquet_dir) as store:
+        bad_files = store.sync_parquets(parquet_dir)
+        df_all = store.to_dataframe()
     if bad_files:
         _log(f"Aviso: {len(bad_files)} parquet(s) corrompido(s) ignorado(s): {[p.name for p in bad_files]}")
-    if not dfs:
+    if df_all.empty:
         return bad_files
-    df_all = pd.concat(dfs, ignore_index=True)
+    _write_report(df_all, excel_path)
+    return bad_files
+
 
+def _write_report(df_all: pd.DataFrame, excel_path: Path) -> None:
+    """Aplica os fallbacks de valor, renumera e grava o XLSX final."""
     # Fallback para VALOR ARBITRADO: CM > DE > JZ (somente valor monetário)
     money_re = re.compile(r"r\$\s*[0-9]{1,3}(?:\.[0-9]{3})*,?\d{2}", re.IGNORECASE)
 
@@ -2562,7 +3900,42 @@ def consolidate_parquets(parquet_dir: Path, excel_path: Path) -> list[Path]:
     df_all["Nº DE PERÍCIAS"] = range(1, len(df_all) + 1)
     excel_path.parent.mkdir(parents=True, exist_ok=True)
     df_all.to_excel(excel_path, index=False)
-    return bad_files
+
+
+def _replay_path(run_id: str) -> Path:
+    return LOG_DIR / f"{run_id}.replay.sqlite"
+
+
+_WORKER_REPLAY_STORES: dict[tuple[int, str], ReplayStore] = {}
+
+
+def _worker_replay_store(path: str) -> ReplayStore:
+    key = (os.getpid(), path)
+    store = _WORKER_REPLAY_STORES.get(key)
+    if store is None:
+        store = _WORKER_REPLAY_STORES[key] = ReplayStore(Path(path))
+    return store
+
+
+def replay_run(run_id: str, excel_path: Path) -> int:
+    """Refaz só a consolidação dos ZIPs gravados na execução ``run_id`` e gera um novo XLSX.
+
+    Não abre ZIPs nem roda a extração por documento: parte dos candidatos e
+    metadados de identificadores persistidos pelos workers.
+    """
+    path = _replay_path(run_id)
+    if not path.exists():
+        raise SystemExit(f"Sem dados de replay para run-id {run_id} em {path} (a execução precisa de --replay-store)")
+    rows: list[list[str]] = []
+    with ReplayStore(path) as store:
+        for name, payload in store.items():
+            result = _finish_zip(_collection_from_replay(payload), SNIPPETS_NONE)
+            _scrub_perito_conflicts(result)
+            _validate_numeric_fields(result)
+            rows.append(result.to_row(0, name))
+    if rows:
+        _write_report(pd.DataFrame(rows, columns=COLUMNS), excel_path)
+    return len(rows)
 
 
 def _append_results_to_workbook(
@@ -2748,7 +4121,82 @@ def main() -> None:
         "--checkpoint-interval",
         type=int,
         default=25,
-        help="Quantidade de arquivos processados antes de salvar a planilha/checkpoint.",
+        help="Quantidade de arquivos processados antes de salvar o checkpoint (a planilha é gerada no final).",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=0,
+        help="Máximo de arquivos submetidos ao pool ao mesmo tempo (default=0 -> 2x workers).",
+    )
+    parser.add_argument(
+        "--max-tasks-per-child",
+        type=int,
+        default=200,
+        help="Recicla cada worker após N arquivos (Python 3.11+; 0 desativa).",
+    )
+    parser.add_argument(
+        "--zip-timeout",
+        type=float,
+        default=900,
+        help="Tempo máximo de extração por arquivo, em segundos (default=900; 0 desativa).",
+    )
+    parser.add_argument(
+        "--max-worker-mb",
+        type=int,
+        default=0,
+        help="Limite de memória (espaço de endereçamento) por worker, em MB (Unix; 0 desativa).",
+    )
+    parser.add_argument(
+        "--retry-quarantined",
+        action="store_true",
+        help="Reprocessa os arquivos em quarentena, um por vez, com o backend de PDF degradado (pdfium).",
+    )
+    parser.add_argument(
+        "--regex-budget-ms",
+        type=float,
+        default=250,
+        help="Reporta no log/auditoria as regex que passam de N ms num documento (0 desativa; default=250).",
+    )
+    parser.add_argument(
+        "--pdf-split-pages",
+        type=int,
+        default=0,
+        help="PDFs com pelo menos N páginas são extraídos em faixas por processos auxiliares (0 desativa).",
+    )
+    parser.add_argument(
+        "--pdf-page-workers",
+        type=int,
+        default=4,
+        help="Processos auxiliares por worker para a extração em faixas (default=4).",
+    )
+    parser.add_argument(
+        "--pdf-backend-by-bucket",
+        default="",
+        metavar="BUCKET=BACKEND,...",
+        help="Backend de PDF por bucket para PDFs avulsos (ex.: laudo=pdfium,outro=pdfminer; "
+        "backends: pdfplumber, pdfminer, pypdf2, pdfium). Vazio = pdfplumber em todos.",
+    )
+    parser.add_argument(
+        "--max-candidates",
+        type=int,
+        default=5,
+        help="Candidatos mantidos por campo em cada ZIP (maiores pesos + o escolhido; 0 = todos).",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="RUN_ID",
+        help="Refaz só a consolidação (heurísticas/validações) a partir dos candidatos gravados na execução indicada, sem abrir os ZIPs.",
+    )
+    parser.add_argument(
+        "--replay-store",
+        action="store_true",
+        help="Grava logs/extract/<run-id>.replay.sqlite (candidatos e textos aceitos de cada ZIP), base do --replay.",
+    )
+    parser.add_argument(
+        "--xlsx-only",
+        action="store_true",
+        help="Só (re)gera o XLSX a partir dos resultados já consolidados (parquet/), sem processar arquivos.",
     )
     parser.add_argument(
         "--log-retention-days",
@@ -2780,6 +4228,29 @@ def main() -> None:
 
     if args.resume and args.run_id:
         parser.error("Use apenas --run-id ou --resume, não ambos.")
+    try:
+        bucket_backends = configure_bucket_backends(args.pdf_backend_by_bucket)
+    except ValueError as exc:
+        parser.error(str(exc))
+    # outro mapa de backends gera outros textos: o manifesto do --skip-existing precisa distinguir
+    extractor_version = EXTRACTOR_VERSION
+    if bucket_backends:
+        extractor_version += "+" + ",".join(f"{bucket}={backend}" for bucket, backend in sorted(bucket_backends.items()))
+
+    if args.replay:
+        output = args.output.expanduser()
+        t_replay = time.perf_counter()
+        count = replay_run(args.replay, output)
+        elapsed = time.perf_counter() - t_replay
+        rate = count / elapsed if elapsed > 0 else 0
+        print(f"Replay de {args.replay}: {count} processo(s) em {elapsed:.2f}s ({rate:.0f}/s) -> {output}")
+        return
+
+    if args.xlsx_only:
+        output = args.output.expanduser()
+        bad = consolidate_parquets(output.parent / "parquet", output)
+        print(f"Relatório gerado em {output}" + (f" ({len(bad)} parquet(s) ignorado(s))" if bad else ""))
+        return
 
     if args.resume:
         run_id = args.resume
@@ -2797,6 +4268,7 @@ def main() -> None:
     log_path = _setup_logger(run_id, disable_file_log=no_file_log)
     t_start = _log_phase("Inicialização do logger", t_logger, t_start)
     audit_path = None if args.no_audit_log else LOG_DIR / f"{run_id}.sources.jsonl"
+    replay_path = _replay_path(run_id) if args.replay_store else None
     _log(f"Executando extração (run-id={run_id}) - log: {log_path}")
     zip_paths: list[Path] = []
     pdf_paths: list[Path] = []
@@ -2837,14 +4309,23 @@ def main() -> None:
     output = args.output.expanduser()
     output.parent.mkdir(parents=True, exist_ok=True)
     state_processed = set(state.get("processed_files", []))
+    quarantine: dict[str, str] = dict(state.get("quarantine", {}))
     state["output"] = str(output)
 
     parquet_dir = output.parent / "parquet"
     processed_zips: set[str] = set()
     if args.skip_existing and parquet_dir.exists():
-        processed_zips = _load_existing_parquet_names(parquet_dir)
+        # só pula o que está em dia com o manifesto (tamanho/mtime/CRC do diretório central/versão)
+        with ResultStore.for_parquet_dir(parquet_dir) as store:
+            processed_zips, stale_reasons, refreshed = _current_inputs(
+                prepared_inputs, store.manifest(), _load_existing_parquet_names(parquet_dir), extractor_version
+            )
+            if refreshed:
+                store.record_inputs(refreshed)
         if processed_zips:
-            _log(f"{len(processed_zips)} registro(s) já presentes (parquet); serão ignorados.")
+            _log(f"{len(processed_zips)} registro(s) já presentes e inalterados (parquet); serão ignorados.")
+        if stale_reasons:
+            _log("A (re)extrair: " + " | ".join(f"{reason}: {count}" for reason, count in sorted(stale_reasons.items())))
 
     processed_set = set(processed_zips)
     processed_set.update(state_processed)
@@ -2853,11 +4334,17 @@ def main() -> None:
     skipped = len(prepared_inputs) - len(remaining_inputs)
     if skipped:
         _log(f"Pulando {skipped} arquivo(s) já presentes no relatório.")
+    if quarantine:
+        # quarentenados só voltam pelo passe degradado (--retry-quarantined)
+        remaining_inputs = [entry for entry in remaining_inputs if entry.original.name not in quarantine]
+        _log(f"{len(quarantine)} arquivo(s) em quarentena nesta execução.")
 
     if args.limit:
         remaining_inputs = remaining_inputs[: args.limit]
 
-    if not remaining_inputs:
+    prepared_by_name = {prepared.original.name: prepared for prepared in prepared_inputs}
+    retry_pending = args.retry_quarantined and any(name in prepared_by_name for name in quarantine)
+    if not remaining_inputs and not retry_pending:
         _log("Nenhum arquivo pendente. Nada a fazer.")
         return
 
@@ -2866,24 +4353,54 @@ def main() -> None:
     _log(f"Lista de trabalho: {total_to_process} arquivo(s) | workers={args.workers} | checkpoint a cada {checkpoint_interval}.")
 
     file_sizes = {prepared.original.name: Path(prepared.resolved).stat().st_size for prepared in remaining_inputs}
+    # os ZIPs grandes entram primeiro para não ficarem sozinhos no fim da fila
+    remaining_inputs = _schedule_largest_first(remaining_inputs, file_sizes)
+    workers = max(1, args.workers)
+    # vale também para os workers (propagado pelo ambiente)
+    configure_page_split(args.pdf_split_pages, args.pdf_page_workers)
+    configure_regex_budget(args.regex_budget_ms)
+    max_in_flight = args.max_in_flight if args.max_in_flight > 0 else 2 * workers
     t_phase = _log_phase("Preparar inputs e medir tamanhos pendentes", t_phase, t_start)
     checkpoint_bytes = 0
     checkpoint_start = time.time()
     _print_header(run_id, log_path, total_to_process)
 
-    def consolidate_checkpoint(final: bool = False) -> None:
-        nonlocal checkpoint_bytes, checkpoint_start, pending_results
-        state["processed_files"] = sorted(state_processed)
-        state["last_update"] = datetime.now().isoformat()
-        state["completed"] = final
+    journal = CheckpointJournal(run_id)
+    if not _state_path(run_id).exists():
         _save_state(run_id, state)
-        # consolida todos parquets existentes em Excel
-        bad = consolidate_parquets(parquet_dir, output)
+
+    def consolidate_checkpoint(final: bool = False) -> None:
+        nonlocal checkpoint_bytes, checkpoint_start, pending_names
+        # O(lote): só as linhas novas vão para o journal; o state.json completo só na compactação
+        journal.flush()
+        if final or journal.needs_compaction():
+            state["processed_files"] = sorted(state_processed)
+            state["quarantine"] = dict(sorted(quarantine.items()))
+            state["last_update"] = datetime.now().isoformat()
+            state["completed"] = final
+            journal.compact(state)
+        records = []
+        for name in pending_names:
+            try:
+                records.append(_input_record(prepared_by_name[name], extractor_version))
+            except (KeyError, OSError):
+                continue
+        with ResultStore.for_parquet_dir(parquet_dir) as store:
+            store.record_inputs(records)
+            if not final:
+                # checkpoint: só acrescenta ao store os ZIPs concluídos desde o último lote
+                bad = store.sync_parquets(parquet_dir, pending_names)
+        if final:
+            # materializa o Excel uma única vez, a partir do store consolidado
+            bad = consolidate_parquets(parquet_dir, output)
+        elif bad:
+            _log(f"Aviso: {len(bad)} parquet(s) corrompido(s) ignorado(s): {[p.name for p in bad]}")
+        pending_names = []
         if bad:
             bad_files_total.update([p.name for p in bad])
-        if audit_path and pending_results:
-            _append_audit_entries(audit_path, pending_results, run_id)
-            pending_results = []
+        if final and audit_path:
+            # workers já gravaram seus shards; aqui só concatena (pool encerrado)
+            _merge_audit_shards(audit_path)
         elapsed = time.time() - checkpoint_start
         mbps = (checkpoint_bytes / 1e6) / elapsed if elapsed > 0 else 0
         _log(
@@ -2894,42 +4411,176 @@ def main() -> None:
         checkpoint_start = time.time()
 
     bad_files_total: set[str] = set()
-    pending_results: list[tuple[str, ExtractionResult]] = []
+    pending_names: list[str] = []
+    worker_times: dict[str, float] = {}
 
     first_result_logged = False
+    completed = 0
+
+    def task_args(prepared: PreparedInput, pdf_backend: str | None = None) -> tuple:
+        return (
+            prepared.original.name,
+            str(prepared.resolved),
+            str(parquet_dir),
+            # snippets só são lidos pelo JSONL de auditoria (campos escolhidos)
+            SNIPPETS_CHOSEN if audit_path else SNIPPETS_NONE,
+            args.max_candidates,
+            str(_audit_shard_dir(audit_path)) if audit_path else None,
+            run_id,
+            args.zip_timeout,
+            pdf_backend,
+            str(replay_path) if replay_path else None,
+        )
+
+    def record_outcome(name: str, outcome: tuple[str, str, dict[str, float]] | BaseException) -> None:
+        nonlocal completed, checkpoint_bytes, first_result_logged, t_phase
+        completed += 1
+        if isinstance(outcome, BaseException):
+            quarantine[name] = _describe_failure(outcome)
+            journal.record(name, "quarantine", quarantine[name])
+            _log(f"Quarentena: {name} - {quarantine[name]}")
+        else:
+            _name, status, timings = outcome
+            if not first_result_logged:
+                t_phase = _log_phase("Primeiro arquivo concluído", t_phase, t_start)
+                first_result_logged = True
+            _log_progress(completed, total_to_process, name if status == "ok" else f"{name} ({status})")
+            processed_set.add(name)
+            state_processed.add(name)
+            quarantine.pop(name, None)
+            journal.record(name)
+            for key, seconds in timings.items():
+                worker_times[key] = worker_times.get(key, 0.0) + seconds
+            pending_names.append(name)
+            checkpoint_bytes += file_sizes.get(name, 0)
+        if completed % checkpoint_interval == 0:
+            consolidate_checkpoint(final=False)
 
     try:
         t0 = time.time()
         t_pool_start = time.perf_counter()
-        with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
-            t_phase = _log_phase("Pool de workers criado", t_pool_start, t_start)
-            futures = {
-                executor.submit(
-                    process_and_save_parquet,
-                    prepared.original.name,
-                    str(prepared.resolved),
-                    str(parquet_dir),
-                ): prepared.original.name
-                for prepared in remaining_inputs
-            }
-            completed = 0
-            for future in as_completed(futures):
-                name, result = future.result()
-                if not first_result_logged:
-                    t_phase = _log_phase("Primeiro arquivo concluído", t_phase, t_start)
-                    first_result_logged = True
-                completed += 1
-                _log_progress(completed, total_to_process, name)
-                processed_set.add(name)
-                state_processed.add(name)
-                pending_results.append((name, result))
-                checkpoint_bytes += file_sizes.get(name, 0)
-                if completed % checkpoint_interval == 0:
-                    consolidate_checkpoint(final=False)
+        start_log = _StartLog(_pool_context(args.max_tasks_per_child))
+        executor = _make_executor(workers, args.max_tasks_per_child, args.max_worker_mb, start_log)
+        t_phase = _log_phase("Pool de workers criado", t_pool_start, t_start)
+        queue = iter(remaining_inputs)
+        in_flight: dict[Future, PreparedInput] = {}
+        suspects: list[PreparedInput] = []
+        # tarefas mortas por estourar o prazo (culpado conhecido): vão direto para a quarentena
+        killed: dict[str, BaseException] = {}
+        resubmitted: dict[str, int] = {}
+        # com o alarme por tarefa ativo, todo ZIP termina dentro deste prazo a partir do início;
+        # se não terminar, o worker dele está travado em código nativo
+        stall_seconds = args.zip_timeout + _STALL_GRACE_SECONDS if args.zip_timeout > 0 else None
+
+        def submit_next() -> bool:
+            prepared = next(queue, None)
+            if prepared is None:
+                return False
+            in_flight[executor.submit(process_and_save_parquet, *task_args(prepared))] = prepared
+            return True
+
+        def wait_timeout() -> float | None:
+            if stall_seconds is None:
+                return None
+            names = {prepared.original.name for prepared in in_flight.values()}
+            starts = [started_at for name, (_pid, started_at) in start_log.drain().items() if name in names]
+            if not starts:
+                return stall_seconds
+            return max(1.0, min(starts) + stall_seconds - time.time())
+
+        def kill_overdue() -> None:
+            names = {prepared.original.name for prepared in in_flight.values()}
+            now = time.time()
+            for name, (pid, started_at) in list(start_log.drain().items()):
+                if name in names and name not in killed and now - started_at > stall_seconds:
+                    _log(f"{name}: sem resposta em {stall_seconds:.0f}s; encerrando o worker {pid}.")
+                    killed[name] = ZipTimeoutError(f"{name}: worker não respondeu em {stall_seconds:.0f}s")
+                    _kill_process(pid)
+
+        try:
+            # janela limitada: só submete o próximo quando um termina (backpressure)
+            while len(in_flight) < max_in_flight and submit_next():
+                pass
+            while in_flight:
+                done, _ = wait(in_flight, timeout=wait_timeout(), return_when=FIRST_COMPLETED)
+                if stall_seconds is not None:
+                    kill_overdue()
+                broken = False
+                for future in done:
+                    try:
+                        outcome = future.result()
+                    except BrokenProcessPool:
+                        broken = True
+                        continue
+                    except Exception as exc:
+                        outcome = exc
+                    prepared = in_flight.pop(future)
+                    start_log.forget(prepared.original.name)
+                    killed.pop(prepared.original.name, None)
+                    record_outcome(prepared.original.name, outcome)
+                if broken:
+                    started = start_log.drain()
+                    culprit_known = bool(killed)
+                    retry: list[PreparedInput] = []
+                    for future, prepared in in_flight.items():
+                        name = prepared.original.name
+                        if future.done() and not future.cancelled() and future.exception() is None:
+                            record_outcome(name, future.result())
+                        elif name in killed:
+                            record_outcome(name, killed.pop(name))
+                        elif (name in started and not culprit_known) or resubmitted.get(name, 0) >= _MAX_RESUBMITS:
+                            # worker caiu sem culpado conhecido: quem estava rodando vira suspeito
+                            suspects.append(prepared)
+                        else:
+                            # não chegou a rodar (ou foi derrubado junto com o culpado): volta para o pool novo
+                            resubmitted[name] = resubmitted.get(name, 0) + 1
+                            retry.append(prepared)
+                        start_log.forget(name)
+                    killed.clear()
+                    in_flight.clear()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = _make_executor(workers, args.max_tasks_per_child, args.max_worker_mb, start_log)
+                    queue = itertools.chain(_schedule_largest_first(retry, file_sizes), queue)
+                    _log(
+                        f"Pool reiniciado; {len(retry)} arquivo(s) reenviado(s), "
+                        f"{len(suspects)} suspeito(s) serão reprocessados isoladamente."
+                    )
+                while len(in_flight) < max_in_flight and submit_next():
+                    pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            start_log.close()
+
+        if suspects:
+            outcomes = _run_isolated(
+                [task_args(prepared) for prepared in suspects], args.zip_timeout, args.max_worker_mb, parallel=workers
+            )
+            for prepared in suspects:
+                record_outcome(prepared.original.name, outcomes[prepared.original.name])
+
+        if args.retry_quarantined and quarantine:
+            retry_inputs = [prepared_by_name[name] for name in sorted(quarantine) if name in prepared_by_name]
+            if retry_inputs:
+                _log(f"Reprocessando {len(retry_inputs)} arquivo(s) em quarentena com o backend {QUARANTINE_BACKEND}.")
+                total_to_process += len(retry_inputs)
+                file_sizes.update(
+                    {prepared.original.name: Path(prepared.resolved).stat().st_size for prepared in retry_inputs}
+                )
+                outcomes = _run_isolated(
+                    [task_args(prepared, QUARANTINE_BACKEND) for prepared in retry_inputs],
+                    args.zip_timeout,
+                    args.max_worker_mb,
+                    parallel=workers,
+                )
+                for prepared in retry_inputs:
+                    record_outcome(prepared.original.name, outcomes[prepared.original.name])
+
         elapsed = time.time() - t0
         mb = total_size / 1e6 if total_size else 0
         if elapsed > 0 and mb:
             _log(f"Processamento paralelo concluído: {completed}/{total_to_process} arquivos | {mb/elapsed:.2f} MB/s")
+        if worker_times:
+            _log("Tempo somado nos workers: " + " | ".join(f"{key}={secs:.1f}s" for key, secs in worker_times.items()))
     finally:
         if temp_dir:
             temp_dir.cleanup()
@@ -2944,6 +4595,11 @@ def main() -> None:
             _log(f"Aviso: falha ao gerar evidências de laudos sem espécie: {exc}")
     if bad_files_total:
         _log(f"Aviso final: {len(bad_files_total)} parquet(s) corrompido(s) foram ignorados: {sorted(bad_files_total)}")
+    if quarantine:
+        _log(
+            f"Aviso final: {len(quarantine)} arquivo(s) em quarentena (ver {_state_path(run_id)}); "
+            "use --resume com --retry-quarantined para tentar o backend degradado."
+        )
 
 
 if __name__ == "__main__":
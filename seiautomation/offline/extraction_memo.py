@@ -0,0 +1,77 @@
+"""Memo persistente (SQLite) dos resultados de ``extract_from_text`` por documento.
+
+A chave combina o hash do texto do documento, a origem do documento (DE/CM/...)
+e a versão das regras por documento; o valor é o resultado parcial serializado
+(JSON + zlib). Um mesmo despacho/certidão presente em vários ZIPs, ou reprocessado
+em outra execução, é extraído uma única vez.
+
+Configuração por ambiente:
+    SEI_EXTRACT_MEMO      caminho do arquivo .sqlite ou ``off`` para desativar.
+    SEI_EXTRACT_MEMO_MB   tamanho máximo aproximado (default=512).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+from pathlib import Path
+
+from preprocessamento.sqlite_store import SizeBoundedStore, StoreSlot
+
+DEFAULT_MEMO_PATH = Path(__file__).resolve().parents[2] / ".cache" / "extracao.sqlite"
+DEFAULT_MAX_MB = 512
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS partials (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    nbytes INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS partials_accessed ON partials(accessed);
+"""
+
+
+def memo_key(text: str, origin: str, version: str) -> str:
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+    return f"{version}:{origin or '-'}:{digest}"
+
+
+class ExtractionMemo(SizeBoundedStore):
+    """Índice SQLite ``chave -> resultado parcial``, com despejo por tamanho (LRU)."""
+
+    table = "partials"
+    schema = _SCHEMA
+    evict_check_bytes = 16 * 1024 * 1024
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024) -> None:
+        super().__init__(path, max_bytes)
+
+    def get(self, key: str) -> dict | None:
+        row = self._fetch(key, "payload")
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def put(self, key: str, payload: dict) -> None:
+        blob = zlib.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"), 6)
+        self._store(key, len(blob), payload=blob)
+
+
+_SLOT: StoreSlot[ExtractionMemo] = StoreSlot(
+    ExtractionMemo, DEFAULT_MEMO_PATH, DEFAULT_MAX_MB, path_env="SEI_EXTRACT_MEMO", mb_env="SEI_EXTRACT_MEMO_MB"
+)
+
+
+def get_extraction_memo() -> ExtractionMemo | None:
+    """Memo do processo atual (reaberto após fork; ``None`` se desativado/indisponível)."""
+    return _SLOT.get()
+
+
+def configure_extraction_memo(path: Path | None) -> None:
+    """Troca o memo do processo (``path=None`` desativa). Propaga para os workers via ambiente."""
+    _SLOT.configure(path)
+
+
+__all__ = ["ExtractionMemo", "configure_extraction_memo", "get_extraction_memo", "memo_key"]
@@ -0,0 +1,184 @@
+"""Store consolidado (SQLite) das linhas gravadas nos parquets por ZIP.
+
+Os checkpoints só acrescentam/atualizam as linhas dos ZIPs concluídos desde o
+último checkpoint; o XLSX é materializado a partir daqui apenas no fim da
+execução (ou sob demanda), sem reler todos os parquets a cada lote.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import pandas as pd
+
+STORE_FILENAME = "consolidado.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    records TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS inputs (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    crc INTEGER NOT NULL,
+    version TEXT NOT NULL
+);
+"""
+
+
+class ResultStore:
+    """Uma entrada por arquivo ``<zip>.parquet`` (chave = nome do arquivo)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=60)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_parquet_dir(cls, parquet_dir: Path) -> "ResultStore":
+        return cls(parquet_dir / STORE_FILENAME)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0])
+
+    def _known(self) -> dict[str, tuple[int, int]]:
+        return {name: (size, mtime) for name, size, mtime in self._conn.execute("SELECT name, size, mtime_ns FROM rows")}
+
+    def sync_parquets(self, parquet_dir: Path, names: Iterable[str] | None = None) -> list[Path]:
+        """Ingere parquets novos/alterados.
+
+        Com ``names`` só olha ``<nome>.parquet`` desses ZIPs (checkpoint);
+        sem ``names`` varre o diretório e remove entradas cujo parquet sumiu.
+        Retorna os parquets que não puderam ser lidos.
+        """
+        known = self._known()
+        if names is None:
+            if not parquet_dir.exists():
+                return []
+            candidates = [Path(entry.path) for entry in os.scandir(parquet_dir) if entry.name.endswith(".parquet")]
+            present = {path.name for path in candidates}
+            gone = [(name,) for name in known if name not in present]
+        else:
+            candidates = [parquet_dir / f"{name}.parquet" for name in names]
+            gone = []
+
+        bad_files: list[Path] = []
+        updates: list[tuple[str, int, int, str]] = []
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if known.get(path.name) == (stat.st_size, stat.st_mtime_ns):
+                continue
+            try:
+                df = pd.read_parquet(path)
+            except Exception:
+                bad_files.append(path)
+                continue
+            # as colunas de COLUMNS são todas texto (``ExtractionResult.to_row``): JSON puro, sem conversões
+            records = json.dumps(df.to_dict("records"), ensure_ascii=False)
+            updates.append((path.name, stat.st_size, stat.st_mtime_ns, records))
+
+        with self._conn:
+            if gone:
+                self._conn.executemany("DELETE FROM rows WHERE name = ?", gone)
+            if updates:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO rows (name, size, mtime_ns, records) VALUES (?, ?, ?, ?)",
+                    updates,
+                )
+        return bad_files
+
+    def manifest(self) -> dict[str, tuple[int, int, int, str]]:
+        """Impressão digital de cada input já extraído: ``nome -> (size, mtime_ns, crc, versão)``."""
+        return {
+            name: (size, mtime, crc, version)
+            for name, size, mtime, crc, version in self._conn.execute(
+                "SELECT name, size, mtime_ns, crc, version FROM inputs"
+            )
+        }
+
+    def record_inputs(self, entries: Iterable[tuple[str, int, int, int, str]]) -> None:
+        """Grava ``(nome, size, mtime_ns, crc, versão)`` dos inputs extraídos com sucesso."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO inputs (name, size, mtime_ns, crc, version) VALUES (?, ?, ?, ?, ?)",
+                entries,
+            )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Todas as linhas, na mesma ordem de ``sorted(parquet_dir.glob('*.parquet'))``."""
+        records: list[dict] = []
+        for (payload,) in self._conn.execute("SELECT records FROM rows ORDER BY name"):
+            records.extend(json.loads(payload))
+        return pd.DataFrame.from_records(records)
+
+
+_REPLAY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS collections (
+    name TEXT PRIMARY KEY,
+    payload BLOB NOT NULL
+);
+"""
+
+
+class ReplayStore:
+    """Estado pré-consolidação de cada ZIP de uma execução (base do ``--replay``).
+
+    Gravado pelos workers (um registro por ZIP, JSON + zlib); permite rodar de
+    novo só as etapas de consolidação sem reabrir os ZIPs.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=60, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_REPLAY_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ReplayStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM collections").fetchone()[0])
+
+    def put(self, name: str, payload: dict) -> None:
+        blob = zlib.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"), 6)
+        self._conn.execute("INSERT OR REPLACE INTO collections (name, payload) VALUES (?, ?)", (name, blob))
+
+    def items(self) -> Iterator[tuple[str, dict]]:
+        """``(nome do ZIP, payload)`` em ordem de nome."""
+        for name, blob in self._conn.execute("SELECT name, payload FROM collections ORDER BY name"):
+            yield name, json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+__all__ = ["ReplayStore", "ResultStore", "STORE_FILENAME"]
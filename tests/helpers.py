@@ -0,0 +1,57 @@
+"""Utilitários compartilhados pelos testes (PDFs sintéticos e isolamento de ambiente/caches)."""
+
+import os
+import unittest
+
+from preprocessamento.text_cache import configure_text_cache
+from seiautomation.offline.extraction_memo import configure_extraction_memo
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    """PDF mínimo (Helvetica, uma ou mais linhas por página)."""
+    objs = [b"<< /Type /Catalog /Pages 2 0 R >>", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        lines = b" T* ".join(b"(" + line.encode("latin-1") + b") Tj" for line in text.split("\n"))
+        stream = b"BT /F1 12 Tf 14 TL 40 800 Td " + lines + b" ET"
+        objs.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objs.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 3 0 R >> >> >>" % len(objs)
+        )
+        kids.append(len(objs))
+    objs[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for index, obj in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (index, obj)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objs) + 1, xref)
+    return out
+
+
+def preserve_env(test: unittest.TestCase, *names: str) -> None:
+    """Restaura as variáveis de ambiente ``names`` ao fim do teste."""
+    previous = {name: os.environ.get(name) for name in names}
+
+    def _restore() -> None:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    test.addCleanup(_restore)
+
+
+def isolate_caches(test: unittest.TestCase) -> None:
+    """Desativa o cache de textos e o memo de extração durante o teste (nada lido de ``.cache/``)."""
+    preserve_env(test, "SEI_TEXT_CACHE", "SEI_EXTRACT_MEMO")
+    configure_text_cache(None)
+    configure_extraction_memo(None)
+    # roda antes de restaurar o ambiente: fecha o que o teste abriu e volta a ler as variáveis
+    test.addCleanup(configure_extraction_memo, None)
+    test.addCleanup(configure_text_cache, None)
@@ -0,0 +1,53 @@
+import random
+import unittest
+
+from seiautomation.offline.extract_reports import (
+    HONORARIOS_ALIAS,
+    _KeywordAutomaton,
+    _match_alias,
+    _normalize_key,
+)
+
+
+def _legacy_first(groups, norm: str):
+    for index, keywords in enumerate(groups):
+        if any(keyword in norm for keyword in keywords):
+            return index
+    return None
+
+
+class AliasAutomatonTests(unittest.TestCase):
+    def test_matches_ordered_scan_on_aliases(self) -> None:
+        self.assertTrue(HONORARIOS_ALIAS)
+        groups = [alias["keywords"] for alias in HONORARIOS_ALIAS]
+        automaton = _KeywordAutomaton(groups)
+        words = [kw for keywords in groups for kw in keywords] + ["perito", "laudo", "de", "a", "x"]
+        rng = random.Random(22)
+        for _ in range(1500):
+            parts = [rng.choice(words) for _ in range(rng.randint(1, 5))]
+            text = " ".join(parts)
+            if rng.random() < 0.5:
+                start = rng.randrange(len(text))
+                text = text[start : start + rng.randint(1, 40)]
+            norm = _normalize_key(text)
+            with self.subTest(text=norm):
+                self.assertEqual(automaton.first_match(norm), _legacy_first(groups, norm))
+
+    def test_overlapping_keywords_keep_first_alias(self) -> None:
+        groups = [["cde"], ["abcdx", "bc"], ["abc"], ["he", "she", "his", "hers"]]
+        automaton = _KeywordAutomaton(groups)
+        rng = random.Random(2022)
+        for _ in range(2000):
+            text = "".join(rng.choice("abcdehirsx ") for _ in range(rng.randint(0, 15)))
+            with self.subTest(text=text):
+                self.assertEqual(automaton.first_match(text), _legacy_first(groups, text))
+
+    def test_match_alias_returns_entry(self) -> None:
+        entry = _match_alias("Perícia Grafotécnica em assinatura")
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry["ID"], "1.1A")
+        self.assertIsNone(_match_alias(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
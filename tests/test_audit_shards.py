@@ -0,0 +1,39 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from seiautomation.offline.extract_reports import (
+    _audit_shard_dir,
+    _merge_audit_shards,
+    _write_audit_shard,
+    extract_from_text,
+)
+
+TEXT = "Saldo a receber: R$ 1.500,00\n"
+
+
+class AuditShardTests(unittest.TestCase):
+    def test_worker_lines_are_merged_into_run_jsonl(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            audit_path = Path(tmp) / "run.sources.jsonl"
+            shard_dir = _audit_shard_dir(audit_path)
+            self.assertEqual(shard_dir.name, "run.sources.d")
+            result = extract_from_text(TEXT, TEXT, "despacho.html")
+            _write_audit_shard(shard_dir, "a.zip", result, "run")
+            _write_audit_shard(shard_dir, "b.zip", result, "run")
+            (shard_dir / "worker-0.jsonl").write_text('{"zip": "c.zip"}\n', encoding="utf-8")
+
+            self.assertEqual(_merge_audit_shards(audit_path), 2)
+            lines = [json.loads(line) for line in audit_path.read_text(encoding="utf-8").splitlines()]
+            self.assertFalse(shard_dir.exists())
+            self.assertEqual(_merge_audit_shards(audit_path), 0)
+
+        self.assertEqual(sorted(entry["zip"] for entry in lines), ["a.zip", "b.zip", "c.zip"])
+        entry = next(item for item in lines if item["zip"] == "a.zip")
+        self.assertEqual(entry["run_id"], "run")
+        self.assertIn("SALDO A RECEBER", [field["field"] for field in entry["fields"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import pickle
+import unittest
+
+from seiautomation.offline.extract_reports import (
+    Candidate,
+    ExtractionResult,
+    _trim_candidates,
+    extract_from_text,
+)
+
+
+class CandidateTests(unittest.TestCase):
+    def test_mapping_interface_and_interning(self) -> None:
+        first = Candidate("R$ 1,00", "".join(["despacho", ".html"]), "label:saldo", weight=2.0)
+        second = Candidate("R$ 2,00", "".join(["despacho", ".", "html"]), "label:saldo")
+        self.assertIs(first.source, second.source)
+        self.assertEqual(first["value"], "R$ 1,00")
+        self.assertEqual(first.get("weight"), 2.0)
+        self.assertIsNone(first.get("inexistente"))
+        first["snippet"] = "Saldo: R$ 1,00"
+        self.assertEqual(first.to_dict()["snippet"], "Saldo: R$ 1,00")
+        with self.assertRaises(KeyError):
+            first["outro"] = 1
+
+    def test_pickle_drops_text_reference(self) -> None:
+        cand = Candidate("R$ 1,00", "despacho.html", "label:saldo", start=3, end=10)
+        cand._ctx = "texto grande"
+        clone = pickle.loads(pickle.dumps(cand))
+        self.assertEqual(clone.to_dict(), cand.to_dict())
+        self.assertIsNone(clone._ctx)
+
+    def test_trim_keeps_heaviest_and_chosen(self) -> None:
+        res = ExtractionResult()
+        entries = [Candidate(str(idx), "doc", "p", weight=weight) for idx, weight in enumerate([1.0, 3.0, 0.5, 2.0])]
+        res.candidates["CAMPO"] = list(entries)
+        res.meta["CAMPO"] = entries[2]
+        _trim_candidates(res, 2)
+        self.assertEqual([entry.value for entry in res.candidates["CAMPO"]], ["1", "2"])
+        _trim_candidates(res, None)
+        self.assertEqual(len(res.candidates["CAMPO"]), 2)
+
+    def test_extraction_produces_candidates(self) -> None:
+        text = "Saldo a receber: R$ 1.500,00\n"
+        res = extract_from_text(text, text, "despacho.html")
+        cand = res.meta["SALDO A RECEBER"]
+        self.assertIsInstance(cand, Candidate)
+        self.assertIs(res.candidates["SALDO A RECEBER"][0], cand)
+
+
+if __name__ == "__main__":
+    unittest.main()
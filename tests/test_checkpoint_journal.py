@@ -0,0 +1,72 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from seiautomation.offline import extract_reports
+from seiautomation.offline.extract_reports import CheckpointJournal, _load_state, _save_state
+
+
+class CheckpointJournalTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(extract_reports, "LOG_DIR", Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_resume_replays_journal_over_compacted_state(self) -> None:
+        _save_state("run", {"run_id": "run", "processed_files": ["a.zip"], "quarantine": {"b.zip": "timeout"}})
+        journal = CheckpointJournal("run")
+        journal.record("c.zip")
+        journal.record("b.zip")
+        journal.record("d.zip", "quarantine", "crash")
+        journal.flush()
+        with journal.path.open("a", encoding="utf-8") as handle:
+            handle.write('{"zip": "e.zip", "sta')  # queda no meio da escrita
+
+        state = _load_state("run")
+        self.assertEqual(state["processed_files"], ["a.zip", "b.zip", "c.zip"])
+        self.assertEqual(state["quarantine"], {"d.zip": "crash"})
+
+    def test_reopen_repairs_torn_tail_before_appending(self) -> None:
+        _save_state("run", {"run_id": "run"})
+        journal = CheckpointJournal("run")
+        journal.record("a.zip")
+        journal.flush()
+        with journal.path.open("a", encoding="utf-8") as handle:
+            handle.write('{"zip": "b.zip", "sta')
+
+        resumed = CheckpointJournal("run")
+        self.assertEqual(resumed.lines, 1)
+        resumed.record("c.zip")
+        resumed.record("d.zip", "quarantine", "crash")
+        resumed.flush()
+        state = _load_state("run")
+        self.assertEqual(state["processed_files"], ["a.zip", "c.zip"])
+        self.assertEqual(state["quarantine"], {"d.zip": "crash"})
+
+    def test_replay_skips_bad_lines(self) -> None:
+        _save_state("run", {"run_id": "run"})
+        path = extract_reports._journal_path("run")
+        path.write_text('{"zip": "a.zip"}\n{"zip": "b.z{"zip": "c.zip"}\n[]\n{"zip": "d.zip"}\n', encoding="utf-8")
+        self.assertEqual(_load_state("run")["processed_files"], ["a.zip", "d.zip"])
+
+    def test_compaction_rewrites_state_and_truncates_journal(self) -> None:
+        _save_state("run", {"run_id": "run"})
+        journal = CheckpointJournal("run")
+        journal.record("a.zip")
+        journal.flush()
+        self.assertEqual(CheckpointJournal("run").lines, 1)
+        state = _load_state("run")
+        state["completed"] = True
+        journal.compact(state)
+        self.assertEqual(journal.path.read_text(encoding="utf-8"), "")
+        saved = json.loads(extract_reports._state_path("run").read_text(encoding="utf-8"))
+        self.assertEqual(saved["processed_files"], ["a.zip"])
+        self.assertTrue(saved["completed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import random
+import unittest
+
+from dateutil import parser as date_parser
+
+from seiautomation.offline.extract_reports import _parse_date
+
+
+def _dateutil(raw: str) -> str:
+    try:
+        return date_parser.parse(raw, dayfirst=True, fuzzy=True).strftime("%d/%m/%Y")
+    except Exception:
+        return ""
+
+
+class DateParserTests(unittest.TestCase):
+    def test_numeric_dates_match_dateutil(self) -> None:
+        rng = random.Random(24)
+        for _ in range(3000):
+            first, second = rng.randint(0, 99), rng.randint(0, 40)
+            sep, sep2 = rng.choice("./-"), rng.choice("./-")
+            year = rng.choice(["25", "99", "69", "70", "2025", "1999", "0999", "202"])
+            raw = f"{first:0{rng.choice([1, 2])}d}{sep}{second:02d}{sep if rng.random() < 0.8 else sep2}{year}"
+            if rng.random() < 0.2:
+                raw = f" {raw}\n"
+            with self.subTest(raw=raw):
+                self.assertEqual(_parse_date.__wrapped__(raw), _dateutil(raw))
+
+    def test_portuguese_month_names(self) -> None:
+        self.assertEqual(_parse_date("27 de maio de 2025"), "27/05/2025")
+        self.assertEqual(_parse_date("1º de Março de 2024"), "01/03/2024")
+        self.assertEqual(_parse_date("27/mai/2025"), "27/05/2025")
+        self.assertEqual(_parse_date("05-dez.-24"), "05/12/2024")
+        self.assertEqual(_parse_date("27mar2025"), _dateutil("27mar2025"))
+        self.assertEqual(_parse_date("31 de fevereiro de 2025"), "")
+
+    def test_other_text_falls_back_to_dateutil(self) -> None:
+        for raw in ("Campina Grande, 10 May 2025", "2025-05-10", "sem data"):
+            with self.subTest(raw=raw):
+                self.assertEqual(_parse_date(raw), _dateutil(raw))
+
+
+if __name__ == "__main__":
+    unittest.main()
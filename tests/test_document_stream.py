@@ -0,0 +1,73 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
+
+from preprocessamento.documents import LazyDocument
+from seiautomation.offline import extract_reports
+from seiautomation.offline.doc_classifier import DocumentBucket
+from seiautomation.offline.extract_reports import (
+    BUCKET_REQUIREMENTS,
+    ExtractionResult,
+    ProcessContext,
+    _build_document,
+    _iter_bucket_documents,
+    process_zip,
+)
+from tests.helpers import isolate_caches
+
+
+class DocumentStreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        isolate_caches(self)
+
+    def test_stops_before_loading_unneeded_buckets(self) -> None:
+        loaded = []
+
+        def _loader(name: str):
+            def _load() -> str:
+                loaded.append(name)
+                return f"Documento {name}"
+
+            return _load
+
+        handles = [
+            LazyDocument("despacho.html", DocumentBucket.PRINCIPAL, loader=_loader("despacho")),
+            LazyDocument("laudo.pdf", DocumentBucket.LAUDO, loader=_loader("laudo")),
+            LazyDocument("certidao.pdf", DocumentBucket.PRINCIPAL, loader=_loader("certidao")),
+        ]
+        context = ProcessContext()
+        result = ExtractionResult()
+        names = []
+        for doc in _iter_bucket_documents(handles, context, result):
+            names.append(doc.name)
+            context.register(doc)
+            for field in BUCKET_REQUIREMENTS[DocumentBucket.PRINCIPAL]:
+                result.data[field] = "x"
+
+        self.assertEqual(names, ["despacho.html", "certidao.pdf"])
+        self.assertEqual(loaded, ["despacho", "certidao"])
+
+    def test_build_document_defers_cnj_metadata(self) -> None:
+        doc = _build_document("despacho.html", "Processo nº 0801234-56.2024.8.15.0001", DocumentBucket.PRINCIPAL)
+        self.assertEqual(doc.judicial_numbers, {"08012345620248150001"})
+        self.assertEqual(doc.cnj_counts, {})
+
+    def test_skipped_documents_skip_cnj_scan(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            zip_path = Path(tmp) / "000219_17_2025_8_15_SEI_000219_17.2025.8.15.zip"
+            with ZipFile(zip_path, "w") as zf:
+                zf.writestr("despacho.html", "<p>Processo nº 000219-17.2025.8.15</p><p>Juízo: 1ª Vara de Patos</p>")
+                zf.writestr("outro_despacho.html", "<p>Processo nº 000999-99.2025.8.15</p><p>Juízo: 2ª Vara</p>")
+            with mock.patch.object(
+                extract_reports, "_extract_cnj_metadata", wraps=extract_reports._extract_cnj_metadata
+            ) as scan:
+                result = process_zip(zip_path)
+
+        self.assertEqual(scan.call_count, 1)
+        self.assertEqual([doc["name"] for doc in result.meta["_documents"]], ["despacho.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from seiautomation.offline import extract_reports
+from seiautomation.offline.extract_reports import TextView, _extract_document, _materialize_snippets
+from seiautomation.offline.extraction_memo import ExtractionMemo, configure_extraction_memo, get_extraction_memo
+
+TEXT = "Despacho\nJuízo: 1ª Vara Cível da Comarca de Patos\nSaldo a receber: R$ 1.500,00\n"
+
+
+class ExtractionMemoTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        previous = os.environ.get("SEI_EXTRACT_MEMO")
+        configure_extraction_memo(Path(self._tmp.name) / "memo.sqlite")
+
+        def _restore() -> None:
+            configure_extraction_memo(None)
+            if previous is None:
+                os.environ.pop("SEI_EXTRACT_MEMO", None)
+            else:
+                os.environ["SEI_EXTRACT_MEMO"] = previous
+            self._tmp.cleanup()
+
+        self.addCleanup(_restore)
+
+    def test_hit_replays_candidates_with_new_source(self) -> None:
+        first = _extract_document(TextView(TEXT), "despacho.html")
+        with mock.patch.object(extract_reports, "extract_from_text", side_effect=AssertionError("memo ignorado")):
+            second = _extract_document(TextView(TEXT), "despacho (2).html")
+
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(set(second.sources.values()), {"despacho (2).html"})
+        cand = second.meta["SALDO A RECEBER"]
+        self.assertIs(second.candidates["SALDO A RECEBER"][0], cand)
+        self.assertEqual(cand.source, "despacho (2).html")
+        _materialize_snippets(second)
+        _materialize_snippets(first)
+        self.assertEqual(cand.snippet, first.meta["SALDO A RECEBER"].snippet)
+        self.assertEqual((cand.start, cand.end), (first.meta["SALDO A RECEBER"].start, first.meta["SALDO A RECEBER"].end))
+
+    def test_rules_version_is_part_of_the_key(self) -> None:
+        _extract_document(TextView(TEXT), "despacho.html")
+        calls = []
+        original = extract_reports.extract_from_text
+
+        def _counting(*args, **kwargs):
+            calls.append(1)
+            return original(*args, **kwargs)
+
+        with mock.patch.object(extract_reports, "_MEMO_VERSION", "outra-versao"), mock.patch.object(
+            extract_reports, "extract_from_text", side_effect=_counting
+        ):
+            _extract_document(TextView(TEXT), "despacho.html")
+        self.assertEqual(len(calls), 1)
+        self.assertIsNotNone(get_extraction_memo())
+
+    def test_reads_keep_entries_from_eviction(self) -> None:
+        memo = ExtractionMemo(Path(self._tmp.name) / "lru.sqlite", max_bytes=1)
+        self.addCleanup(memo.close)
+        for idx in range(3):
+            memo.put(f"k{idx}", {"valor": "x" * 50})
+        for idx in range(3):  # gravadas há muito tempo, k0 primeiro
+            memo._conn.execute("UPDATE partials SET accessed = ? WHERE key = ?", (1000.0 + idx, f"k{idx}"))
+        self.assertIsNotNone(memo.get("k0"))
+        memo.max_bytes = memo.total_bytes() - 1
+        self.assertEqual(memo.evict(), 1)
+        self.assertEqual([memo.get(f"k{idx}") is not None for idx in range(3)], [True, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
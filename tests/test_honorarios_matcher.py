@@ -0,0 +1,88 @@
+import difflib
+import random
+import unittest
+from unittest import mock
+
+from seiautomation.offline import extract_reports
+from seiautomation.offline.extract_reports import (
+    HONORARIOS_INDEX,
+    _HonorariosMatcher,
+    _match_honorarios_entry,
+    _normalize_key,
+    _reset_honorarios_matcher,
+)
+
+
+def _legacy_key(norm: str, index) -> str | None:
+    """Busca anterior (difflib sobre todas as chaves + varredura por substring)."""
+    if norm in index:
+        return norm
+    candidates = difflib.get_close_matches(norm, index.keys(), n=1, cutoff=0.75)
+    if candidates:
+        return candidates[0]
+    for key in index:
+        if norm in key or key in norm:
+            return key
+    return None
+
+
+def _perturb(rng: random.Random, value: str) -> str:
+    chars = list(value)
+    for _ in range(rng.randint(0, 6)):
+        op = rng.random()
+        pos = rng.randrange(len(chars) + 1)
+        if op < 0.3 and chars:
+            del chars[min(pos, len(chars) - 1)]
+        elif op < 0.6:
+            chars.insert(pos, rng.choice("aeiouprsct "))
+        elif chars:
+            chars[min(pos, len(chars) - 1)] = rng.choice("abcdemnoprs")
+    text = "".join(chars)
+    if rng.random() < 0.3:
+        start = rng.randrange(len(text) + 1)
+        text = text[start : start + rng.randint(1, 12)]
+    if rng.random() < 0.2:
+        text = f"{text} {rng.choice(['honorarios', 'do perito', 'x', 'laudo complementar'])}"
+    return _normalize_key(text)
+
+
+class HonorariosMatcherTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(_reset_honorarios_matcher)
+
+    def _check(self, index, queries) -> None:
+        matcher = _HonorariosMatcher(index)
+        for norm in queries:
+            if not norm or norm in index:
+                continue
+            with self.subTest(query=norm):
+                self.assertEqual(matcher.lookup(norm), _legacy_key(norm, index))
+                self.assertEqual(matcher.lookup(norm), _legacy_key(norm, index))  # via LRU
+
+    def test_matches_difflib_on_table(self) -> None:
+        self.assertTrue(HONORARIOS_INDEX)
+        rng = random.Random(21)
+        keys = list(HONORARIOS_INDEX)
+        self._check(HONORARIOS_INDEX, [_perturb(rng, rng.choice(keys)) for _ in range(800)])
+
+    def test_matches_difflib_on_synthetic_keys(self) -> None:
+        rng = random.Random(2021)
+        words = ["pericia", "medica", "social", "grafotecnica", "contabil", "engenharia", "psicologica", "a", "ab", "de"]
+        index = {}
+        for _ in range(60):
+            index.setdefault(" ".join(rng.choice(words) for _ in range(rng.randint(1, 4))), {"ID": str(len(index))})
+        index.setdefault("", {"ID": "vazio"})
+        keys = list(index)
+        self._check(index, [_perturb(rng, rng.choice(keys) or "x") for _ in range(800)])
+
+    def test_entry_uses_current_index(self) -> None:
+        row = {"DESCRICAO": "Perícia grafotécnica", "ID": "99", "VALOR": "R$ 1,00"}
+        with mock.patch.dict(extract_reports.HONORARIOS_INDEX, {"pericia grafotecnica": row}, clear=True):
+            _reset_honorarios_matcher()
+            self.assertIs(_match_honorarios_entry("Pericia grafotecnicas"), row)
+            self.assertIs(_match_honorarios_entry("grafotecnica"), row)
+            self.assertIsNone(_match_honorarios_entry("Tradução"))
+
+
+if __name__ == "__main__":
+    unittest.main()
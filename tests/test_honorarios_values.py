@@ -0,0 +1,59 @@
+import unittest
+
+from seiautomation.offline.extract_reports import (
+    HONORARIOS_TABLE,
+    ExtractionResult,
+    _currency_cents,
+    _guess_species_from_values,
+    _honorarios_by_value,
+    extract_from_text,
+)
+
+
+class HonorariosValueIndexTests(unittest.TestCase):
+    def test_currency_cents_formats(self) -> None:
+        self.assertEqual(_currency_cents("R$ 1.234,56"), 123456)
+        self.assertEqual(_currency_cents("r$370,00"), 37000)
+        self.assertEqual(_currency_cents("1.200"), 120000)
+        self.assertEqual(_currency_cents("300.00"), 30000)  # formato da tabela CSV
+        self.assertEqual(_currency_cents(12.5), 1250)
+        self.assertIsNone(_currency_cents("R$ 370,00 (trezentos e setenta reais)"))
+        self.assertIsNone(_currency_cents(""))
+
+    def test_index_matches_table_scan(self) -> None:
+        self.assertTrue(HONORARIOS_TABLE)
+        for cents in {_currency_cents(row["VALOR"]) for row in HONORARIOS_TABLE} | {1, 36999}:
+            for tolerance in (0, 1, 5000):
+                with self.subTest(cents=cents, tolerance=tolerance):
+                    expected = [
+                        row for row in HONORARIOS_TABLE if abs(_currency_cents(row["VALOR"]) - cents) <= tolerance
+                    ]
+                    found = _honorarios_by_value(cents, tolerance)
+                    self.assertCountEqual([id(row) for row in found], [id(row) for row in expected])
+                    values = [_currency_cents(row["VALOR"]) for row in found]
+                    self.assertEqual(values, sorted(values))
+
+    def test_guess_species_needs_unique_value(self) -> None:
+        unique = [row for row in HONORARIOS_TABLE if len(_honorarios_by_value(_currency_cents(row["VALOR"]))) == 1]
+        self.assertTrue(unique)
+        row = unique[0]
+        result = ExtractionResult()
+        result.data["Valor Tabelado Anexo I - Tabela I"] = "R$ " + row["VALOR"].replace(".", ",")
+        self.assertIs(_guess_species_from_values(result), row)
+
+        shared = [row for row in HONORARIOS_TABLE if len(_honorarios_by_value(_currency_cents(row["VALOR"]))) > 1]
+        result.data["Valor Tabelado Anexo I - Tabela I"] = shared[0]["VALOR"].replace(".", ",")
+        self.assertIsNone(_guess_species_from_values(result))
+
+    def test_document_value_infers_species(self) -> None:
+        row = next(row for row in HONORARIOS_TABLE if len(_honorarios_by_value(_currency_cents(row["VALOR"]))) == 1)
+        valor = "R$ " + row["VALOR"].replace(".", ",")
+        text = f"Certidão\nValor Tabelado: {valor}\n"
+        result = extract_from_text(text, text, "certidao_cm.pdf")
+        self.assertEqual(result.data["ESPÉCIE DE PERÍCIA"], row["DESCRICAO"])
+        self.assertEqual(result.data["Fator"], row["ID"])
+        self.assertEqual(result.data["Valor Tabelado Anexo I - Tabela I"], valor)
+
+
+if __name__ == "__main__":
+    unittest.main()
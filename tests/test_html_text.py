@@ -0,0 +1,58 @@
+import os
+import unittest
+import zipfile
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from preprocessamento.documents import html_to_text
+
+# Trechos no formato dos despachos do SEI + casos de borda do html.parser.
+SAMPLES = [
+    "<html><head><meta charset='utf-8'><title>Despacho</title></head><body>"
+    "<p class='Texto_Justificado'>Processo nº 0801234-56.2024.8.15.0001</p>"
+    "<p>Juízo: 2ª Vara Cível da Comarca de Campina Grande</p>"
+    "<table><tr><td> Promovente: </td><td>Fulano de Tal</td></tr></table>"
+    "<p>Valor arbitrado:&nbsp;R$ 1.200,00</p></body></html>",
+    "<html><head><meta http-equiv='Content-Type' content='text/html; charset=iso-8859-1'>"
+    "<style>p { margin: 0 }</style><script>var a = '<b>não</b>';</script></head>"
+    "<body><!-- rodapé --><p>Perito: Maria Souza &ndash; CPF 123.456.789-09</p></body></html>",
+    "<p>a<br>b</br>c<br/>d<img src='x'>e</p>",
+    "<div><span>um</span>dois<span>três</div>quatro</span>cinco<p>sem fechar<b>negrito</p>resto",
+    "<p>&amp;&ordm;&#39;&#x41;&#150;&#0;&desconhecida;&nbsp</p><ruby>k<rt>r</rt></ruby>",
+    "<!DOCTYPE html><template><p>oculto</p></template><![CDATA[ bloco ]]><?xml x?>fim",
+    "texto solto < sem tag & resto",
+    "",
+]
+
+
+def _reference(raw: bytes) -> str:
+    return BeautifulSoup(raw, "html.parser").get_text("\n", strip=True)
+
+
+class HtmlTextTests(unittest.TestCase):
+    def test_matches_beautifulsoup_on_templates(self) -> None:
+        for index, sample in enumerate(SAMPLES):
+            for encoding in ("utf-8", "latin-1"):
+                raw = sample.encode(encoding, "replace")
+                with self.subTest(sample=index, encoding=encoding):
+                    self.assertEqual(html_to_text(raw), _reference(raw))
+
+    def test_matches_beautifulsoup_on_sample_zips(self) -> None:
+        # SEI_SAMPLE_ZIPS=<pasta com ZIPs do SEI> compara todos os membros HTML
+        sample_dir = os.getenv("SEI_SAMPLE_ZIPS")
+        if not sample_dir:
+            self.skipTest("SEI_SAMPLE_ZIPS não definido")
+        for zip_path in sorted(Path(sample_dir).glob("*.zip")):
+            with zipfile.ZipFile(zip_path) as zf:
+                for info in zf.infolist():
+                    lower = info.filename.lower()
+                    if info.is_dir() or not (lower.endswith(".html") or "despacho" in lower):
+                        continue
+                    raw = zf.read(info)
+                    with self.subTest(zip=zip_path.name, member=info.filename):
+                        self.assertEqual(html_to_text(raw), _reference(raw))
+
+
+if __name__ == "__main__":
+    unittest.main()
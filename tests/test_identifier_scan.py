@@ -0,0 +1,88 @@
+import random
+import unittest
+
+from seiautomation.offline.extract_reports import (
+    CNJ_CONTEXT_KEYWORDS,
+    PROCESSO_ADMIN_LEGACY_PATTERN,
+    PROCESSO_ADMIN_PATTERN,
+    PROCESSO_NUM_PATTERN,
+    PROCESSO_SEI_LOOSE_PATTERN,
+    PROCESSO_SEI_PATTERN,
+    _build_document,
+    _extract_cnj_metadata,
+    _fill_document_metadata,
+    _format_sei_from_groups,
+    _has_cnj_tail,
+    _normalize_digits,
+)
+
+# Trechos que misturam os formatos (e quase-formatos) de SEI, CNJ, administrativo, CPF e datas.
+PIECES = [
+    "Processo nº 000219-17.2025.8.15",
+    "0801234-56.2024.8.15.0001",
+    "0801234-56.2024.8.15",
+    "000300 - 11 . 2025 . 8 . 15",
+    "000400-22.2025.8.15.2001",
+    "2024012345",
+    "2023/12345",
+    "2021.123",
+    "20 24 123",
+    "CPF 123.456.789-09",
+    "10/05/2025",
+    "R$ 1.200,00",
+    "nos autos do processo",
+    "Perito: Maria",
+    "honorários do autor",
+    "\n",
+    " ",
+    "-",
+    ".",
+    "١٢٣٤٥٦٧-٨٩",
+]
+
+
+def _legacy_sets(text: str) -> tuple[set[str], set[str], set[str]]:
+    """Implementação anterior (uma passada por padrão) para comparação."""
+    sei = set()
+    for match in PROCESSO_SEI_PATTERN.finditer(text):
+        if not _has_cnj_tail(text, match.end()):
+            sei.add(_normalize_digits(match.group(0)))
+    for loose in PROCESSO_SEI_LOOSE_PATTERN.finditer(text):
+        sei.add(_normalize_digits(_format_sei_from_groups(loose.groups())))
+    judicial = {_normalize_digits(match) for match in PROCESSO_NUM_PATTERN.findall(text)}
+    admin = {_normalize_digits(match) for match in PROCESSO_ADMIN_PATTERN.findall(text)}
+    admin |= {d for d in map(_normalize_digits, PROCESSO_ADMIN_LEGACY_PATTERN.findall(text)) if len(d) >= 7}
+    return sei, judicial, admin
+
+
+def _legacy_cnj_metadata(text: str):
+    counts, scores, display = {}, {}, {}
+    lower_text = text.lower()
+    for match in PROCESSO_NUM_PATTERN.finditer(text):
+        norm = _normalize_digits(match.group(0))
+        display.setdefault(norm, match.group(0))
+        counts[norm] = counts.get(norm, 0) + 1
+        snippet = lower_text[max(0, match.start() - 120) : min(len(text), match.end() + 120)]
+        scores[norm] = scores.get(norm, 0) + sum(1 for keyword in CNJ_CONTEXT_KEYWORDS if keyword in snippet)
+    return counts, scores, display
+
+
+class IdentifierScanTests(unittest.TestCase):
+    def test_matches_one_pass_per_pattern(self) -> None:
+        rng = random.Random(20)
+        for _ in range(400):
+            text = "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 40)))
+            with self.subTest(text=text):
+                doc = _fill_document_metadata(_build_document("doc.html", text))
+                self.assertEqual((doc.sei_numbers, doc.judicial_numbers, doc.admin_numbers), _legacy_sets(text))
+                self.assertEqual((doc.cnj_counts, doc.cnj_context, doc.cnj_display), _legacy_cnj_metadata(text))
+
+    def test_cnj_metadata_accepts_plain_text(self) -> None:
+        counts, scores, display = _extract_cnj_metadata("Nos autos do processo 0801234-56.2024.8.15.0001")
+        self.assertEqual(counts, {"08012345620248150001": 1})
+        self.assertEqual(scores, {"08012345620248150001": 2})
+        self.assertEqual(display["08012345620248150001"], "0801234-56.2024.8.15.0001")
+
+
+if __name__ == "__main__":
+    unittest.main()
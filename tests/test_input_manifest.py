@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from zipfile import ZipFile
+
+from preprocessamento.inputs import PreparedInput, central_directory_crc
+from seiautomation.offline.extract_reports import EXTRACTOR_VERSION, _current_inputs, _input_record
+from seiautomation.offline.result_store import ResultStore
+
+
+class InputManifestTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        self.zip_path = self.root / "processo.zip"
+        with ZipFile(self.zip_path, "w") as zf:
+            zf.writestr("despacho.html", "<p>Despacho</p>")
+        self.prepared = PreparedInput(self.zip_path, self.zip_path, "zip")
+
+    def test_central_directory_crc_tracks_members(self) -> None:
+        before = central_directory_crc(self.zip_path)
+        os.utime(self.zip_path, ns=(1, 1))
+        self.assertEqual(central_directory_crc(self.zip_path), before)
+        with ZipFile(self.zip_path, "a") as zf:
+            zf.writestr("certidao.pdf", b"%PDF-1.4")
+        self.assertNotEqual(central_directory_crc(self.zip_path), before)
+
+    def test_current_inputs_reasons(self) -> None:
+        name = self.zip_path.name
+        with ResultStore(self.root / "store.sqlite") as store:
+            store.record_inputs([_input_record(self.prepared)])
+            manifest = store.manifest()
+        self.assertEqual(manifest[name][3], EXTRACTOR_VERSION)
+
+        current, reasons, _ = _current_inputs([self.prepared], manifest, {name})
+        self.assertEqual((current, reasons), ({name}, {}))
+
+        _, reasons, _ = _current_inputs([self.prepared], manifest, set())
+        self.assertEqual(reasons, {"novo": 1})
+
+        _, reasons, _ = _current_inputs([self.prepared], manifest, {name}, version="outra")
+        self.assertEqual(reasons, {"versão do extrator": 1})
+
+        os.utime(self.zip_path, ns=(1, 1))
+        current, reasons, refreshed = _current_inputs([self.prepared], manifest, {name})
+        self.assertEqual(current, {name})
+        self.assertEqual(refreshed[0][2], 1)
+
+        with ZipFile(self.zip_path, "a") as zf:
+            zf.writestr("novo.txt", "Documento novo")
+        _, reasons, _ = _current_inputs([self.prepared], manifest, {name})
+        self.assertEqual(reasons, {"alterado": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
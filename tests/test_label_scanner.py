@@ -0,0 +1,44 @@
+import unittest
+
+from seiautomation.offline.extract_reports import (
+    FATOR_LABELS,
+    PERITO_LABELS,
+    TextView,
+    _line_hit,
+    _line_value,
+    _prepare_lines,
+    extract_from_text,
+)
+
+
+class LabelScannerTests(unittest.TestCase):
+    TEXT = (
+        "Fator mencionado sem dois pontos\n"
+        "  Perito: Fulano de Tal – Engenheiro\n"
+        "Observação: fator: 1,5\n"
+        "Fator: 2,0 - revisar\n"
+    )
+
+    def test_hit_matches_line_value_and_points_to_value(self) -> None:
+        view = TextView(self.TEXT)
+        for labels in (PERITO_LABELS, FATOR_LABELS):
+            hit = _line_hit(view, labels)
+            self.assertEqual(hit.value, _line_value(_prepare_lines(self.TEXT), labels))
+            self.assertEqual(self.TEXT[hit.start : hit.end], hit.value)
+        self.assertEqual(_line_hit(view, FATOR_LABELS).value, "2,0")
+
+    def test_unregistered_group_falls_back_to_plain_scan(self) -> None:
+        view = TextView(self.TEXT)
+        self.assertEqual(_line_value(view, ("observação",)), "fator: 1,5")
+        self.assertIsNone(_line_hit(view, ("inexistente",)))
+
+    def test_set_field_reuses_scanner_span(self) -> None:
+        text = "Índice 2,0 citado antes.\nFator: 2,0\n"
+        res = extract_from_text(text, text, "despacho.html")
+        meta = res.meta["Fator"]
+        self.assertEqual(meta["start"], text.index("Fator: 2,0") + len("Fator: "))
+        self.assertEqual(text[meta["start"] : meta["end"]], "2,0")
+
+
+if __name__ == "__main__":
+    unittest.main()
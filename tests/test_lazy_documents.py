@@ -0,0 +1,50 @@
+import tempfile
+import unittest
+from pathlib import Path
+from zipfile import ZipFile
+
+from preprocessamento.documents import LazyDocument, gather_documents, gather_texts
+from seiautomation.offline.doc_classifier import DocumentBucket
+from tests.helpers import isolate_caches
+
+
+class LazyDocumentTests(unittest.TestCase):
+    def setUp(self) -> None:
+        isolate_caches(self)
+
+    def test_loader_runs_only_on_text_access(self) -> None:
+        calls = []
+
+        def _load() -> str:
+            calls.append(1)
+            return "Laudo pericial completo"
+
+        doc = LazyDocument("laudo.pdf", DocumentBucket.LAUDO, preview="Laudo", size=100, loader=_load)
+        self.assertFalse(doc.loaded)
+        self.assertEqual(calls, [])
+        self.assertEqual(doc.text, "Laudo pericial completo")
+        self.assertEqual(doc.text, "Laudo pericial completo")
+        self.assertEqual(len(calls), 1)
+
+    def test_failed_loader_yields_empty_text(self) -> None:
+        def _load() -> str:
+            raise ValueError("pdf quebrado")
+
+        doc = LazyDocument("quebrado.pdf", DocumentBucket.OUTRO, loader=_load)
+        self.assertEqual(doc.text, "")
+
+    def test_gather_texts_matches_documents(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            zip_path = Path(tmp) / "processo.zip"
+            with ZipFile(zip_path, "w") as zf:
+                zf.writestr("despacho.html", "<p>Assunto: Autorização de pagamento de honorários</p>")
+                zf.writestr("nota.txt", "Documento genérico")
+            docs, _ = gather_documents(zip_path)
+            sources, _ = gather_texts(zip_path)
+        self.assertEqual([doc.name for doc in docs], ["despacho.html", "nota.txt"])
+        self.assertEqual([src["name"] for src in sources], ["despacho.html", "nota.txt"])
+        self.assertEqual(docs[0].bucket, DocumentBucket.PRINCIPAL)
+
+
+if __name__ == "__main__":
+    unittest.main()
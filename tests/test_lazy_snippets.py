@@ -0,0 +1,42 @@
+import pickle
+import unittest
+
+from seiautomation.offline.extract_reports import (
+    SNIPPETS_CHOSEN,
+    SNIPPETS_NONE,
+    _materialize_snippets,
+    extract_from_text,
+)
+
+TEXT = "Despacho\nJuízo: 1ª Vara Cível da Comarca de Patos\nSaldo a receber: R$ 1.500,00\n"
+
+
+class LazySnippetTests(unittest.TestCase):
+    def test_snippet_is_resolved_on_demand(self) -> None:
+        res = extract_from_text(TEXT, TEXT, "despacho.html")
+        cand = res.meta["SALDO A RECEBER"]
+        self.assertIsNone(cand["snippet"])
+        _materialize_snippets(res)
+        self.assertIn("Saldo a receber: R$ 1.500,00", cand["snippet"])
+        self.assertEqual(TEXT[cand["start"] : cand["end"]], "R$ 1.500,00")
+        self.assertNotIn("_ctx", cand)
+
+    def test_chosen_mode_skips_other_candidates(self) -> None:
+        res = extract_from_text(TEXT, TEXT, "despacho.html")
+        res.update_from(extract_from_text(TEXT, TEXT, "copia.html"), "copia.html")
+        _materialize_snippets(res, SNIPPETS_CHOSEN)
+        entries = res.candidates["SALDO A RECEBER"]
+        self.assertTrue(res.meta["SALDO A RECEBER"]["snippet"])
+        self.assertEqual([entry["snippet"] is None for entry in entries], [False, True])
+
+    def test_none_mode_and_pickle_drop_text_references(self) -> None:
+        res = extract_from_text(TEXT, TEXT, "despacho.html")
+        clone = pickle.loads(pickle.dumps(res))
+        self.assertTrue(clone.meta["SALDO A RECEBER"]["snippet"])
+        other = extract_from_text(TEXT, TEXT, "despacho.html")
+        _materialize_snippets(other, SNIPPETS_NONE)
+        self.assertTrue(all("_ctx" not in entry for entries in other.candidates.values() for entry in entries))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from preprocessamento import documents
+from preprocessamento.documents import _extract_pdf_pages, configure_page_split
+from tests.helpers import make_pdf, preserve_env
+
+
+def _crash_worker(path: str, start: int, stop: int) -> list[str]:
+    """Substitui ``_extract_pdf_range`` no auxiliar: derruba o processo."""
+    os._exit(1)
+
+
+class PageSplitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        preserve_env(self, "SEI_PDF_SPLIT_PAGES", "SEI_PDF_PAGE_WORKERS")
+
+        def _shutdown_pool() -> None:
+            if documents._PAGE_EXECUTOR is not None:
+                documents._PAGE_EXECUTOR.shutdown()
+                documents._PAGE_EXECUTOR = None
+
+        self.addCleanup(_shutdown_pool)
+
+    def test_split_matches_serial_extraction(self) -> None:
+        raw = make_pdf([f"Pagina {index}" for index in range(1, 6)])
+        configure_page_split(0)
+        serial = _extract_pdf_pages(raw)
+
+        configure_page_split(3, workers=2)
+        with mock.patch.object(documents, "PAGE_CHUNK", 2):
+            split = _extract_pdf_pages(raw)
+
+        self.assertEqual(split, serial)
+        self.assertEqual(split[4], "Pagina 5")
+        self.assertIsNotNone(documents._PAGE_EXECUTOR)
+
+    def test_small_pdf_stays_in_process(self) -> None:
+        configure_page_split(10, workers=2)
+        self.assertEqual(_extract_pdf_pages(make_pdf(["Unica"])), ["Unica"])
+        self.assertIsNone(documents._PAGE_EXECUTOR)
+
+    def test_broken_pool_falls_back_to_serial(self) -> None:
+        raw = make_pdf([f"Pagina {index}" for index in range(1, 5)])
+        configure_page_split(2, workers=2)
+        with mock.patch.object(documents, "PAGE_CHUNK", 2), mock.patch.object(
+            documents, "_extract_pdf_range", _crash_worker
+        ):
+            pages = _extract_pdf_pages(raw)
+
+        self.assertEqual(pages, [f"Pagina {index}" for index in range(1, 5)])
+        self.assertIsNone(documents._PAGE_EXECUTOR)
+        configure_page_split(2, workers=1)
+        self.assertEqual(_extract_pdf_pages(raw), pages)  # pool novo
+
+    def test_interrupt_cancels_pending_ranges(self) -> None:
+        first, pending = Future(), [Future() for _ in range(2)]
+        first.set_exception(KeyboardInterrupt())
+        executor = mock.Mock()
+        executor.submit.side_effect = [first, *pending]
+        configure_page_split(2)
+        with mock.patch.object(documents, "PAGE_CHUNK", 2), mock.patch.object(
+            documents, "_page_executor", return_value=executor
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                _extract_pdf_pages(make_pdf([f"Pagina {index}" for index in range(1, 7)]))
+
+        self.assertTrue(all(future.cancelled() for future in pending))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import random
+import time
+import unittest
+from unittest import mock
+
+from seiautomation.offline import extract_reports
+from seiautomation.offline.extract_reports import (
+    PARTES_REGEX,
+    ExtractionResult,
+    _regex_guard,
+    _result_to_audit_entry,
+    _search_partes,
+    configure_regex_budget,
+    extract_from_text,
+)
+
+PIECES = [
+    "Ação movida por Fulano de Tal, CPF 123.456.789-09, ",
+    "proposta por MARIA DA SILVA CNPJ 12.345.678/0001-90 ",
+    "promovido por João",
+    "Promovida por Ana em face de ",
+    " em face do Estado da Paraíba, ",
+    "em face de Município de Patos\n",
+    "em desfavor da União",
+    "movido por\n",
+    "Juízo da 1ª Vara",
+    ", ",
+    "\n",
+    " texto do laudo pericial ",
+]
+
+
+class PartesWindowTests(unittest.TestCase):
+    def setUp(self) -> None:
+        previous = os.environ.get("SEI_REGEX_BUDGET_MS")
+        self.addCleanup(
+            lambda: os.environ.pop("SEI_REGEX_BUDGET_MS", None)
+            if previous is None
+            else os.environ.__setitem__("SEI_REGEX_BUDGET_MS", previous)
+        )
+
+    def test_matches_unbounded_regex_inside_window(self) -> None:
+        rng = random.Random(25)
+        for _ in range(1500):
+            text = "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 30)))
+            expected = PARTES_REGEX.search(text)
+            found = _search_partes(text)
+            with self.subTest(text=text):
+                self.assertEqual(found and found.span(), expected and expected.span())
+                if expected:
+                    self.assertEqual(found.groupdict(), expected.groupdict())
+
+    def test_window_limits_long_documents(self) -> None:
+        filler = "movido por Fulano, sem contraparte. " * 2000
+        text = filler + "x" * 5000 + " movido por Beltrano, em face de Estado da Paraíba\n"
+        started = time.perf_counter()
+        match = _search_partes(text)
+        self.assertLess(time.perf_counter() - started, 2.0)
+        self.assertEqual(match.group("promovente"), "Beltrano")
+        self.assertEqual(match.group("promovido"), "Estado da Paraíba")
+        # a contraparte além da janela não é procurada
+        self.assertIsNone(_search_partes("movido por Fulano, " + "y" * 3000 + " em face de Estado"))
+
+    def test_guard_reports_slow_patterns(self) -> None:
+        configure_regex_budget(1)
+        result = ExtractionResult()
+        with mock.patch.object(extract_reports.time, "perf_counter", side_effect=[0.0, 0.5]):
+            with self.assertLogs("extract_reports", level="WARNING"):
+                with _regex_guard(result, "PARTES_REGEX", "laudo.pdf"):
+                    pass
+        self.assertEqual(result.regex_slow, [{"pattern": "PARTES_REGEX", "document": "laudo.pdf", "ms": 500.0}])
+        self.assertNotIn("_regex_slow", result.meta)
+        self.assertEqual(_result_to_audit_entry("p.zip", result, "r")["regex_slow"], result.regex_slow)
+
+        configure_regex_budget(0)
+        quiet = extract_from_text("Ação movida por Fulano, em face de Estado da Paraíba", "", "despacho.html")
+        self.assertEqual(quiet.regex_slow, [])
+        self.assertNotIn("regex_slow", _result_to_audit_entry("p.zip", quiet, "r"))
+
+
+if __name__ == "__main__":
+    unittest.main()
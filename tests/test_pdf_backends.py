@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
+
+from preprocessamento import documents
+from preprocessamento.documents import (
+    _PDF_EXTRACTORS,
+    _backend_for,
+    available_pdf_backends,
+    configure_bucket_backends,
+    gather_documents,
+    set_pdf_backend,
+)
+from seiautomation.offline.doc_classifier import DocumentBucket
+from tests.helpers import isolate_caches, make_pdf, preserve_env
+
+
+class PdfBackendTests(unittest.TestCase):
+    def setUp(self) -> None:
+        preserve_env(self, "SEI_PDF_BUCKET_BACKENDS")
+        isolate_caches(self)
+
+    def test_backends_keep_lines_and_pages(self) -> None:
+        raw = make_pdf(["Laudo pericial\nProcesso 000219-17.2025.8.15", "Perito: Maria Souza"])
+        for backend in set(available_pdf_backends()) & {"pdfplumber", "pdfminer", "pdfium"}:
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    _PDF_EXTRACTORS[backend](raw),
+                    ["Laudo pericial\nProcesso 000219-17.2025.8.15", "Perito: Maria Souza"],
+                )
+                self.assertEqual(_PDF_EXTRACTORS[backend](raw, limit=1), ["Laudo pericial\nProcesso 000219-17.2025.8.15"])
+
+    def test_lazy_member_uses_bucket_backend(self) -> None:
+        configure_bucket_backends("laudo=pdfminer")
+        calls = []
+        original = _PDF_EXTRACTORS["pdfminer"]
+
+        def _counting(raw, limit=None):
+            calls.append(limit)
+            return original(raw, limit)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            zip_path = Path(tmp) / "processo.zip"
+            with ZipFile(zip_path, "w") as zf:
+                zf.writestr("laudo_pericial.pdf", make_pdf(["Laudo pericial", "Conclusao"]))
+                zf.writestr("nota.txt", "Documento genérico")
+            with mock.patch.dict(_PDF_EXTRACTORS, {"pdfminer": _counting}):
+                docs, _ = gather_documents(zip_path)
+                [laudo] = [doc for doc in docs if doc.name == "laudo_pericial.pdf"]
+                self.assertEqual(laudo.bucket, DocumentBucket.LAUDO)
+                self.assertEqual(calls, [])  # a prévia sai do backend do processo
+                self.assertEqual(laudo.text, "Laudo pericial\nConclusao")
+        self.assertEqual(calls, [None])
+
+    def test_process_backend_overrides_bucket_map(self) -> None:
+        configure_bucket_backends("outro=pdfminer")
+        self.assertEqual(_backend_for(DocumentBucket.OUTRO), "pdfminer")
+        self.assertEqual(_backend_for(DocumentBucket.PRINCIPAL), "pdfplumber")
+        previous = set_pdf_backend("pdfium")
+        try:
+            self.assertEqual(_backend_for(DocumentBucket.OUTRO), "pdfium")
+        finally:
+            set_pdf_backend(previous)
+        self.assertEqual(documents._cache_kind("pdf", "pdfminer"), "pdf:pdfminer")
+
+    def test_invalid_spec_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            configure_bucket_backends("laudo=acrobat")
+        with self.assertRaises(ValueError):
+            configure_bucket_backends("anexo=pdfium")
+
+
+if __name__ == "__main__":
+    unittest.main()
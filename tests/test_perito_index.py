@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from seiautomation.offline import extract_reports
+from seiautomation.offline.extract_reports import ExtractionResult, _perito_index, _scrub_perito_conflicts
+
+
+class PeritoIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self._tmp.name) / "peritos.csv"
+        self.csv_path.write_text("PERITO,CPF/CNPJ\nJosé da Silva,123.456.789-09\n", encoding="utf-8")
+        patcher = mock.patch.object(extract_reports, "_PERITO_CATALOG_PATH", self.csv_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+        extract_reports._PERITO_INDEX = None
+
+    def test_scrub_uses_catalog(self) -> None:
+        result = ExtractionResult(data={"PERITO": "JOSE DA SILVA", "PROMOVIDO": "José da Silva", "CPF/CNPJ": ""})
+        _scrub_perito_conflicts(result)
+        self.assertEqual(result.data["CPF/CNPJ"], "123.456.789-09")
+        self.assertEqual(result.data["PROMOVIDO"], "")
+
+    def test_index_is_reused_until_catalog_changes(self) -> None:
+        first = _perito_index()
+        self.assertIs(_perito_index(), first)
+        self.csv_path.write_text("PERITO,CPF/CNPJ\nMaria Souza,987.654.321-00\n", encoding="utf-8")
+        stat = self.csv_path.stat()
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, first.mtime_ns + 1_000_000_000))
+        second = _perito_index()
+        self.assertIsNot(second, first)
+        self.assertIn("maria souza", second.names)
+        self.assertNotIn("jose da silva", second.names)
+
+
+if __name__ == "__main__":
+    unittest.main()
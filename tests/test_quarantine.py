@@ -0,0 +1,129 @@
+import json
+import os
+import signal
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
+
+from preprocessamento.documents import _cache_kind, set_pdf_backend
+from seiautomation.offline import extract_reports
+from seiautomation.offline.extract_reports import (
+    _BudgetExpired,
+    _StartLog,
+    _announce_start,
+    _describe_failure,
+    _make_executor,
+    _pool_context,
+    _run_isolated,
+    _time_budget,
+)
+
+
+def _fake_task(zip_name: str, seconds: float, *_args):
+    """Substitui process_and_save_parquet: avisa o início, dorme e devolve os instantes."""
+    _announce_start(zip_name)
+    started = time.time()
+    time.sleep(seconds)
+    return zip_name, "ok", {"start": started, "end": time.time()}
+
+
+_REAL_PROCESS_ZIP = extract_reports.process_zip
+
+
+def _crashing_process_zip(path, **kwargs):
+    if path.name == "crash.zip":
+        time.sleep(0.5)  # deixa os outros ZIPs na fila do pool
+        os._exit(1)
+    return _REAL_PROCESS_ZIP(path, **kwargs)
+
+
+class QuarantineTests(unittest.TestCase):
+    @unittest.skipUnless(hasattr(signal, "SIGALRM"), "requer SIGALRM")
+    def test_time_budget_escapes_generic_handlers(self) -> None:
+        with self.assertRaises(_BudgetExpired):
+            with _time_budget(0.05):
+                try:
+                    time.sleep(2)
+                except Exception:  # a extração engole Exception; o alarme não pode ser engolido
+                    self.fail("alarme capturado como Exception")
+
+    def test_isolated_failure_is_reported_not_raised(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            task = ("ausente.zip", str(Path(tmp) / "ausente.zip"), str(Path(tmp) / "parquet"))
+            outcomes = _run_isolated([task], timeout=0)
+        self.assertIsInstance(outcomes["ausente.zip"], BaseException)
+        self.assertTrue(_describe_failure(outcomes["ausente.zip"]))
+
+    def test_start_log_lists_only_started_tasks(self) -> None:
+        start_log = _StartLog(_pool_context())
+        self.addCleanup(start_log.close)
+        with _make_executor(1, start_log=start_log) as executor:
+            first = executor.submit(_fake_task, "a.zip", 0.5)
+            queued = [executor.submit(_fake_task, name, 0) for name in ("b.zip", "c.zip", "d.zip")]
+            time.sleep(0.3)
+            self.assertEqual(set(start_log.drain()), {"a.zip"})
+            first.result()
+            for future in queued:
+                future.result()
+        self.assertEqual(set(start_log.drain()), {"a.zip", "b.zip", "c.zip", "d.zip"})
+
+    def test_isolated_tasks_run_in_parallel_and_overdue_is_killed(self) -> None:
+        tasks = [("a.zip", 0.5), ("b.zip", 0.5), ("lento.zip", 60)]
+        with mock.patch.object(extract_reports, "process_and_save_parquet", _fake_task), mock.patch.object(
+            extract_reports, "_STALL_GRACE_SECONDS", 0
+        ):
+            started = time.monotonic()
+            outcomes = _run_isolated(tasks, timeout=2, parallel=3)
+        self.assertLess(time.monotonic() - started, 20)
+        self.assertIsInstance(outcomes["lento.zip"], extract_reports.ZipTimeoutError)
+        timings = [outcomes[name][2] for name in ("a.zip", "b.zip")]
+        self.assertLess(max(t["start"] for t in timings), min(t["end"] for t in timings))
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "depende de fork (o patch chega aos workers)")
+    def test_pool_crash_resubmits_tasks_that_did_not_start(self) -> None:
+        previous_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            zip_dir = root / "zips"
+            zip_dir.mkdir()
+            for name, padding in (("crash.zip", 4000), ("b.zip", 10), ("c.zip", 0)):
+                with ZipFile(zip_dir / name, "w") as zf:
+                    zf.writestr("despacho.html", "<p>Processo nº 0801234-56.2024.8.15.0001</p>" + "x" * padding)
+            argv = [
+                "extract_reports", "--zip-dir", str(zip_dir), "--output", str(root / "r.xlsx"), "--workers", "1",
+                "--max-in-flight", "3", "--max-tasks-per-child", "0", "--run-id", "crash", "--no-log-cleanup",
+            ]
+            os.chdir(tmp)
+            self.addCleanup(os.chdir, previous_cwd)
+            with mock.patch.object(sys, "argv", argv), mock.patch.dict(
+                os.environ, {"SEI_TEXT_CACHE": "off", "SEI_EXTRACT_MEMO": "off"}
+            ), mock.patch.object(extract_reports, "LOG_DIR", root / "logs"), mock.patch.object(
+                extract_reports, "process_zip", _crashing_process_zip
+            ), mock.patch.object(
+                extract_reports, "_run_isolated", wraps=extract_reports._run_isolated
+            ) as isolated, mock.patch("builtins.print"):
+                extract_reports.main()
+            state = json.loads((root / "logs" / "crash.state.json").read_text("utf-8"))
+        # só o ZIP que estava rodando vai para o isolamento; os da fila voltam para o pool novo
+        self.assertEqual([task[0] for task in isolated.call_args.args[0]], ["crash.zip"])
+        self.assertEqual(set(state["quarantine"]), {"crash.zip"})
+        self.assertEqual(set(state["processed_files"]), {"b.zip", "c.zip"})
+
+    def test_degraded_backend_uses_separate_cache_kind(self) -> None:
+        self.assertEqual(_cache_kind("pdf"), "pdf")
+        previous = set_pdf_backend("pdfium")
+        try:
+            self.assertEqual(_cache_kind("pdf"), "pdf:pdfium")
+            self.assertEqual(_cache_kind("html"), "html")
+        finally:
+            set_pdf_backend(previous)
+        with self.assertRaises(ValueError):
+            set_pdf_backend("inexistente")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
+
+from seiautomation.offline import extract_reports
+from seiautomation.offline.extract_reports import _collection_from_replay, _finish_zip, process_zip
+from seiautomation.offline.result_store import ReplayStore
+from tests.helpers import isolate_caches
+
+DESPACHO = (
+    "<p>Processo nº 000219-17.2025.8.15</p>"
+    "<p>Processo nº 0801234-56.2024.8.15.0001</p>"
+    "<p>Juízo: 2ª Vara Cível da Comarca de Campina Grande</p>"
+    "<p>Promovente: Fulano de Tal</p><p>Promovido: Banco XYZ S.A.</p>"
+    "<p>Perito: Maria Souza, CPF 123.456.789-09, Especialidade: Grafotécnica</p>"
+    "<p>Valor arbitrado: R$ 1.200,00</p>"
+)
+
+
+class ReplayTests(unittest.TestCase):
+    def setUp(self) -> None:
+        isolate_caches(self)
+
+    def test_replay_matches_direct_consolidation(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            zip_path = Path(tmp) / "000219_17_2025_8_15_SEI_000219_17.2025.8.15.zip"
+            with ZipFile(zip_path, "w") as zf:
+                zf.writestr("despacho.html", DESPACHO)
+                zf.writestr("nota.txt", "Documento genérico")
+            with ReplayStore(Path(tmp) / "run.replay.sqlite") as store:
+                direct = process_zip(zip_path, replay_store=store)
+                [(name, payload)] = list(store.items())
+
+        self.assertEqual(name, zip_path.name)
+        self.assertTrue(direct.data.get("PROCESSO Nº"))
+        replayed = _finish_zip(_collection_from_replay(payload))
+        self.assertEqual(replayed.data, direct.data)
+        self.assertEqual(replayed.observations, direct.observations)
+        self.assertEqual(replayed.sources, direct.sources)
+        self.assertEqual(replayed.meta["_documents"], direct.meta["_documents"])
+
+    def test_slow_regexes_do_not_drop_zip_from_replay(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            zip_path = Path(tmp) / "000219_17_2025_8_15_SEI_000219_17.2025.8.15.zip"
+            with ZipFile(zip_path, "w") as zf:
+                zf.writestr("despacho.html", DESPACHO)
+            with mock.patch.dict(os.environ, {"SEI_REGEX_BUDGET_MS": "0.000001"}), self.assertLogs(
+                "extract_reports", level="WARNING"
+            ):
+                with ReplayStore(Path(tmp) / "run.replay.sqlite") as store:
+                    direct = process_zip(zip_path, replay_store=store)
+                    self.assertEqual(store.count(), 1)
+                    [(_name, payload)] = list(store.items())
+
+        self.assertTrue(direct.regex_slow)
+        replayed = _finish_zip(_collection_from_replay(payload))
+        self.assertEqual(replayed.data, direct.data)
+        self.assertEqual(replayed.sources, direct.sources)
+
+    def test_replay_store_is_opt_in(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            zip_dir = root / "zips"
+            zip_dir.mkdir()
+            with ZipFile(zip_dir / "000219_17_2025_8_15_SEI_000219_17.2025.8.15.zip", "w") as zf:
+                zf.writestr("despacho.html", DESPACHO)
+            base = ["extract_reports", "--zip-dir", str(zip_dir), "--workers", "1", "--no-log-cleanup"]
+            with mock.patch.object(extract_reports, "LOG_DIR", root / "logs"), mock.patch("builtins.print"):
+                for run_id, extra in (("padrao", []), ("gravado", ["--replay-store"])):
+                    argv = [*base, "--output", str(root / f"{run_id}.xlsx"), "--run-id", run_id, *extra]
+                    with mock.patch.object(sys, "argv", argv):
+                        extract_reports.main()
+                replay_argv = ["extract_reports", "--replay", "gravado", "--output", str(root / "novo.xlsx")]
+                with mock.patch.object(sys, "argv", replay_argv):
+                    extract_reports.main()
+                self.assertFalse((root / "logs" / "padrao.replay.sqlite").exists())
+                self.assertTrue((root / "logs" / "gravado.replay.sqlite").exists())
+                self.assertTrue((root / "novo.xlsx").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
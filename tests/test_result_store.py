@@ -0,0 +1,73 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from zipfile import ZipFile
+
+import pandas as pd
+
+from seiautomation.offline.extract_reports import COLUMNS, process_and_save_parquet
+from seiautomation.offline.result_store import ResultStore
+from tests.helpers import isolate_caches
+
+# parquet depende de pyarrow/fastparquet
+HAS_PARQUET = any(importlib.util.find_spec(mod) for mod in ("pyarrow", "fastparquet"))
+
+
+@unittest.skipUnless(HAS_PARQUET, "engine de parquet indisponível")
+class ResultStoreTests(unittest.TestCase):
+    def _write(self, parquet_dir: Path, name: str, value: str) -> Path:
+        path = parquet_dir / f"{name}.parquet"
+        pd.DataFrame([{"ARQUIVO_ORIGEM": name, "PERITO": value}]).to_parquet(path, index=False)
+        return path
+
+    def test_checkpoint_sync_only_reads_given_names(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdir = Path(tmp)
+            self._write(pdir, "b.zip", "Beltrano")
+            self._write(pdir, "a.zip", "Fulano")
+            with ResultStore.for_parquet_dir(pdir) as store:
+                self.assertEqual(store.sync_parquets(pdir, ["b.zip"]), [])
+                self.assertEqual(store.count(), 1)
+                store.sync_parquets(pdir)
+                df = store.to_dataframe()
+        self.assertEqual(list(df["ARQUIVO_ORIGEM"]), ["a.zip", "b.zip"])
+
+    def test_full_sync_tracks_changes_and_removals(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdir = Path(tmp)
+            self._write(pdir, "a.zip", "Fulano")
+            gone = self._write(pdir, "b.zip", "Beltrano")
+            (pdir / "c.zip.parquet").write_bytes(b"corrompido")
+            with ResultStore.for_parquet_dir(pdir) as store:
+                bad = store.sync_parquets(pdir)
+                path = self._write(pdir, "a.zip", "Ciclano")
+                os.utime(path, ns=(1, 1))
+                gone.unlink()
+                store.sync_parquets(pdir)
+                df = store.to_dataframe()
+        self.assertEqual([p.name for p in bad], ["c.zip.parquet"])
+        self.assertEqual(list(df["PERITO"]), ["Ciclano"])
+
+    def test_extracted_rows_are_plain_strings(self) -> None:
+        isolate_caches(self)
+        with tempfile.TemporaryDirectory() as tmp:
+            pdir = Path(tmp) / "parquet"
+            zip_path = Path(tmp) / "000219_17_2025_8_15_SEI_000219_17.2025.8.15.zip"
+            with ZipFile(zip_path, "w") as zf:
+                zf.writestr(
+                    "despacho.html",
+                    "<p>Processo nº 0801234-56.2024.8.15.0001</p><p>Valor arbitrado: R$ 1.200,00</p>"
+                    "<p>Data: 27 de maio de 2025</p>",
+                )
+            process_and_save_parquet(zip_path.name, str(zip_path), str(pdir))
+            with ResultStore.for_parquet_dir(pdir) as store:
+                store.sync_parquets(pdir)
+                df = store.to_dataframe()
+        self.assertEqual(list(df.columns), COLUMNS)
+        self.assertTrue(all(isinstance(value, str) for value in df.iloc[0]), df.iloc[0].map(type).to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
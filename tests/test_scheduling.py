@@ -0,0 +1,27 @@
+import sys
+import unittest
+from pathlib import Path
+
+from preprocessamento.inputs import PreparedInput
+from seiautomation.offline.extract_reports import _make_executor, _schedule_largest_first
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+class SchedulingTests(unittest.TestCase):
+    def test_largest_first_keeps_name_order_on_ties(self) -> None:
+        inputs = [PreparedInput(Path(name), Path(name), "zip") for name in ["a.zip", "b.zip", "c.zip", "d.zip"]]
+        sizes = {"a.zip": 10, "b.zip": 300, "c.zip": 10, "d.zip": 50}
+        ordered = _schedule_largest_first(inputs, sizes)
+        self.assertEqual([p.original.name for p in ordered], ["b.zip", "d.zip", "a.zip", "c.zip"])
+
+    @unittest.skipIf(sys.version_info < (3, 11), "max_tasks_per_child requer Python 3.11+")
+    def test_recycled_pool_runs_tasks(self) -> None:
+        with _make_executor(1, max_tasks_per_child=1) as executor:
+            self.assertEqual(list(executor.map(_square, [2, 3])), [4, 9])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from zipfile import ZipFile
+
+from preprocessamento import documents
+from preprocessamento.text_cache import TextCache, cache_key, configure_text_cache
+
+
+class TextCacheTests(unittest.TestCase):
+    def test_put_get_roundtrip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = TextCache(Path(tmp) / "textos.sqlite")
+            key = cache_key(0x1234, 10, "laudo.pdf", "pdf")
+            cache.put(key, name="laudo.pdf", crc=0x1234, size=10, kind="pdf", pages=["pág 1", "pág 2"], bucket="laudo")
+            cached = cache.get(key)
+            cache.close()
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.pages, ["pág 1", "pág 2"])
+        self.assertTrue(cached.complete)
+        self.assertEqual(cached.bucket, "laudo")
+        self.assertEqual(cached.text, "pág 1\npág 2")
+
+    def test_evict_removes_oldest_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = TextCache(Path(tmp) / "textos.sqlite", max_bytes=1)
+            for idx in range(3):
+                cache.put(f"k{idx}", name=f"{idx}.txt", crc=idx, size=1, kind="txt", pages=["x" * 50])
+            removed = cache.evict()
+            remaining = [cache.get(f"k{idx}") is not None for idx in range(3)]
+            cache.close()
+        self.assertEqual(removed, 3)
+        self.assertEqual(remaining, [False, False, False])
+
+    def test_member_text_is_served_from_cache(self) -> None:
+        previous = os.environ.get("SEI_TEXT_CACHE")
+        with tempfile.TemporaryDirectory() as tmp:
+            configure_text_cache(Path(tmp) / "textos.sqlite")
+            try:
+                zip_path = Path(tmp) / "processo.zip"
+                with ZipFile(zip_path, "w") as zf:
+                    zf.writestr("nota.txt", "Documento genérico")
+                with ZipFile(zip_path) as zf:
+                    info = zf.getinfo("nota.txt")
+                    self.assertEqual(documents.read_member_text(zf, info), "Documento genérico")
+                    original = documents._convert_member
+                    documents._convert_member = lambda kind, data: self.fail("deveria usar o cache")
+                    try:
+                        self.assertEqual(documents.read_member_text(zf, info), "Documento genérico")
+                    finally:
+                        documents._convert_member = original
+            finally:
+                configure_text_cache(Path(previous) if previous and previous != "off" else None)
+                if previous is None:
+                    os.environ.pop("SEI_TEXT_CACHE", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from seiautomation.offline.extract_reports import DocumentText, TextView, _locate_value, _prepare_lines
+
+
+class TextViewTests(unittest.TestCase):
+    SAMPLE = "  Perito: Fulano de Tal \r\n\n\tCPF: 123.456.789-09\x0cVALOR: R$ 1.000,00  fim"
+
+    def test_lines_match_prepare_lines(self) -> None:
+        view = TextView(self.SAMPLE)
+        self.assertEqual(view.lines, _prepare_lines(self.SAMPLE))
+        self.assertEqual(view.lower, self.SAMPLE.lower())
+
+    def test_line_offsets_point_to_stripped_lines(self) -> None:
+        view = TextView(self.SAMPLE)
+        for line, offset in zip(view.lines, view.line_offsets):
+            self.assertEqual(self.SAMPLE[offset : offset + len(line)], line)
+
+    def test_document_view_is_cached(self) -> None:
+        doc = DocumentText(name="laudo.pdf", text="Laudo Pericial")
+        self.assertIs(doc.view, doc.view)
+        self.assertEqual(_locate_value(doc.view, "pericial"), (6, 14))
+        self.assertFalse(TextView(""))
+
+
+if __name__ == "__main__":
+    unittest.main()